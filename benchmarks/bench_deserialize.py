@@ -0,0 +1,83 @@
+"""Benchmark `ApiClient.deserialize` on a `V1PodList`.
+
+Compares the compiled decoders with the previous reflective implementation
+(kept below as a reference) and checks that both give the same objects.
+
+    python benchmarks/bench_deserialize.py [number of pods]
+"""
+
+import os
+import re
+import sys
+import json
+import timeit
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from six import iteritems
+
+from kubernetes_spawner.swagger_client import ApiClient, models
+from fixtures import pod_list_json, FakeResponse
+
+
+def reflective_deserialize(data, klass):
+    """`ApiClient.__deserialize` before the decoders were compiled"""
+    if data is None:
+        return None
+
+    if type(klass) == str:
+        if klass.startswith('list['):
+            sub_kls = re.match('list\[(.*)\]', klass).group(1)
+            return [reflective_deserialize(sub_data, sub_kls) for sub_data in data]
+
+        if klass.startswith('dict('):
+            sub_kls = re.match('dict\(([^,]*), (.*)\)', klass).group(2)
+            return {k: reflective_deserialize(v, sub_kls) for k, v in iteritems(data)}
+
+        if klass in ['int', 'float', 'str', 'bool', "date", 'datetime', "object"]:
+            klass = eval(klass)
+        else:
+            klass = getattr(models, klass)
+
+    if klass in [int, float, str, bool]:
+        try:
+            return klass(data)
+        except TypeError:
+            return data
+    elif klass in (object, date, datetime):
+        # no model of the API uses date or datetime
+        return data
+    else:
+        instance = klass()
+        for attr, attr_type in iteritems(instance.swagger_types):
+            if data is not None \
+               and instance.attribute_map[attr] in data \
+               and isinstance(data, (list, dict)):
+                value = data[instance.attribute_map[attr]]
+                setattr(instance, attr, reflective_deserialize(value, attr_type))
+        return instance
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    response = FakeResponse(pod_list_json(count))
+    client = ApiClient("http://localhost")
+
+    compiled = client.deserialize(response, "V1PodList")
+    reference = reflective_deserialize(json.loads(response.data), "V1PodList")
+    assert compiled.to_dict() == reference.to_dict(), "compiled decoders differ from the reference"
+
+    number = 5
+    t_reference = min(timeit.repeat(lambda: reflective_deserialize(json.loads(response.data), "V1PodList"),
+                                    number=number, repeat=3)) / number
+    t_compiled = min(timeit.repeat(lambda: client.deserialize(response, "V1PodList"),
+                                   number=number, repeat=3)) / number
+
+    print("V1PodList with {} pods ({} KB of JSON)".format(count, len(response.data) // 1024))
+    print("  reflective: {:8.2f} ms".format(t_reference * 1000))
+    print("  compiled:   {:8.2f} ms  ({:.1f}x)".format(t_compiled * 1000, t_reference / t_compiled))
+
+
+if __name__ == "__main__":
+    main()
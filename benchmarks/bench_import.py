@@ -0,0 +1,49 @@
+"""Benchmark the import time and memory of the spawner modules.
+
+    python benchmarks/bench_import.py [repeat]
+
+Each import runs in a fresh interpreter. The third party modules the
+spawner depends on (jupyterhub, tornado, ...) are imported before the
+timer starts so only the cost of this package is measured.
+"""
+
+import os
+import sys
+import json
+import subprocess
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCRIPT = """
+import sys, time, tracemalloc, json
+import jupyterhub.spawner, traitlets, escapism, urllib3, tornado.gen, concurrent.futures
+tracemalloc.start()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+size = tracemalloc.get_traced_memory()[0]
+models = [m for m in sys.modules if m.startswith("kubernetes_spawner.swagger_client.models.")]
+print(json.dumps([elapsed, size, len(models)]))
+"""
+
+MODULES = ["kubernetes_spawner.swagger_client", "kubernetes_spawner"]
+
+
+def measure(module):
+    output = subprocess.check_output([sys.executable, "-c", SCRIPT.format(module=module)],
+                                     cwd=ROOT)
+    return json.loads(output.decode("utf8").strip().splitlines()[-1])
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    for module in MODULES:
+        runs = [measure(module) for _ in range(repeat)]
+        elapsed = min(run[0] for run in runs)
+        size, models = runs[0][1], runs[0][2]
+        print("import {:36s} {:8.1f} ms {:8.1f} KB {:4d} models".format(
+            module, elapsed * 1e3, size / 1024.0, models))
+
+
+if __name__ == "__main__":
+    main()
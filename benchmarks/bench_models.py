@@ -0,0 +1,43 @@
+"""Benchmark the construction time and memory of the generated models.
+
+    python benchmarks/bench_models.py [number of pods]
+"""
+
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from kubernetes_spawner.swagger_client import ApiClient
+from kubernetes_spawner.swagger_client.models.v1_pod import V1Pod
+from kubernetes_spawner.swagger_client.models.v1_pod_spec import V1PodSpec
+from fixtures import pod_list_json, FakeResponse
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    client = ApiClient("http://localhost")
+    response = FakeResponse(pod_list_json(count))
+
+    number = 100000
+    t_pod = min(timeit.repeat(V1Pod, number=number, repeat=3)) / number
+    t_spec = min(timeit.repeat(V1PodSpec, number=number, repeat=3)) / number
+
+    client.deserialize(response, "V1PodList")  # compile the decoders first
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    pod_list = client.deserialize(response, "V1PodList")
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    size = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+    print("V1Pod():          {:8.3f} us".format(t_pod * 1e6))
+    print("V1PodSpec():      {:8.3f} us".format(t_spec * 1e6))
+    print("memory per pod:   {:8.1f} KB ({} pods cached)".format(size / 1024.0 / len(pod_list.items),
+                                                                 len(pod_list.items)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Benchmark building the pod request body of a new user.
+
+Compares `KubernetesSpawner.build_pod` + `serialize_to_bytes` (the model
+graph built for every user) with `KubernetesSpawner.render_pod` (a JSON
+template built once per image) and checks both give the same JSON.
+
+    python benchmarks/bench_pod_template.py [number of users]
+"""
+
+import os
+import sys
+import json
+import timeit
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from kubernetes_spawner import KubernetesSpawner
+
+
+def user_env(i):
+    return {
+        "JPY_API_TOKEN": "0123456789abcdef0123456789abcdef",
+        "JPY_USER": "user{}".format(i),
+        "JPY_COOKIE_NAME": "jupyter-hub-token-user{}".format(i),
+        "JPY_BASE_URL": "/user/user{}".format(i),
+        "JPY_HUB_PREFIX": "/hub/",
+        "JPY_HUB_API_URL": "http://10.0.0.1:8081/hub/api",
+        "NOTEBOOK_DIR": "/mnt/notebooks/user{}".format(i),
+    }
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    spawner = KubernetesSpawner(user=SimpleNamespace(name="user0"), hub=None,
+                                host="http://localhost", username="bench", password="bench",
+                                pod_informer=False, volume_mode="nfs", nfs_server_ip="10.0.0.10",
+                                nfs_server_share="/exports", volume_mountpath="/mnt/{username}")
+    client = spawner.client.client
+    image = spawner.container_image
+    users = [("jupyterhub-user{}".format(i), user_env(i), "/mnt/user{}".format(i)) for i in range(count)]
+
+    for name, env, path in users[:10]:
+        built = client.serialize_to_bytes(spawner.build_pod(name, image, env, path))
+        rendered = client.serialize_to_bytes(spawner.render_pod(name, image, env, path))
+        assert json.loads(built.decode("utf8")) == json.loads(rendered.decode("utf8"))
+
+    def run(function):
+        return min(timeit.repeat(lambda: [client.serialize_to_bytes(function(name, image, env, path))
+                                          for name, env, path in users], number=3, repeat=7)) / 3
+
+    t_build = run(spawner.build_pod)
+    t_render = run(spawner.render_pod)
+    print("{} new user pod bodies".format(count))
+    print("  build_pod + serialize:  {:8.2f} ms  {:6.1f} us/pod".format(t_build * 1e3, t_build / count * 1e6))
+    print("  render_pod + serialize: {:8.2f} ms  {:6.1f} us/pod  ({:.1f}x)".format(
+        t_render * 1e3, t_render / count * 1e6, t_build / t_render))
+
+
+if __name__ == "__main__":
+    main()
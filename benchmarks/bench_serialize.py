@@ -0,0 +1,90 @@
+"""Benchmark the serialization of a new user `Pod` request body.
+
+Compares `ApiClient.sanitize_for_serialization` + `json.dumps` and
+`ApiClient.serialize_to_bytes` with the previous reflective implementation
+(kept below as a reference) and checks that all give the same JSON.
+
+    python benchmarks/bench_serialize.py [number of pods]
+"""
+
+import os
+import sys
+import json
+import timeit
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from six import iteritems
+
+from kubernetes_spawner.kube import Pod, BaseContainer
+from kubernetes_spawner.swagger_client import ApiClient
+
+
+def reflective_sanitize(obj):
+    """`ApiClient.sanitize_for_serialization` before the encoders were compiled"""
+    types = (str, int, float, bool, tuple)
+    if isinstance(obj, type(None)):
+        return None
+    elif isinstance(obj, types):
+        return obj
+    elif isinstance(obj, list):
+        return [reflective_sanitize(sub_obj) for sub_obj in obj]
+    elif isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    else:
+        if isinstance(obj, dict):
+            obj_dict = obj
+        else:
+            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
+                        for attr, _ in iteritems(obj.swagger_types)
+                        if getattr(obj, attr) is not None}
+        return {key: reflective_sanitize(val) for key, val in iteritems(obj_dict)}
+
+
+def make_pod(i):
+    """The pod `KubernetesSpawner.start` sends for the user number `i`"""
+    pod = Pod(name="jupyterhub-user{}".format(i))
+    container = BaseContainer(name="jupyter", image="jupyterhub/singleuser:0.6")
+    container.add_port(8888)
+    env = {
+        "JPY_API_TOKEN": "0123456789abcdef0123456789abcdef",
+        "JPY_USER": "user{}".format(i),
+        "JPY_COOKIE_NAME": "jupyter-hub-token-user{}".format(i),
+        "JPY_BASE_URL": "/user/user{}".format(i),
+        "JPY_HUB_PREFIX": "/hub/",
+        "JPY_HUB_API_URL": "http://10.0.0.1:8081/hub/api",
+        "NOTEBOOK_DIR": "/mnt/notebooks/user{}".format(i),
+    }
+    for name, value in env.items():
+        container.add_env(name, value)
+    pod.add_nfs_volume("notebooks", "10.0.0.10", "/exports")
+    container.add_volume("notebooks", "/mnt")
+    pod.add_container(container)
+    return pod
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    client = ApiClient("http://localhost")
+    pods = [make_pod(i) for i in range(count)]
+
+    reference = json.dumps(reflective_sanitize(pods[0])).encode("utf8")
+    assert json.dumps(client.sanitize_for_serialization(pods[0])).encode("utf8") == reference
+    assert client.serialize_to_bytes(pods[0]) == reference
+
+    def run(function):
+        return min(timeit.repeat(lambda: [function(pod) for pod in pods], number=3, repeat=7)) / 3
+
+    t_reference = run(lambda pod: json.dumps(reflective_sanitize(pod)))
+    t_sanitize = run(lambda pod: json.dumps(client.sanitize_for_serialization(pod)))
+    t_bytes = run(client.serialize_to_bytes)
+
+    print("{} Pod bodies ({} bytes each)".format(count, len(reference)))
+    print("  reflective + json.dumps: {:8.2f} ms".format(t_reference * 1000))
+    print("  compiled + json.dumps:   {:8.2f} ms  ({:.1f}x)".format(t_sanitize * 1000, t_reference / t_sanitize))
+    print("  serialize_to_bytes:      {:8.2f} ms  ({:.1f}x)".format(t_bytes * 1000, t_reference / t_bytes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+"""Benchmark `KubernetesSpawner` start, poll and stop against the fake apiserver.
+
+    python benchmarks/bench_spawner.py [--users 100] [--concurrency 100] [--polls 3]
+                                       [--latency 0] [--error-rate 0] [--no-informer]
+                                       [--set trait=json_value ...]
+
+Runs `benchmarks/fake_apiserver.py` in a subprocess and drives one spawner
+per simulated user from this process (the hub): all the users are started
+(at most `concurrency` at once), polled `polls` times and stopped.
+Reports for each phase the throughput, the p50/p99 latency, the apiserver
+requests and the CPU used by the hub. No cluster or network needed.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+from tornado.locks import Semaphore
+from tornado.httpclient import AsyncHTTPClient
+
+from kubernetes_spawner import KubernetesSpawner
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+class BenchSpawner(KubernetesSpawner):
+    """`KubernetesSpawner` without the hub specific environment"""
+
+    @gen.coroutine
+    def get_env_vars(self):
+        env = {
+            "JPY_USER": self.user.name,
+            "JPY_BASE_URL": self.user.server.base_url,
+            "JPY_HUB_API_URL": (yield self._hub_api_url()),
+        }
+        return env
+
+
+def make_spawner(i, config):
+    name = "user{}".format(i)
+    server = SimpleNamespace(ip="", port=0, cookie_name="jupyter-hub-token-" + name,
+                             base_url="/user/{}/".format(name))
+    user = SimpleNamespace(name=name, server=server, url=server.base_url)
+    hub = SimpleNamespace(server=SimpleNamespace(base_url="/hub/"),
+                          api_url="http://127.0.0.1:8081/hub/api")
+    return BenchSpawner(user=user, hub=hub, **config)
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100.0))] if values else float("nan")
+
+
+class Harness(object):
+
+    def __init__(self, host, users, concurrency):
+        self.host = host
+        self.users = users
+        self.semaphore = Semaphore(concurrency)
+        self.http = AsyncHTTPClient()
+
+    @gen.coroutine
+    def stats(self, reset=False):
+        response = yield self.http.fetch(self.host + "/stats", method="DELETE" if reset else "GET")
+        return json.loads(response.body.decode("utf8"))
+
+    @gen.coroutine
+    def timed(self, call):
+        with (yield self.semaphore.acquire()):
+            started = time.time()
+            try:
+                yield call()
+            except Exception as e:
+                return None, e
+            return time.time() - started, None
+
+    @gen.coroutine
+    def phase(self, title, calls):
+        yield self.stats(reset=True)
+        cpu, wall = time.process_time(), time.time()
+        results = yield [self.timed(call) for call in calls]
+        wall, cpu = time.time() - wall, time.process_time() - cpu
+        requests = yield self.stats()
+        latencies = [latency for latency, error in results if error is None]
+        errors = [error for latency, error in results if error is not None]
+        print("{:6s} {:8.1f}/s  p50 {:8.1f} ms  p99 {:8.1f} ms  errors {:4d}  hub CPU {:6.2f}s ({:3.0f}%)".format(
+            title, len(calls) / wall, percentile(latencies, 50) * 1e3, percentile(latencies, 99) * 1e3,
+            len(errors), cpu, 100.0 * cpu / wall))
+        print("       apiserver: {}".format(", ".join("{} {}".format(count, key)
+                                                      for key, count in sorted(requests.items()))))
+        if errors:
+            print("       first error: {}".format(str(errors[0]).splitlines()[0]))
+
+
+@gen.coroutine
+def run(args, host):
+    config = dict(host=host, username="bench", password="bench", start_timeout=300,
+                  pod_informer=not args.no_informer)
+    for item in args.set:
+        key, value = item.split("=", 1)
+        config[key] = json.loads(value)
+    spawners = [make_spawner(i, config) for i in range(args.users)]
+    harness = Harness(host, args.users, args.concurrency)
+
+    # create the shared client (and informer) before measuring
+    spawners[0].client
+    if spawners[0].client.informer is not None:
+        spawners[0].client.informer.wait_synced(10)
+
+    print("{} users, concurrency {}".format(args.users, args.concurrency))
+    yield harness.phase("start", [s.start for s in spawners])
+    for _ in range(args.polls):
+        yield harness.phase("poll", [s.poll for s in spawners])
+    yield harness.phase("stop", [s.stop for s in spawners])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--polls", type=int, default=3)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--schedule-delay", type=float, default=0.05)
+    parser.add_argument("--start-delay", type=float, default=0.2)
+    parser.add_argument("--no-informer", action="store_true")
+    parser.add_argument("--set", action="append", default=[],
+                        help="KubernetesSpawner trait as name=json value, e.g. poll_batch_window=0")
+    args = parser.parse_args()
+
+    server = subprocess.Popen([sys.executable, os.path.join(HERE, "fake_apiserver.py"),
+                               "--latency", str(args.latency), "--error-rate", str(args.error_rate),
+                               "--schedule-delay", str(args.schedule_delay),
+                               "--start-delay", str(args.start_delay)],
+                              stdout=subprocess.PIPE)
+    try:
+        port = int(server.stdout.readline())
+        IOLoop.current().run_sync(lambda: run(args, "http://127.0.0.1:{}".format(port)))
+    finally:
+        server.terminate()
+        server.wait()
+    # the informer and watch threads are daemons, don't wait for them
+    os._exit(0)
+
+
+if __name__ == "__main__":
+    main()
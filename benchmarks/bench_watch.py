@@ -0,0 +1,94 @@
+"""Benchmark the decoding of a watch stream.
+
+    python benchmarks/bench_watch.py [number of events]
+
+Compares splitting the stream into lines with the previous bytes
+concatenation and with `kubernetes_spawner.watch.iter_lines`, and the full
+decoding of the events to `V1Pod` with `Watch`.
+"""
+
+import os
+import sys
+import json
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from kubernetes_spawner.swagger_client import ApiClient
+from kubernetes_spawner.watch import Watch, iter_lines
+from fixtures import pod_json
+
+
+def reference_iter_lines(response, chunk_size=8192):
+    """Line splitting before the streaming decoder"""
+    buf = b""
+    for chunk in response.stream(chunk_size, decode_content=True):
+        buf += chunk
+        lines = buf.split(b"\n")
+        buf = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line.decode("utf8")
+    if buf.strip():
+        yield buf.decode("utf8")
+
+
+class FakeStream(object):
+
+    def __init__(self, data):
+        self.data = data
+
+    def stream(self, chunk_size, decode_content=True):
+        for i in range(0, len(self.data), chunk_size):
+            yield self.data[i:i + chunk_size]
+
+    def release_conn(self):
+        pass
+
+
+def watch_stream(count):
+    events = [json.dumps({"type": "MODIFIED", "object": pod_json(i)}) for i in range(count)]
+    return ("\n".join(events) + "\n").encode("utf8")
+
+
+def measure(func, data, repeat=5):
+    elapsed = min(timeit.repeat(lambda: sum(1 for _ in func(FakeStream(data))), number=1, repeat=repeat))
+    tracemalloc.start()
+    for _ in func(FakeStream(data)):
+        pass
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    streams = [
+        ("{} pod events".format(count), watch_stream(count)),
+        ("one 4 MB event", b'{"type": "MODIFIED", "object": "' + b"x" * (4 * 1024 * 1024) + b'"}\n'),
+    ]
+    for title, data in streams:
+        print("{} ({} KB)".format(title, len(data) // 1024))
+        t_ref, m_ref = measure(reference_iter_lines, data)
+        t_new, m_new = measure(iter_lines, data)
+        print("  reference lines: {:8.2f} ms {:8.1f} KB peak".format(t_ref * 1e3, m_ref / 1024.0))
+        print("  iter_lines:      {:8.2f} ms {:8.1f} KB peak  ({:.1f}x)".format(t_new * 1e3, m_new / 1024.0,
+                                                                           t_ref / t_new))
+
+    client = ApiClient("http://localhost")
+    data = streams[0][1]
+
+    def method(_preload_content, **kwargs):
+        return FakeStream(data)
+    method.__name__ = "watch_namespaced_pod_list"
+
+    watch = Watch(client, method)
+    list(watch)  # compile the decoders first
+    t_watch, m_watch = measure(lambda response: Watch(client, method), data)
+    print("Watch to V1Pod:    {:8.2f} ms {:8.1f} KB peak  ({:.0f} events/s)".format(
+        t_watch * 1e3, m_watch / 1024.0, count / t_watch))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,513 @@
+"""Stand-in Kubernetes apiserver for the benchmarks, no cluster needed.
+
+    python benchmarks/fake_apiserver.py [--port 0] [--latency 0] [--error-rate 0]
+                                        [--schedule-delay 0.05] [--start-delay 0.2]
+
+Prints the port it listens on, then serves the endpoints used by
+`KubernetesClient`: pods (create, read, list, patch, delete,
+deletecollection, watch, list and watch of all the namespaces), services (read, watch), nodes (list)
+and events (list, watch).
+Created pods get a node (unless they have a `nodeName`) after
+`schedule-delay` seconds and are running and ready `start-delay` seconds
+later, their images are then listed in the status of their node.
+Pods with a `nodeSelector` on other labels than the hostname stay
+unschedulable and containers of `missing/` images in `ImagePullBackOff`.
+
+Every request but watches waits `latency` seconds and fails with a 500
+`error-rate` of the time. `GET /stats` returns the number of requests by
+verb and resource, `DELETE /stats` resets them.
+"""
+
+import re
+import sys
+import json
+import time
+import logging
+import uuid
+import random
+import argparse
+import itertools
+from collections import deque, Counter
+
+from tornado import gen, web
+from tornado.ioloop import IOLoop
+from tornado.queues import Queue
+from tornado.httpserver import HTTPServer
+from tornado.netutil import bind_sockets
+
+# images that can't be pulled
+MISSING_IMAGES = "missing/"
+
+SELECTOR_TERM = re.compile(r"\s*([\w./-]+)\s+(in|notin)\s+\(([^)]*)\)\s*|\s*([\w./-]+)\s*(==|=|!=)\s*([^,]*)")
+
+
+def parse_selector(selector):
+    """`[(key, op, values)]` terms of a label or field selector"""
+    terms = []
+    for match in SELECTOR_TERM.finditer(selector or ""):
+        if match.group(1):
+            values = {v.strip() for v in match.group(3).split(",") if v.strip()}
+            terms.append((match.group(1), match.group(2), values))
+        else:
+            op = "!=" if match.group(5) == "!=" else "="
+            terms.append((match.group(4), op, {match.group(6).strip()}))
+    return terms
+
+
+def matches(terms, values):
+    for key, op, expected in terms:
+        value = values.get(key)
+        if op in ("=", "in") and value not in expected:
+            return False
+        if op in ("!=", "notin") and value in expected:
+            return False
+    return True
+
+
+def json_patch(obj, operations):
+    """Apply a JSON patch in place, False if a `test` op fails"""
+    for operation in operations:
+        parts = [p.replace("~1", "/").replace("~0", "~") for p in operation["path"].split("/")[1:]]
+        parent = obj
+        for part in parts[:-1]:
+            parent = parent.setdefault(part, {})
+        key = parts[-1]
+        op = operation["op"]
+        if op == "test" and parent.get(key) != operation["value"]:
+            return False
+        if op in ("add", "replace"):
+            parent[key] = operation["value"]
+        if op == "remove":
+            parent.pop(key, None)
+    return True
+
+
+def merge_patch(obj, patch):
+    for key, value in patch.items():
+        if value is None:
+            obj.pop(key, None)
+        elif isinstance(value, dict) and isinstance(obj.get(key), dict):
+            merge_patch(obj[key], value)
+        else:
+            obj[key] = value
+
+
+class FakeApiServer(object):
+    """In memory state of the fake apiserver"""
+
+    def __init__(self, latency=0, error_rate=0, schedule_delay=0.05, start_delay=0.2,
+                 history=10000, nodes=10):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.schedule_delay = schedule_delay
+        self.start_delay = start_delay
+        self.nodes = nodes
+        self.stats = Counter()
+        self.objects = {"pods": {}, "services": {}, "events": {}}
+        # (resource version, kind, event type, object) of the last changes
+        self.events = deque(maxlen=history)
+        self.watchers = set()
+        self._versions = itertools.count(1)
+        self._ips = itertools.count(1)
+        self.node_images = {"node-{}".format(i): set() for i in range(nodes)}
+
+        self.objects["services"][("default", "jupyterhub")] = self.new_object("Service", {
+            "metadata": {"name": "jupyterhub", "namespace": "default"},
+            "spec": {"type": "LoadBalancer", "ports": [{"port": 8081}]},
+            "status": {"loadBalancer": {"ingress": [{"ip": "10.0.0.1"}]}},
+        })
+
+    @property
+    def resource_version(self):
+        return str(self.events[-1][0]) if self.events else "0"
+
+    def new_object(self, kind, obj):
+        metadata = obj.setdefault("metadata", {})
+        metadata["uid"] = str(uuid.uuid4())
+        metadata["creationTimestamp"] = "2016-06-01T09:00:00Z"
+        metadata["resourceVersion"] = str(next(self._versions))
+        obj["kind"] = kind
+        obj["apiVersion"] = "v1"
+        return obj
+
+    def changed(self, kind, event_type, obj):
+        version = next(self._versions)
+        obj["metadata"]["resourceVersion"] = str(version)
+        event = (version, kind, event_type, json.loads(json.dumps(obj)))
+        self.events.append(event)
+        for queue in self.watchers:
+            queue.put_nowait(event)
+
+    def create_pod(self, namespace, pod):
+        name = pod["metadata"]["name"]
+        if (namespace, name) in self.objects["pods"]:
+            return None
+        pod["metadata"]["namespace"] = namespace
+        pod = self.new_object("Pod", pod)
+        pod["status"] = {"phase": "Pending"}
+        self.objects["pods"][(namespace, name)] = pod
+        self.changed("Pod", "ADDED", pod)
+        uid = pod["metadata"]["uid"]
+        loop = IOLoop.current()
+        loop.call_later(self.schedule_delay, self._schedule, namespace, name, uid)
+        loop.call_later(self.schedule_delay + self.start_delay, self._run, namespace, name, uid)
+        return pod
+
+    def record(self, pod, reason, message, event_type="Normal"):
+        """Event of the kubelet or scheduler about a pod"""
+        metadata = pod["metadata"]
+        name = "{}.{}".format(metadata["name"], uuid.uuid4().hex[:16])
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        event = self.new_object("Event", {
+            "metadata": {"name": name, "namespace": metadata["namespace"]},
+            "involvedObject": {"kind": "Pod", "namespace": metadata["namespace"],
+                               "name": metadata["name"], "uid": metadata["uid"]},
+            "reason": reason, "message": message, "type": event_type, "count": 1,
+            "firstTimestamp": timestamp, "lastTimestamp": timestamp,
+        })
+        self.objects["events"][(metadata["namespace"], name)] = event
+        self.changed("Event", "ADDED", event)
+
+    def replaced(self, namespace, name, uid):
+        loop = IOLoop.current()
+        loop.call_later(self.schedule_delay, self._restart, namespace, name, uid)
+        loop.call_later(self.schedule_delay + self.start_delay, self._run, namespace, name, uid)
+
+    def _restart(self, namespace, name, uid):
+        pod = self._get(namespace, name, uid)
+        if pod is None:
+            return
+        images = {c["name"]: c.get("image") for c in pod["spec"].get("containers", [])}
+        statuses = pod["status"].get("containerStatuses") or []
+        for status in statuses:
+            if status.get("image") != images.get(status["name"]):
+                status.update({"image": images.get(status["name"]), "ready": False,
+                               "restartCount": status.get("restartCount", 0) + 1,
+                               "state": {"waiting": {"reason": "ContainerCreating"}}})
+        pod["status"]["conditions"] = [{"type": "PodScheduled", "status": "True"},
+                                       {"type": "Ready", "status": "False"}]
+        self.changed("Pod", "MODIFIED", pod)
+
+    def _get(self, namespace, name, uid):
+        pod = self.objects["pods"].get((namespace, name))
+        if pod is not None and pod["metadata"]["uid"] == uid:
+            return pod
+
+    def _schedule(self, namespace, name, uid):
+        pod = self._get(namespace, name, uid)
+        if pod is None:
+            return
+        selector = pod["spec"].get("nodeSelector") or {}
+        if any(key != "kubernetes.io/hostname" for key in selector):
+            # the nodes only have the hostname label
+            message = "0/{0} nodes are available: {0} node(s) didn't match node selector.".format(self.nodes)
+            pod["status"]["conditions"] = [{"type": "PodScheduled", "status": "False",
+                                            "reason": "Unschedulable", "message": message}]
+            self.changed("Pod", "MODIFIED", pod)
+            self.record(pod, "FailedScheduling", message, "Warning")
+            return
+        pod["spec"].setdefault("nodeName", "node-{}".format(random.randrange(self.nodes)))
+        pod["status"]["conditions"] = [{"type": "PodScheduled", "status": "True"}]
+        self.changed("Pod", "MODIFIED", pod)
+        self.record(pod, "Scheduled", "Successfully assigned {} to {}".format(
+            name, pod["spec"]["nodeName"]))
+
+    def _run(self, namespace, name, uid):
+        pod = self._get(namespace, name, uid)
+        if pod is None or "nodeName" not in pod["spec"]:
+            return
+        missing = [c for c in pod["spec"].get("containers", []) if c.get("image", "").startswith(MISSING_IMAGES)]
+        if missing:
+            for container in missing:
+                self.record(pod, "Failed", "Failed to pull image \"{}\": not found".format(container["image"]),
+                            "Warning")
+            pod["status"]["containerStatuses"] = [
+                {"name": c["name"], "image": c.get("image"), "ready": False, "restartCount": 0,
+                 "state": {"waiting": {"reason": "ImagePullBackOff",
+                                       "message": "Back-off pulling image \"{}\"".format(c.get("image"))}}}
+                for c in missing]
+            self.changed("Pod", "MODIFIED", pod)
+            return
+        ip = next(self._ips)
+        for container in pod["spec"].get("containers", []):
+            image = container.get("image")
+            self.record(pod, "Pulled", "Container image \"{}\" already present on machine".format(image))
+            self.record(pod, "Created", "Created container {}".format(container["name"]))
+            self.record(pod, "Started", "Started container {}".format(container["name"]))
+        self.node_images.setdefault(pod["spec"]["nodeName"], set()).update(
+            c.get("image") for c in pod["spec"].get("containers", []))
+        pod["status"].update({
+            "phase": "Running",
+            "podIP": "10.244.{}.{}".format(ip // 250 % 250, ip % 250),
+            "conditions": [{"type": "PodScheduled", "status": "True"},
+                           {"type": "Ready", "status": "True"}],
+            "containerStatuses": [{"name": c["name"], "image": c.get("image"), "ready": True,
+                                   "restartCount": 0,
+                                   "state": {"running": {"startedAt": "2016-06-01T09:00:08Z"}}}
+                                  for c in pod["spec"].get("containers", [])],
+        })
+        self.changed("Pod", "MODIFIED", pod)
+
+    def node(self, name):
+        return {
+            "kind": "Node", "apiVersion": "v1",
+            "metadata": {"name": name, "labels": {"kubernetes.io/hostname": name}},
+            "spec": {},
+            "status": {"conditions": [{"type": "Ready", "status": "True"}],
+                       "images": [{"repoTags": [image], "size": 1 << 30}
+                                  for image in sorted(self.node_images[name])]},
+        }
+
+    def delete(self, resource, namespace, name):
+        obj = self.objects[resource].pop((namespace, name), None)
+        if obj is not None:
+            self.changed(obj["kind"], "DELETED", obj)
+        return obj
+
+    def select(self, resource, namespace, label_selector=None, field_selector=None):
+        labels = parse_selector(label_selector)
+        fields = parse_selector(field_selector)
+        return [obj for (ns, name), obj in sorted(self.objects[resource].items())
+                if namespace in (None, ns) and self.selected(obj, labels, fields)]
+
+    @staticmethod
+    def selected(obj, labels, fields):
+        metadata = obj["metadata"]
+        return (matches(labels, metadata.get("labels") or {}) and
+                matches(fields, {"metadata.name": metadata["name"],
+                                 "metadata.namespace": metadata.get("namespace"),
+                                 "involvedObject.kind": obj.get("involvedObject", {}).get("kind")}))
+
+
+class BaseHandler(web.RequestHandler):
+
+    def initialize(self, server):
+        self.server = server
+
+    def count(self, verb, resource):
+        self.server.stats["{} {}".format(verb, resource)] += 1
+
+    @gen.coroutine
+    def prepare(self):
+        if self.server.latency:
+            yield gen.sleep(self.server.latency)
+        if self.server.error_rate and random.random() < self.server.error_rate:
+            self.fail(500, "InternalError", "injected failure")
+
+    def fail(self, code, reason, message):
+        self.set_status(code)
+        self.finish({"kind": "Status", "apiVersion": "v1", "status": "Failure",
+                     "reason": reason, "message": message, "code": code})
+
+    def body(self):
+        return json.loads(self.request.body.decode("utf8")) if self.request.body else {}
+
+    def object_list(self, kind, items):
+        return {"kind": kind + "List", "apiVersion": "v1",
+                "metadata": {"resourceVersion": self.server.resource_version}, "items": items}
+
+
+class PodsHandler(BaseHandler):
+
+    def get(self, namespace):
+        self.count("LIST", "pods")
+        pods = self.server.select("pods", namespace, self.get_argument("labelSelector", None),
+                                  self.get_argument("fieldSelector", None))
+        self.finish(self.object_list("Pod", pods))
+
+    def post(self, namespace):
+        self.count("POST", "pods")
+        pod = self.server.create_pod(namespace, self.body())
+        if pod is None:
+            return self.fail(409, "AlreadyExists", "pod already exists")
+        self.set_status(201)
+        self.finish(pod)
+
+    def delete(self, namespace):
+        self.count("DELETECOLLECTION", "pods")
+        pods = self.server.select("pods", namespace, self.get_argument("labelSelector", None),
+                                  self.get_argument("fieldSelector", None))
+        for pod in pods:
+            self.server.delete("pods", namespace, pod["metadata"]["name"])
+        self.finish({"kind": "Status", "apiVersion": "v1", "status": "Success"})
+
+
+class PodHandler(BaseHandler):
+
+    def get(self, namespace, name):
+        self.count("GET", "pods")
+        pod = self.server.objects["pods"].get((namespace, name))
+        if pod is None:
+            return self.fail(404, "NotFound", "pod {} not found".format(name))
+        self.finish(pod)
+
+    def patch(self, namespace, name):
+        self.count("PATCH", "pods")
+        pod = self.server.objects["pods"].get((namespace, name))
+        if pod is None:
+            return self.fail(404, "NotFound", "pod {} not found".format(name))
+        patched = json.loads(json.dumps(pod))
+        if "json-patch" in self.request.headers.get("Content-Type", ""):
+            if not json_patch(patched, self.body()):
+                return self.fail(422, "Invalid", "test operation failed")
+        else:
+            merge_patch(patched, self.body())
+        self.server.objects["pods"][(namespace, name)] = patched
+        self.server.changed("Pod", "MODIFIED", patched)
+        self.finish(patched)
+
+    def put(self, namespace, name):
+        self.count("PUT", "pods")
+        if (namespace, name) not in self.server.objects["pods"]:
+            return self.fail(404, "NotFound", "pod {} not found".format(name))
+        live = self.server.objects["pods"][(namespace, name)]
+        pod = self.body()
+        pod["metadata"].update({key: live["metadata"][key] for key in ("uid", "creationTimestamp", "namespace")})
+        # the status isn't changed by a PUT, the kubelet restarts the changed containers later
+        pod["status"] = live["status"]
+        self.server.objects["pods"][(namespace, name)] = pod
+        self.server.changed("Pod", "MODIFIED", pod)
+        self.server.replaced(namespace, name, pod["metadata"]["uid"])
+        self.finish(pod)
+
+    def delete(self, namespace, name):
+        self.count("DELETE", "pods")
+        pod = self.server.delete("pods", namespace, name)
+        if pod is None:
+            return self.fail(404, "NotFound", "pod {} not found".format(name))
+        self.finish(pod)
+
+
+class NodesHandler(BaseHandler):
+
+    def get(self):
+        self.count("LIST", "nodes")
+        self.finish(self.object_list("Node", [self.server.node(name)
+                                              for name in sorted(self.server.node_images)]))
+
+
+class EventsHandler(BaseHandler):
+
+    def get(self, namespace):
+        self.count("LIST", "events")
+        events = self.server.select("events", namespace, self.get_argument("labelSelector", None),
+                                    self.get_argument("fieldSelector", None))
+        self.finish(self.object_list("Event", events))
+
+
+class ServiceHandler(BaseHandler):
+
+    def get(self, namespace, name):
+        self.count("GET", "services")
+        service = self.server.objects["services"].get((namespace, name))
+        if service is None:
+            return self.fail(404, "NotFound", "service {} not found".format(name))
+        self.finish(service)
+
+
+class WatchHandler(BaseHandler):
+
+    @gen.coroutine
+    def prepare(self):
+        # watches never get latency or injected failures
+        pass
+
+    @gen.coroutine
+    def get(self, namespace, resource):
+        self.count("WATCH", resource)
+        kind = {"pods": "Pod", "services": "Service", "events": "Event"}[resource]
+        labels = parse_selector(self.get_argument("labelSelector", None))
+        fields = parse_selector(self.get_argument("fieldSelector", None))
+        timeout = float(self.get_argument("timeoutSeconds", 300))
+        since = self.get_argument("resourceVersion", None)
+
+        def selected(event_kind, obj):
+            return (event_kind == kind and namespace in (None, obj["metadata"].get("namespace")) and
+                    self.server.selected(obj, labels, fields))
+
+        queue = Queue()
+        self.server.watchers.add(queue)
+        try:
+            if since:
+                events = self.server.events
+                if len(events) == events.maxlen and int(since) < events[0][0]:
+                    self.write_event("ERROR", {"kind": "Status", "status": "Failure", "code": 410,
+                                               "reason": "Gone", "message": "too old resource version"})
+                    return
+                for version, event_kind, event_type, obj in list(events):
+                    if version > int(since) and selected(event_kind, obj):
+                        self.write_event(event_type, obj)
+            else:
+                for obj in self.server.select(resource, namespace):
+                    if self.server.selected(obj, labels, fields):
+                        self.write_event("ADDED", obj)
+            yield self.flush()
+
+            deadline = IOLoop.current().time() + timeout
+            while True:
+                try:
+                    version, event_kind, event_type, obj = yield queue.get(timeout=deadline)
+                except gen.TimeoutError:
+                    return
+                if selected(event_kind, obj):
+                    self.write_event(event_type, obj)
+                    yield self.flush()
+        except Exception:
+            # the client went away
+            return
+        finally:
+            self.server.watchers.discard(queue)
+
+    def write_event(self, event_type, obj):
+        self.write(json.dumps({"type": event_type, "object": obj}) + "\n")
+
+
+class StatsHandler(BaseHandler):
+
+    @gen.coroutine
+    def prepare(self):
+        pass
+
+    def get(self):
+        self.finish(dict(self.server.stats))
+
+    def delete(self):
+        self.server.stats.clear()
+        self.finish({})
+
+
+def make_app(server):
+    ns = r"/api/v1/namespaces/([^/]+)"
+    args = {"server": server}
+    return web.Application([
+        (r"/api/v1/(?:namespaces/([^/]+)/)?pods", PodsHandler, args),
+        (ns + r"/pods/([^/]+)", PodHandler, args),
+        (ns + r"/services/([^/]+)", ServiceHandler, args),
+        (r"/api/v1/(?:namespaces/([^/]+)/)?events", EventsHandler, args),
+        (r"/api/v1/nodes", NodesHandler, args),
+        (r"/api/v1/watch/(?:namespaces/([^/]+)/)?(pods|services|events)", WatchHandler, args),
+        (r"/stats", StatsHandler, args),
+    ])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0)
+    parser.add_argument("--error-rate", type=float, default=0)
+    parser.add_argument("--schedule-delay", type=float, default=0.05)
+    parser.add_argument("--start-delay", type=float, default=0.2)
+    args = parser.parse_args()
+    logging.getLogger("tornado.access").setLevel(logging.CRITICAL)
+
+    server = FakeApiServer(latency=args.latency, error_rate=args.error_rate,
+                           schedule_delay=args.schedule_delay, start_delay=args.start_delay)
+    sockets = bind_sockets(args.port, "127.0.0.1")
+    HTTPServer(make_app(server)).add_sockets(sockets)
+    print(sockets[0].getsockname()[1])
+    sys.stdout.flush()
+    IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
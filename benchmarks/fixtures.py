@@ -0,0 +1,94 @@
+"""Realistic pod payloads shared by the benchmarks"""
+
+import json
+
+
+def pod_json(i, namespace="default"):
+    """Pod as returned by the apiserver for the user number `i`"""
+    name = "jupyterhub-user{}".format(i)
+    return {
+        "kind": "Pod",
+        "apiVersion": "v1",
+        "metadata": {
+            "name": name,
+            "namespace": namespace,
+            "selfLink": "/api/v1/namespaces/{}/pods/{}".format(namespace, name),
+            "uid": "5f2b5d7e-{:04d}-11e6-8a9e-42010af00002".format(i % 10000),
+            "resourceVersion": str(1000 + i),
+            "creationTimestamp": "2016-06-01T09:00:00Z",
+            "labels": {"name": name},
+            "annotations": {"kubernetes.io/created-by": "jupyterhub"},
+        },
+        "spec": {
+            "volumes": [
+                {"name": "notebooks", "nfs": {"server": "10.0.0.10", "path": "/exports"}},
+                {"name": "default-token-abcde", "secret": {"secretName": "default-token-abcde"}},
+            ],
+            "containers": [{
+                "name": "jupyter",
+                "image": "jupyterhub/singleuser:0.6",
+                "ports": [{"containerPort": 8888, "protocol": "TCP"}],
+                "env": [
+                    {"name": "POD_IP", "valueFrom": {"fieldRef": {"apiVersion": "v1",
+                                                                   "fieldPath": "status.podIP"}}},
+                    {"name": "JPY_API_TOKEN", "value": "0123456789abcdef0123456789abcdef"},
+                    {"name": "JPY_USER", "value": "user{}".format(i)},
+                    {"name": "JPY_COOKIE_NAME", "value": "jupyter-hub-token-user{}".format(i)},
+                    {"name": "JPY_BASE_URL", "value": "/user/user{}".format(i)},
+                    {"name": "JPY_HUB_PREFIX", "value": "/hub/"},
+                    {"name": "JPY_HUB_API_URL", "value": "http://10.0.0.1:8081/hub/api"},
+                ],
+                "resources": {"limits": {"cpu": "250m", "memory": "1Gi"},
+                              "requests": {"cpu": "250m", "memory": "1Gi"}},
+                "volumeMounts": [
+                    {"name": "notebooks", "mountPath": "/mnt"},
+                    {"name": "default-token-abcde", "readOnly": True,
+                     "mountPath": "/var/run/secrets/kubernetes.io/serviceaccount"},
+                ],
+                "terminationMessagePath": "/dev/termination-log",
+                "imagePullPolicy": "IfNotPresent",
+            }],
+            "restartPolicy": "Always",
+            "terminationGracePeriodSeconds": 30,
+            "dnsPolicy": "ClusterFirst",
+            "serviceAccountName": "default",
+            "nodeName": "node-{}".format(i % 20),
+            "securityContext": {},
+        },
+        "status": {
+            "phase": "Running",
+            "conditions": [{"type": "Ready", "status": "True",
+                            "lastProbeTime": None,
+                            "lastTransitionTime": "2016-06-01T09:00:10Z"}],
+            "hostIP": "10.240.0.{}".format(i % 20),
+            "podIP": "10.244.{}.{}".format(i // 250 % 250, i % 250),
+            "startTime": "2016-06-01T09:00:00Z",
+            "containerStatuses": [{
+                "name": "jupyter",
+                "state": {"running": {"startedAt": "2016-06-01T09:00:08Z"}},
+                "lastState": {},
+                "ready": True,
+                "restartCount": 0,
+                "image": "jupyterhub/singleuser:0.6",
+                "imageID": "docker://sha256:0123456789abcdef",
+                "containerID": "docker://fedcba9876543210",
+            }],
+        },
+    }
+
+
+def pod_list_json(count, namespace="default"):
+    return {
+        "kind": "PodList",
+        "apiVersion": "v1",
+        "metadata": {"selfLink": "/api/v1/namespaces/{}/pods".format(namespace),
+                     "resourceVersion": "123456"},
+        "items": [pod_json(i, namespace) for i in range(count)],
+    }
+
+
+class FakeResponse(object):
+    """Stands for the RESTResponse given to `ApiClient.deserialize`"""
+
+    def __init__(self, obj):
+        self.data = json.dumps(obj)
@@ -0,0 +1,134 @@
+import logging
+from collections import deque
+
+from tornado.ioloop import IOLoop, PeriodicCallback
+from tornado.concurrent import Future
+
+from .metrics import SPAWN_ADMISSION
+
+
+class AdmissionCancelled(Exception):
+    pass
+
+
+class _Slot(object):
+    """Permission to create a pod, to be released once the create is done"""
+
+    def __init__(self, admission):
+        self.admission = admission
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self.admission._release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.release()
+
+
+class SpawnAdmission(object):
+    """Hub wide limit of the pod creations in flight, with a FIFO queue.
+
+    `acquire(key)` gives a future resolved with a slot once fewer than
+    `limit` creations are in flight and all the earlier callers got theirs,
+    the slot must be released after the create. `position(key)` is the
+    place of a caller in the queue, for the spawn progress.
+
+    With `adaptive`, the `limit` follows the apiserver health, measured
+    from the requests reported to `observe` (see `KubernetesClient.observers`)
+    every `adjust_interval` seconds: it is halved (down to `min_limit`)
+    when more than `max_error_rate` of them were throttled (429) or failed,
+    or when their 90th percentile latency is above `target_latency`
+    seconds, and it grows by one (up to `max_limit`) while it is full and
+    the apiserver is healthy.
+    """
+
+    def __init__(self, max_limit=20, min_limit=1, adaptive=True, target_latency=1.0,
+                 max_error_rate=0.01, adjust_interval=5, log=None):
+        self.max_limit = max_limit
+        self.min_limit = min_limit
+        self.adaptive = adaptive
+        self.target_latency = target_latency
+        self.max_error_rate = max_error_rate
+        self.adjust_interval = adjust_interval
+        self.log = log or logging.getLogger(__name__)
+
+        self.limit = max_limit
+        self.inflight = 0
+        self._queue = deque()
+        # (seconds, failed) of the requests since the last adjustment, appended from the API threads
+        self._samples = deque(maxlen=10000)
+        self._callback = None
+
+    @property
+    def queued(self):
+        return len(self._queue)
+
+    def acquire(self, key):
+        future = Future()
+        self._queue.append((key, future))
+        if self.adaptive and self._callback is None:
+            self._callback = PeriodicCallback(self.adjust, self.adjust_interval * 1000)
+            self._callback.start()
+        self._admit()
+        return future
+
+    def position(self, key):
+        """1 based position of `key` in the queue, 0 when it isn't waiting"""
+        for i, (queued, _) in enumerate(self._queue):
+            if queued is key:
+                return i + 1
+        return 0
+
+    def cancel(self, key):
+        """Fail the waiting `acquire` calls of `key` with `AdmissionCancelled`"""
+        for item in [item for item in self._queue if item[0] is key]:
+            self._queue.remove(item)
+            item[1].set_exception(AdmissionCancelled("Pod creation cancelled while queued"))
+        self._observe_state()
+
+    def observe(self, verb, code, seconds):
+        self._samples.append((seconds, code == 0 or code == 429 or code >= 500))
+
+    def adjust(self):
+        samples = []
+        while self._samples:
+            samples.append(self._samples.popleft())
+        if not samples:
+            return
+        error_rate = float(sum(failed for _, failed in samples)) / len(samples)
+        latencies = sorted(seconds for seconds, _ in samples)
+        p90 = latencies[int(len(latencies) * 0.9)]
+        limit = self.limit
+        if error_rate > self.max_error_rate or p90 > self.target_latency:
+            limit = max(self.min_limit, limit // 2)
+        elif self.inflight >= limit:
+            limit = min(self.max_limit, limit + 1)
+        if limit != self.limit:
+            self.log.info("Pod creation limit %d -> %d (API p90 %.2fs, %.1f%% errors)",
+                          self.limit, limit, p90, error_rate * 100)
+            self.limit = limit
+            self._admit()
+
+    def _release(self):
+        self.inflight -= 1
+        # let the callers of the slot's release go on before the next creation
+        IOLoop.current().add_callback(self._admit)
+
+    def _admit(self):
+        while self._queue and self.inflight < self.limit:
+            key, future = self._queue.popleft()
+            if future.done():
+                continue
+            self.inflight += 1
+            future.set_result(_Slot(self))
+        self._observe_state()
+
+    def _observe_state(self):
+        SPAWN_ADMISSION.labels("queued").set(len(self._queue))
+        SPAWN_ADMISSION.labels("inflight").set(self.inflight)
+        SPAWN_ADMISSION.labels("limit").set(self.limit)
@@ -0,0 +1,129 @@
+import logging
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+from tornado.locks import Semaphore
+from tornado.concurrent import Future
+
+from .swagger_client.rest import ApiException
+
+
+class PodDeleter(object):
+    """Delete the pods of many spawners concurrently.
+
+    The deletions asked for during `window` seconds are sent together:
+    pods without a grace period are deleted in batches of `max_batch` with
+    one `deletecollection_namespaced_pod` using a set based selector on the
+    `name` label (`name in (a, b, ...)`), pods with a grace period (that
+    the generated collection call can't pass) with one `V1DeleteOptions`
+    request each. At most `concurrency` delete requests run at once so
+    a mass shutdown doesn't take all the API threads. The pods of each
+    namespace are batched separately. When the collection delete is
+    refused (e.g. a role without the `deletecollection` verb) the pods
+    of the batch, and of every later batch, are deleted one by one.
+
+    Callers asking to `wait` are answered once their pods are gone,
+    watched with one watch per batch.
+    """
+
+    def __init__(self, client, namespace=None, concurrency=10, window=0.1, max_batch=100,
+                 wait_timeout=300, log=None):
+        self.client = client
+        self.namespace = namespace or client.default_namespace
+        self.window = window
+        self.max_batch = max_batch
+        self.wait_timeout = wait_timeout
+        self.log = log or logging.getLogger(__name__)
+        self._semaphore = Semaphore(concurrency)
+        self._pending = []
+        self._collection = True
+
+    def delete(self, name, grace_period=None, wait=False, namespace=None):
+        """Future resolved once the pod is deleted (and gone if `wait`)"""
+        future = Future()
+        if not self._pending:
+            IOLoop.current().call_later(self.window, self._flush)
+        self._pending.append((namespace or self.namespace, name, grace_period, wait, future))
+        return future
+
+    @gen.coroutine
+    def _flush(self):
+        pending, self._pending = self._pending, []
+        by_namespace = {}
+        for namespace, name, grace_period, wait, future in pending:
+            by_namespace.setdefault(namespace, []).append((name, grace_period, wait, future))
+        yield [self._flush_namespace(namespace, items) for namespace, items in by_namespace.items()]
+
+    @gen.coroutine
+    def _flush_namespace(self, namespace, pending):
+        names = sorted({name for name, grace_period, _, _ in pending if grace_period is None})
+        graceful = {(name, grace_period) for name, grace_period, _, _ in pending
+                    if grace_period is not None}
+        batches = [names[i:i + self.max_batch] for i in range(0, len(names), self.max_batch)]
+        self.log.debug("Deleting %d pods in %d requests", len(names) + len(graceful),
+                       len(batches) + len(graceful))
+
+        errors = {}
+        yield [self._delete_batch(namespace, batch, errors) for batch in batches] + \
+              [self._delete(namespace, name, grace_period, errors) for name, grace_period in graceful]
+
+        waiting = sorted({name for name, _, wait, _ in pending if wait and name not in errors})
+        batches = [waiting[i:i + self.max_batch] for i in range(0, len(waiting), self.max_batch)]
+        yield [self._wait(namespace, batch, errors) for batch in batches]
+
+        for name, _, _, future in pending:
+            if future.done():
+                continue
+            if name in errors:
+                future.set_exception(errors[name])
+            else:
+                future.set_result(None)
+
+    @gen.coroutine
+    def _delete_batch(self, namespace, names, errors):
+        if len(names) > 1 and self._collection:
+            with (yield self._semaphore.acquire()):
+                try:
+                    yield self.client.delete_pods(selector(names), namespace=namespace)
+                    return
+                except ApiException as e:
+                    if e.transient:
+                        self.log.error("Deleting %d pods failed: %s", len(names), e)
+                        for name in names:
+                            errors[name] = e
+                        return
+                    self.log.warning("Deleting a collection of pods is refused (%s), "
+                                     "deleting the pods one by one", e.status)
+                    self._collection = False
+                except Exception as e:
+                    self.log.error("Deleting %d pods failed: %s", len(names), e)
+                    for name in names:
+                        errors[name] = e
+                    return
+        yield [self._delete(namespace, name, None, errors) for name in names]
+
+    @gen.coroutine
+    def _delete(self, namespace, name, grace_period, errors):
+        with (yield self._semaphore.acquire()):
+            try:
+                yield self.client.delete_pod(name, namespace=namespace,
+                                             grace_period_seconds=grace_period)
+            except ApiException as e:
+                if e.status != 404:
+                    errors[name] = e
+            except Exception as e:
+                errors[name] = e
+
+    @gen.coroutine
+    def _wait(self, namespace, names, errors):
+        try:
+            yield self.client.wait_for_pods_deleted(selector(names), namespace=namespace,
+                                                    timeout=self.wait_timeout)
+        except Exception as e:
+            for name in names:
+                errors[name] = e
+
+
+def selector(names):
+    """Label selector of the pods named `names` (see `Pod`)"""
+    return "name in ({})".format(",".join(names))
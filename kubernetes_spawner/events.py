@@ -0,0 +1,208 @@
+import time
+import logging
+import calendar
+import threading
+
+from tornado.ioloop import IOLoop
+from tornado.concurrent import Future
+
+from .metrics import SPAWN_EVENT_SECONDS
+from .swagger_client.rest import ApiException
+
+# reasons of the kubelet and scheduler events on the way to a running container
+SPAWN_EVENTS = ("Scheduled", "Pulling", "Pulled", "Created", "Started")
+
+
+def event_time(event):
+    """Seconds since the epoch of the last occurrence of an event, None when it has no timestamp"""
+    timestamp = event.last_timestamp or event.first_timestamp
+    if not timestamp:
+        return None
+    return calendar.timegm(time.strptime(timestamp, "%Y-%m-%dT%H:%M:%SZ"))
+
+
+class SpawnEvents(object):
+    """Events of a pod being spawned, filled by `EventWatcher`.
+
+    `times` are the seconds after `started` at which each event reason was
+    first seen, `failure` is a future resolved with the `(reason, message)`
+    of the first event of one of the failure reasons of the watcher (and
+    never otherwise).
+
+    Only the events of the pod `uid` are recorded, the ones received before
+    it is known (the pod may be created after tracking starts) are kept in
+    `pending` until then. A `reused` pod (patched or replaced) also has the
+    events of its previous runs.
+    """
+
+    def __init__(self, namespace, name):
+        self.namespace = namespace
+        self.name = name
+        self.started = time.time()
+        self.uid = None
+        self.reused = False
+        self.pending = []
+        self.times = {}
+        self.last_message = None
+        self.warnings = []
+        self.failure = Future()
+
+    def timeline(self):
+        """`Scheduled +0.10s, Pulling +0.21s, ...`, in order"""
+        return ", ".join("{} +{:.2f}s".format(reason, seconds)
+                         for reason, seconds in sorted(self.times.items(), key=lambda item: item[1]))
+
+
+class EventWatcher(object):
+    """Shared watch of the pod events, attributed to the spawns being tracked.
+
+    Lists the events once for a `resourceVersion` and then watches the pod
+    events (`involvedObject.kind=Pod`) of a namespace, or of all the
+    namespaces, from a daemon thread. Events of the pods `track`ed are
+    recorded in their `SpawnEvents` once the pod uid is `attach`ed, the
+    others (of a previous pod of the same name) are dropped, as well as
+    the events of a reused pod last seen more than `clock_skew` seconds
+    before the spawn started (of its previous runs, the event timestamps
+    are of the apiserver clock): the first time of each reason, the
+    warnings, and an event of a `failure_reasons` reason resolves the
+    `failure` future so the spawn can stop waiting.
+
+    A failing watch is retried after `retry_delay` seconds, doubled after
+    each failure up to `max_retry_delay`, and only logged as a warning
+    the first time (e.g. 403 without permission to watch the events).
+    """
+
+    def __init__(self, client, namespace=None, all_namespaces=False,
+                 failure_reasons=("Failed", "InspectFailed", "ErrImageNeverPull"),
+                 watch_timeout=300, retry_delay=5, max_retry_delay=300, clock_skew=5, log=None):
+        self.client = client
+        self.namespace = None if all_namespaces else namespace or client.default_namespace
+        self.failure_reasons = frozenset(failure_reasons)
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.clock_skew = clock_skew
+        self.log = log or logging.getLogger(__name__)
+
+        self.resource_version = None
+        self._tracked = {}
+        self._lock = threading.Lock()
+        self._loop = None
+        self._stopping = threading.Event()
+        self._thread = None
+
+    def track(self, namespace, name):
+        """Start recording the events of a pod, before creating it"""
+        spawn = self._tracked[namespace, name] = SpawnEvents(namespace, name)
+        return spawn
+
+    def attach(self, spawn, uid, reused=False):
+        """Record the events of the pod `uid` in `spawn`, the ones already received too"""
+        with self._lock:
+            spawn.uid = uid
+            spawn.reused = reused
+            pending, spawn.pending = spawn.pending, []
+        for event, received in pending:
+            if event.involved_object.uid == uid:
+                self._record(spawn, event, received)
+
+    def untrack(self, spawn):
+        if self._tracked.get((spawn.namespace, spawn.name)) is spawn:
+            del self._tracked[spawn.namespace, spawn.name]
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._loop = IOLoop.current()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="event-watch")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._thread = None
+
+    def _run(self):
+        failures = 0
+        while not self._stopping.is_set():
+            try:
+                if self.resource_version is None:
+                    self._list()
+                self._watch()
+                failures = 0
+            except Exception as e:
+                delay = min(self.retry_delay * 2 ** failures, self.max_retry_delay)
+                if failures:
+                    self.log.debug("Watch of the pod events failed again, retrying in %ss: %s", delay, e)
+                elif isinstance(e, ApiException):
+                    self.log.warning("Watch of the pod events failed: %s %s, retrying in %ss",
+                                     e.status, e.reason, delay)
+                else:
+                    self.log.warning("Watch of the pod events failed, retrying in %ss", delay, exc_info=True)
+                failures += 1
+                self._stopping.wait(delay)
+
+    def _list(self):
+        # only for the resourceVersion, the past events are of no spawn
+        kwargs = {"field_selector": "involvedObject.kind=Pod"}
+        if self.namespace is None:
+            event_list = self.client.api.list_event(**kwargs)
+        else:
+            event_list = self.client.api.list_namespaced_event(self.namespace, **kwargs)
+        self.resource_version = event_list.metadata.resource_version
+
+    def _watch(self):
+        method = "watch_event_list" if self.namespace is None else "watch_namespaced_event_list"
+        events = self.client.watch(method, resource_version=self.resource_version,
+                                   namespace=self.namespace,
+                                   field_selector="involvedObject.kind=Pod",
+                                   timeout_seconds=self.watch_timeout)
+        for event_type, event in events:
+            if self._stopping.is_set():
+                return
+            if event_type == "ERROR":
+                if event.get("code") == 410:
+                    self.resource_version = None
+                    return
+                raise Exception("Event watch error: {}".format(event.get("message")))
+            if event_type != "DELETED":
+                self._handle(event)
+        self.resource_version = events.resource_version or self.resource_version
+
+    def _handle(self, event):
+        obj = event.involved_object
+        spawn = self._tracked.get((obj.namespace, obj.name))
+        if spawn is None:
+            return
+        with self._lock:
+            if spawn.uid is None:
+                spawn.pending.append((event, time.time()))
+                return
+        if obj.uid == spawn.uid:
+            self._record(spawn, event, time.time())
+
+    def _record(self, spawn, event, received):
+        if spawn.reused:
+            # timestamps are in whole seconds
+            last_seen = event_time(event)
+            if last_seen is not None and last_seen < int(spawn.started) - self.clock_skew:
+                return
+        obj = event.involved_object
+        seconds = received - spawn.started
+        reason = event.reason
+        spawn.last_message = event.message
+        if reason not in spawn.times:
+            spawn.times[reason] = seconds
+            if reason in SPAWN_EVENTS:
+                SPAWN_EVENT_SECONDS.labels(reason).observe(seconds)
+        if event.type == "Warning":
+            spawn.warnings.append("{}: {}".format(reason, event.message))
+            self.log.warning("Pod '%s' %s: %s", obj.name, reason, event.message)
+        if reason in self.failure_reasons:
+            self._loop.add_callback(self._fail, spawn, reason, event.message)
+
+    @staticmethod
+    def _fail(spawn, reason, message):
+        if not spawn.failure.done():
+            spawn.failure.set_result((reason, message))
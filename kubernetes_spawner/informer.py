@@ -0,0 +1,150 @@
+import time
+import logging
+import threading
+
+from .store import PodStore
+from .swagger_client.rest import ApiException
+
+
+class PodInformer(object):
+    """In memory cache of the pods of a namespace, or of all the namespaces.
+
+    Does one `list_namespaced_pod` (`list_pod` with `all_namespaces`) and
+    then keeps the cache up to date by streaming `watch_namespaced_pod_list`
+    (`watch_pod_list`) events from the `resourceVersion` of the list.
+    When a watch ends it is reopened from the last seen `resourceVersion`,
+    when the apiserver says that version is gone (410) or every
+    `resync_period` seconds the pods are listed again.
+
+    The cache is a `PodStore` (see `by_index` for its indexes), maintained
+    from a daemon thread and shared by all the spawners of the process.
+    A failing list or watch is retried after `retry_delay` seconds, doubled
+    after each failure up to `max_retry_delay`, and only logged as a
+    warning the first time (e.g. 403 without permission to list the pods).
+    """
+
+    def __init__(self, client, namespace=None, all_namespaces=False, label_selector=None,
+                 watch_timeout=300, resync_period=3600, retry_delay=5, max_retry_delay=300, log=None):
+        self.client = client
+        # None for all the namespaces
+        self.namespace = None if all_namespaces else namespace or client.default_namespace
+        self.label_selector = label_selector
+        self.watch_timeout = watch_timeout
+        self.resync_period = resync_period
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.log = log or logging.getLogger(__name__)
+
+        self.resource_version = None
+        self.store = PodStore()
+        self._synced = threading.Event()
+        self._stopping = threading.Event()
+        self._last_list = 0
+        self._thread = None
+
+    @property
+    def synced(self):
+        return self._synced.is_set()
+
+    def wait_synced(self, timeout=None):
+        return self._synced.wait(timeout)
+
+    def covers(self, namespace):
+        return self.namespace is None or self.namespace == namespace
+
+    def get(self, name, namespace=None):
+        return self.store.get(namespace or self.namespace, name)
+
+    def list(self):
+        return self.store.list()
+
+    def by_index(self, index, value):
+        """Cached pods whose `index` (one of `store.INDEXES`) value is `value`, e.g. `("node", "node-1")`"""
+        return self.store.by_index(index, value)
+
+    def index_values(self, index):
+        """Values of `index` with at least one cached pod, e.g. the nodes running pods"""
+        return self.store.index_values(index)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="pod-informer")
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._thread = None
+
+    def _run(self):
+        failures = 0
+        while not self._stopping.is_set():
+            try:
+                if self.resource_version is None or self._resync_due():
+                    self._list()
+                self._watch()
+                failures = 0
+            except Exception as e:
+                delay = min(self.retry_delay * 2 ** failures, self.max_retry_delay)
+                if failures:
+                    self.log.debug("Pod informer for namespace '%s' failed again, retrying in %ss: %s",
+                                   self.namespace or "*", delay, e)
+                elif isinstance(e, ApiException):
+                    self.log.warning("Pod informer for namespace '%s' failed: %s %s, retrying in %ss",
+                                     self.namespace or "*", e.status, e.reason, delay)
+                else:
+                    self.log.exception("Pod informer for namespace '%s' failed, retrying in %ss",
+                                       self.namespace or "*", delay)
+                failures += 1
+                self._stopping.wait(delay)
+
+    def _resync_due(self):
+        return self.resync_period and time.time() - self._last_list > self.resync_period
+
+    def _list(self):
+        kwargs = {}
+        if self.label_selector:
+            kwargs["label_selector"] = self.label_selector
+        if self.namespace is None:
+            pod_list = self.client.api.list_pod(**kwargs)
+        else:
+            pod_list = self.client.api.list_namespaced_pod(namespace=self.namespace, **kwargs)
+        self.store.replace(pod_list.items or [])
+        self.resource_version = pod_list.metadata.resource_version
+        self._last_list = time.time()
+        self._synced.set()
+        self.log.debug("Pod informer listed %d pods at resourceVersion %s",
+                       len(self.store), self.resource_version)
+
+    def _watch(self):
+        if self.namespace is None:
+            events = self.client.watch("watch_pod_list", resource_version=self.resource_version,
+                                       label_selector=self.label_selector,
+                                       timeout_seconds=self.watch_timeout)
+        else:
+            events = self.client.watch_pods(namespace=self.namespace,
+                                            resource_version=self.resource_version,
+                                            label_selector=self.label_selector,
+                                            timeout_seconds=self.watch_timeout)
+        for event_type, obj in events:
+            if self._stopping.is_set():
+                return
+            if event_type == "ERROR":
+                if obj.get("code") == 410:
+                    # resourceVersion too old, start over with a fresh list
+                    self.log.debug("Pod informer resourceVersion %s expired", self.resource_version)
+                    self.resource_version = None
+                    return
+                raise Exception("Pod watch error: {}".format(obj.get("message")))
+            self._handle(event_type, obj)
+        # bookmarks move the resourceVersion without any pod change
+        self.resource_version = events.resource_version or self.resource_version
+
+    def _handle(self, event_type, pod):
+        if event_type == "DELETED":
+            self.store.delete(pod.metadata.namespace, pod.metadata.name)
+        else:
+            self.store.update(pod)
+        self.resource_version = pod.metadata.resource_version
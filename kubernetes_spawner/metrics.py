@@ -0,0 +1,140 @@
+"""Prometheus metrics of the spawner and of its Kubernetes API requests.
+
+The metrics are registered in the default `prometheus_client` registry,
+the one served by the hub at `/hub/metrics`.
+`prometheus_client` is optional, without it the metrics do nothing.
+"""
+
+try:
+    from prometheus_client import Counter, Gauge, Histogram
+except ImportError:
+    Counter = Gauge = Histogram = None
+
+
+class _NoMetric(object):
+    """Stand-in for the metrics when `prometheus_client` is not installed"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value):
+        pass
+
+    def inc(self, amount=1):
+        pass
+
+    def set(self, value):
+        pass
+
+    def set_function(self, f):
+        pass
+
+
+if Histogram is None:
+    Counter = Gauge = Histogram = _NoMetric
+
+
+SPAWN_BUCKETS = (0.5, 1, 2.5, 5, 10, 15, 30, 60, 120, 300, 600, float("inf"))
+
+SPAWN_DURATION_SECONDS = Histogram(
+    "kubernetes_spawner_spawn_duration_seconds",
+    "Seconds spent in each phase of starting a new pod: "
+    "queue (waiting for the admission of the create), api_create (create request), scheduling (until assigned to a node), "
+    "image_pull (until the containers run), ready (until the containers are ready) "
+    "and total",
+    ["phase"],
+    buckets=SPAWN_BUCKETS,
+)
+
+SPAWN_EVENT_SECONDS = Histogram(
+    "kubernetes_spawner_spawn_event_seconds",
+    "Seconds from the pod creation to the first event of each reason: "
+    "Scheduled, Pulling, Pulled, Created and Started",
+    ["event"],
+    buckets=SPAWN_BUCKETS,
+)
+
+SPAWN_FAILURES = Counter(
+    "kubernetes_spawner_spawn_failures_total",
+    "New pods that won't become ready by reason: phase of a finished pod, Deleted, Unschedulable, "
+    "waiting reason of a container (e.g. ImagePullBackOff) or reason of a failure event",
+    ["reason"],
+)
+
+OPERATION_DURATION_SECONDS = Histogram(
+    "kubernetes_spawner_operation_duration_seconds",
+    "Seconds taken by the spawner operations (launch_pod, wait_for_new_pod, poll, hub_api_url, stop)",
+    ["operation"],
+)
+
+API_REQUEST_DURATION_SECONDS = Histogram(
+    "kubernetes_spawner_api_request_duration_seconds",
+    "Seconds until the apiserver response headers, by HTTP verb",
+    ["verb"],
+)
+
+API_REQUESTS = Counter(
+    "kubernetes_spawner_api_requests_total",
+    "Kubernetes API requests by HTTP verb and status code (0 when there was no response)",
+    ["verb", "code"],
+)
+
+API_CONNECTIONS = Gauge(
+    "kubernetes_spawner_api_connection_reuse",
+    "Requests sent on a kept alive connection (hits) and connections opened (misses)",
+    ["result"],
+)
+
+API_RETRIES = Counter(
+    "kubernetes_spawner_api_retries_total",
+    "Kubernetes API requests sent again, by HTTP verb and status code of the failure",
+    ["verb", "code"],
+)
+
+API_CIRCUIT_OPEN = Gauge(
+    "kubernetes_spawner_api_circuit_open",
+    "1 while the requests fail fast because the Kubernetes API keeps failing",
+)
+
+POLLS = Counter(
+    "kubernetes_spawner_polls_total",
+    "Pod lookups of poll by source: informer (in memory cache) or api (batched request)",
+    ["source"],
+)
+
+WARM_POOL_CLAIMS = Counter(
+    "kubernetes_spawner_warm_pool_claims_total",
+    "Starts that claimed a warm pod (hit) or had to create one (miss)",
+    ["result"],
+)
+
+WARM_POOL_AVAILABLE = Gauge(
+    "kubernetes_spawner_warm_pool_available",
+    "Ready warm pods waiting to be claimed",
+)
+
+SPAWN_ADMISSION = Gauge(
+    "kubernetes_spawner_admission",
+    "Spawns waiting to create their pod (queued), creating it (inflight) and the current limit of creations",
+    ["state"],
+)
+
+PREPULL_NODES = Gauge(
+    "kubernetes_spawner_prepull_nodes",
+    "Nodes of the last pre-pull of an image by state: pulling, pulled or failed",
+    ["image", "state"],
+)
+
+
+def observe_api_request(verb, code, seconds):
+    API_REQUEST_DURATION_SECONDS.labels(verb).observe(seconds)
+    API_REQUESTS.labels(verb, str(code)).inc()
+
+
+def track_connections(client):
+    """Export the connection reuse counters of a `KubernetesClient`"""
+    API_CONNECTIONS.labels("hits").set_function(lambda: client.pool_stats()["hits"])
+    API_CONNECTIONS.labels("misses").set_function(lambda: client.pool_stats()["misses"])
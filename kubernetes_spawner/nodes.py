@@ -0,0 +1,97 @@
+import copy
+import logging
+
+from tornado import gen
+from tornado.ioloop import IOLoop, PeriodicCallback
+
+from .swagger_client.rest import ApiException
+
+HOSTNAME_LABEL = "kubernetes.io/hostname"
+
+
+def normalize_image(image):
+    """Canonical form of an image reference, `jupyterhub/singleuser:latest`
+    for `docker.io/jupyterhub/singleuser`"""
+    if "@" not in image and ":" not in image.rsplit("/", 1)[-1]:
+        image += ":latest"
+    for prefix in ("docker.io/", "index.docker.io/", "library/"):
+        if image.startswith(prefix):
+            image = image[len(prefix):]
+    return image
+
+
+def node_is_schedulable(node):
+    if node.spec is not None and node.spec.unschedulable:
+        return False
+    conditions = node.status.conditions if node.status else None
+    return any(c.type == "Ready" and c.status == "True" for c in conditions or [])
+
+
+def prefer_nodes(affinity, hostnames, weight):
+    """Copy of the `affinity` JSON that prefers the nodes `hostnames`"""
+    affinity = copy.deepcopy(affinity) if affinity else {}
+    node_affinity = affinity.setdefault("nodeAffinity", {})
+    preferred = node_affinity.setdefault("preferredDuringSchedulingIgnoredDuringExecution", [])
+    preferred.append({
+        "weight": weight,
+        "preference": {"matchExpressions": [
+            {"key": HOSTNAME_LABEL, "operator": "In", "values": list(hostnames)},
+        ]},
+    })
+    return affinity
+
+
+class ImageLocality(object):
+    """Which nodes already have which images.
+
+    The nodes are listed every `refresh_interval` seconds, the images of
+    `V1NodeStatus.images` of the ready and schedulable nodes are indexed by
+    their (normalized) tags. `hostnames(image)` gives the hostname labels
+    of the nodes holding an image, at most `max_nodes` of them.
+    """
+
+    def __init__(self, client, refresh_interval=60, max_nodes=100, log=None):
+        self.client = client
+        self.refresh_interval = refresh_interval
+        self.max_nodes = max_nodes
+        self.log = log or logging.getLogger(__name__)
+        self._nodes_by_image = {}
+        self._callback = None
+        self._failed = False
+
+    def start(self):
+        if self._callback is None:
+            IOLoop.current().add_callback(self.refresh)
+            self._callback = PeriodicCallback(self.refresh, self.refresh_interval * 1000)
+            self._callback.start()
+
+    def stop(self):
+        if self._callback is not None:
+            self._callback.stop()
+            self._callback = None
+
+    def hostnames(self, image):
+        return self._nodes_by_image.get(normalize_image(image), [])[:self.max_nodes]
+
+    @gen.coroutine
+    def refresh(self):
+        try:
+            node_list = yield self.client.list_nodes()
+        except ApiException as e:
+            # e.g. 403 without permission to list the nodes, don't spam the logs
+            log = self.log.debug if self._failed else self.log.warning
+            log("Could not list the nodes for image locality: %s %s", e.status, e.reason)
+            self._failed = True
+            return
+        nodes_by_image = {}
+        for node in node_list.items or []:
+            if not node_is_schedulable(node):
+                continue
+            labels = node.metadata.labels or {}
+            hostname = labels.get(HOSTNAME_LABEL, node.metadata.name)
+            for image in (node.status.images if node.status else None) or []:
+                for tag in image.repo_tags or []:
+                    nodes_by_image.setdefault(normalize_image(tag), set()).add(hostname)
+        self._nodes_by_image = {image: sorted(nodes) for image, nodes in nodes_by_image.items()}
+        self._failed = False
+        self.log.debug("Indexed %d images on %d nodes", len(nodes_by_image), len(node_list.items or []))
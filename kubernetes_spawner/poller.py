@@ -0,0 +1,63 @@
+import logging
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+from tornado.concurrent import Future
+
+
+class BatchPoller(object):
+    """Answer the pod lookups of many spawners with one list request.
+
+    The names asked for during `window` seconds are collected and fetched
+    with a single `list_namespaced_pod` using a set based selector on the
+    `name` label that `Pod` sets (`name in (a, b, ...)`), at most
+    `max_batch` names per request and one request per namespace.
+    Each caller gets a future resolved with its `V1Pod`, or None, or the
+    error of the request.
+    """
+
+    def __init__(self, client, namespace=None, window=0.5, max_batch=100, log=None):
+        self.client = client
+        self.namespace = namespace or client.default_namespace
+        self.window = window
+        self.max_batch = max_batch
+        self.log = log or logging.getLogger(__name__)
+        self._pending = {}
+
+    def get_pod(self, name, namespace=None):
+        future = Future()
+        if not self._pending:
+            IOLoop.current().call_later(self.window, self._flush)
+        self._pending.setdefault((namespace or self.namespace, name), []).append(future)
+        return future
+
+    @gen.coroutine
+    def _flush(self):
+        pending, self._pending = self._pending, {}
+        by_namespace = {}
+        for namespace, name in sorted(pending):
+            by_namespace.setdefault(namespace, []).append(name)
+        batches = [(namespace, names[i:i + self.max_batch])
+                   for namespace, names in by_namespace.items()
+                   for i in range(0, len(names), self.max_batch)]
+        self.log.debug("Batch poll of %d pods in %d requests", len(pending), len(batches))
+        yield [self._fetch(namespace, batch, pending) for namespace, batch in batches]
+
+    @gen.coroutine
+    def _fetch(self, namespace, names, pending):
+        selector = "name in ({})".format(",".join(names))
+        try:
+            pod_list = yield self.client.list_pods(namespace=namespace, label_selector=selector)
+            pods = {pod.metadata.name: pod for pod in pod_list.items or []}
+        except Exception as e:
+            # a failed list says nothing about the pods, don't report them as gone
+            self.log.warning("Batch poll of %d pods failed", len(names))
+            for name in names:
+                for future in pending[namespace, name]:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+        for name in names:
+            for future in pending[namespace, name]:
+                if not future.done():
+                    future.set_result(pods.get(name))
@@ -0,0 +1,217 @@
+import json
+import time
+import uuid
+import hashlib
+import logging
+
+from tornado import gen
+from tornado.ioloop import IOLoop, PeriodicCallback
+
+from .kube import pod_is_ready, pod_is_terminal, json_pointer
+from .metrics import WARM_POOL_AVAILABLE
+from .swagger_client.rest import ApiException
+
+POOL_LABEL = "pool"
+POOL_STATE_LABEL = "pool-state"
+POOL_IMAGE_LABEL = "pool-image"
+IMAGE_ANNOTATION = "pool-image"
+CREATED_ANNOTATION = "pool-created"
+ENV_ANNOTATION = "jupyterhub-env"
+
+
+def image_label(image):
+    """Label safe identifier of an image name"""
+    return hashlib.sha1(image.encode("utf8")).hexdigest()[:16]
+
+
+class WarmPodPool(object):
+    """Pre-started single user pods waiting to be claimed by a user.
+
+    The pool pods are labeled `pool=<name>`, `pool-state=available` and are
+    built by `build_pod(name, image)` without any user specific setting.
+    A user claims a ready pod with one JSON patch that flips `pool-state` to
+    `claimed` (guarded by a `test` op so a pod is never claimed twice), adds
+    the user labels and writes the user environment as JSON in the
+    `jupyterhub-env` annotation for the pod startup script to pick up.
+
+    The pool is refilled every `refill_interval` seconds and after each claim:
+    pods older than `max_age` seconds or of images no longer used are
+    deleted and new ones are created so there are `size` pods across the
+    images in use, at most `max_per_image` (0 for no limit) of each.
+    The pool pods are read from the informer cache when it has them, the
+    pods created and not in the cache yet are counted apart.
+    """
+
+    def __init__(self, client, build_pod, name, size, max_age=3600, max_per_image=0,
+                 refill_interval=30, namespace=None, log=None):
+        self.client = client
+        self.build_pod = build_pod
+        self.name = name
+        self.size = size
+        self.max_age = max_age
+        self.max_per_image = max_per_image
+        self.refill_interval = refill_interval
+        self.namespace = namespace or client.default_namespace
+        self.log = log or logging.getLogger(__name__)
+
+        self.images = set()
+        # name -> (image, creation time) of the pods created and not seen in the informer cache yet
+        self._created = {}
+        self._available = {}
+        self._refilling = False
+        self._callback = None
+
+    def start(self, image):
+        if image not in self.images:
+            self.images.add(image)
+            IOLoop.current().add_callback(self.refill)
+        if self._callback is None:
+            self._callback = PeriodicCallback(self.refill, self.refill_interval * 1000)
+            self._callback.start()
+
+    def stop(self):
+        if self._callback is not None:
+            self._callback.stop()
+            self._callback = None
+
+    def target(self, image):
+        """Number of warm pods wanted for an image"""
+        images = sorted(self.images)
+        if image not in images:
+            return 0
+        share, extra = divmod(self.size, len(images))
+        target = share + (1 if images.index(image) < extra else 0)
+        if self.max_per_image:
+            target = min(target, self.max_per_image)
+        return target
+
+    @gen.coroutine
+    def claim(self, image, labels, env):
+        """Claim a ready pod of `image`, returns the patched `V1Pod` or None.
+
+        The available pods are the ones of the last refill, a claimed pod
+        that is no longer ready is deleted and the next one is tried.
+        """
+        self.start(image)
+        available = self._available.get(image, [])
+        while available:
+            pod = available.pop(0)
+            name = pod.metadata.name
+            try:
+                pod = yield self.client.patch_pod(name, self._claim_patch(labels, env),
+                                                  namespace=self.namespace)
+            except ApiException as e:
+                # claimed by someone else, or gone since the last refill
+                self.log.debug("Could not claim pool pod '%s': %s", name, e.status)
+                continue
+            if pod_is_terminal(pod) or not pod_is_ready(pod):
+                self.log.info("Claimed pool pod '%s' is not ready, deleting it", name)
+                IOLoop.current().add_callback(self._delete, name)
+                continue
+            WARM_POOL_AVAILABLE.set(self.available)
+            IOLoop.current().add_callback(self.refill)
+            return pod
+        return None
+
+    @property
+    def available(self):
+        """Number of ready pods waiting to be claimed"""
+        return sum(len(pods) for pods in self._available.values())
+
+    def _claim_patch(self, labels, env):
+        patch = [
+            {"op": "test", "path": json_pointer("metadata", "labels", POOL_STATE_LABEL),
+             "value": "available"},
+            {"op": "replace", "path": json_pointer("metadata", "labels", POOL_STATE_LABEL),
+             "value": "claimed"},
+            {"op": "add", "path": json_pointer("metadata", "annotations", ENV_ANNOTATION),
+             "value": json.dumps(env)},
+        ]
+        for key, value in labels.items():
+            patch.append({"op": "add", "path": json_pointer("metadata", "labels", key),
+                          "value": value})
+        return patch
+
+    @gen.coroutine
+    def refill(self):
+        if self._refilling:
+            return
+        self._refilling = True
+        try:
+            yield self._refill()
+        except Exception:
+            self.log.exception("Failed to refill the warm pod pool")
+        finally:
+            self._refilling = False
+
+    @gen.coroutine
+    def _pool_pods(self):
+        """The available pool pods"""
+        informer = self.client.informer
+        if informer is None or not informer.synced or not informer.covers(self.namespace):
+            selector = "{}={},{}=available".format(POOL_LABEL, self.name, POOL_STATE_LABEL)
+            pod_list = yield self.client.list_pods(namespace=self.namespace, label_selector=selector)
+            self._created.clear()
+            return pod_list.items or []
+        pods = [pod for pod in informer.by_index("pool", self.name) if pod.metadata.namespace == self.namespace]
+        now = time.time()
+        seen = {pod.metadata.name for pod in pods}
+        self._created = {name: created for name, created in self._created.items()
+                         if name not in seen and now - created[1] < 2 * self.refill_interval}
+        return [pod for pod in pods if pod.metadata.labels.get(POOL_STATE_LABEL) == "available"]
+
+    @gen.coroutine
+    def _refill(self):
+        pods = yield self._pool_pods()
+        now = time.time()
+        by_image = {}
+        expired = []
+        for pod in pods:
+            annotations = pod.metadata.annotations or {}
+            image = annotations.get(IMAGE_ANNOTATION)
+            age = now - float(annotations.get(CREATED_ANNOTATION, 0))
+            phase = pod.status.phase if pod.status else None
+            if image not in self.images or age > self.max_age or phase in ("Failed", "Succeeded", "Unknown"):
+                expired.append(pod)
+            else:
+                by_image.setdefault(image, []).append(pod)
+
+        for image in self.images:
+            pods = by_image.get(image, [])
+            # drop the surplus, e.g. after the pool size was lowered
+            target = self.target(image)
+            expired.extend(pods[target:])
+            pods = pods[:target]
+            ready = [pod for pod in pods if pod_is_ready(pod)]
+            self._available[image] = sorted(ready, key=lambda pod: pod.metadata.annotations[CREATED_ANNOTATION])
+            missing = target - len(pods) - sum(1 for created_image, _ in self._created.values()
+                                               if created_image == image)
+            if missing > 0:
+                self.log.debug("Creating %d warm pods for image '%s'", missing, image)
+                yield [self._create(image) for _ in range(missing)]
+        WARM_POOL_AVAILABLE.set(self.available)
+
+        if expired:
+            self.log.debug("Deleting %d expired warm pods", len(expired))
+            yield [self.client.delete_pod(pod.metadata.name, namespace=self.namespace)
+                   for pod in expired]
+
+    @gen.coroutine
+    def _delete(self, name):
+        try:
+            yield self.client.delete_pod(name, namespace=self.namespace)
+        except ApiException as e:
+            if e.status != 404:
+                self.log.warning("Failed to delete pool pod '%s': %s", name, e)
+
+    @gen.coroutine
+    def _create(self, image):
+        name = "{}-{}".format(self.name, uuid.uuid4().hex[:8])
+        pod = self.build_pod(name, image)
+        pod.add_label(POOL_LABEL, self.name)
+        pod.add_label(POOL_STATE_LABEL, "available")
+        pod.add_label(POOL_IMAGE_LABEL, image_label(image))
+        pod.add_annotation(IMAGE_ANNOTATION, image)
+        pod.add_annotation(CREATED_ANNOTATION, str(time.time()))
+        yield self.client.launch_pod(pod, namespace=self.namespace)
+        self._created[name] = (image, time.time())
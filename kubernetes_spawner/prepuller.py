@@ -0,0 +1,218 @@
+import time
+import uuid
+import logging
+
+from tornado import gen
+from tornado.ioloop import IOLoop, PeriodicCallback
+
+from .kube import Pod, BaseContainer
+from .metrics import PREPULL_NODES
+from .nodes import normalize_image, node_is_schedulable
+from .pool import image_label
+from .swagger_client.rest import ApiException
+
+PREPULL_LABEL = "prepull"
+PREPULL_IMAGE_LABEL = "prepull-image"
+
+PULLING = "pulling"
+PULLED = "pulled"
+FAILED = "failed"
+
+# waiting reasons after which the kubelet only retries with a back off
+PULL_FAILURES = ("ImagePullBackOff", "InvalidImageName", "ErrImageNeverPull")
+
+
+def pull_state(pod):
+    """`PULLING`, `PULLED` or `FAILED` state of a puller pod"""
+    status = pod.status
+    if status is None:
+        return PULLING
+    for container in status.container_statuses or []:
+        state = container.state
+        if state is None:
+            continue
+        # the container started (or could not run), either way the image is on the node
+        if state.running is not None or state.terminated is not None:
+            return PULLED
+        if state.waiting is not None and state.waiting.reason in PULL_FAILURES:
+            return FAILED
+    if status.phase == "Succeeded":
+        return PULLED
+    if status.phase == "Failed":
+        return FAILED
+    return PULLING
+
+
+class ImagePrePuller(object):
+    """Pulls images on every node ahead of the users.
+
+    `pull(images)` lists the ready and schedulable nodes matching
+    `node_selector` and, for each image a node does not have yet, creates
+    a short-lived pod pinned to the node (`spec.nodeName`) that runs
+    `command` in the image. The puller pods are labeled `prepull=<name>`
+    and are listed every `poll_interval` seconds: a pod whose container
+    started or ran has pulled its image, one waiting on an image pull back
+    off has failed. Finished pods are deleted right away, the remaining
+    ones after `timeout` seconds.
+
+    `status(image)` gives the state of each node for an image and
+    `ready(image)` whether all of them have it, e.g. to hold a new image
+    rollout until it is pre-pulled. With `start(images)` the images are
+    pulled again every `interval` seconds, for the nodes added since.
+    """
+
+    def __init__(self, client, name="jupyterhub-prepull", namespace=None, node_selector=None,
+                 tolerations=None, command=None, timeout=600, poll_interval=5, interval=600,
+                 log=None):
+        self.client = client
+        self.name = name
+        self.namespace = namespace or client.default_namespace
+        self.node_selector = node_selector or {}
+        self.tolerations = tolerations or []
+        self.command = command or ["/bin/sh", "-c", "true"]
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.interval = interval
+        self.log = log or logging.getLogger(__name__)
+
+        self.images = []
+        # image -> {node name -> state}
+        self._status = {}
+        self._pulls = {}
+        self._callback = None
+
+    def start(self, images):
+        self.images = list(images)
+        IOLoop.current().add_callback(self.pull, self.images)
+        if self._callback is None:
+            self._callback = PeriodicCallback(lambda: self.pull(self.images), self.interval * 1000)
+            self._callback.start()
+
+    def stop(self):
+        if self._callback is not None:
+            self._callback.stop()
+            self._callback = None
+
+    def status(self, image):
+        """`{node name: state}` of the last pull of `image`"""
+        return dict(self._status.get(image, {}))
+
+    def ready(self, image):
+        """Whether all the nodes of the last pull of `image` have it"""
+        status = self._status.get(image)
+        return bool(status) and all(state == PULLED for state in status.values())
+
+    def pull(self, images):
+        """Pull `images` on all the nodes, the future gives `{image: {node name: state}}`.
+
+        An image already being pulled is not pulled twice, its current pull is waited for.
+        """
+        futures = {}
+        for image in images:
+            if image not in self._pulls:
+                self._pulls[image] = self._pull(image)
+                IOLoop.current().add_future(self._pulls[image],
+                                            lambda f, image=image: self._pulls.pop(image, None))
+            futures[image] = self._pulls[image]
+        return gen.multi(futures)
+
+    @gen.coroutine
+    def _pull(self, image):
+        try:
+            status = yield self._pull_image(image)
+        except Exception:
+            self.log.exception("Failed to pre-pull image '%s'", image)
+            status = self._status.get(image, {})
+        return status
+
+    @gen.coroutine
+    def _pull_image(self, image):
+        node_list = yield self.client.list_nodes()
+        status = {}
+        for node in node_list.items or []:
+            labels = node.metadata.labels or {}
+            if not node_is_schedulable(node):
+                continue
+            if any(labels.get(key) != value for key, value in self.node_selector.items()):
+                continue
+            images = (node.status.images if node.status else None) or []
+            tags = {normalize_image(tag) for node_image in images for tag in node_image.repo_tags or []}
+            status[node.metadata.name] = PULLED if normalize_image(image) in tags else PULLING
+        self._status[image] = status
+
+        missing = [node for node, state in status.items() if state == PULLING]
+        self.log.info("Pre-pulling image '%s' on %d of %d nodes", image, len(missing), len(status))
+        pods = {}
+        if missing:
+            created = yield [self._create(image, node) for node in missing]
+            pods = {name: node for name, node in zip(created, missing) if name is not None}
+            for node in set(missing) - set(pods.values()):
+                status[node] = FAILED
+
+        selector = "{}={},{}={}".format(PREPULL_LABEL, self.name, PREPULL_IMAGE_LABEL, image_label(image))
+        deadline = time.time() + self.timeout
+        while pods and time.time() < deadline:
+            yield gen.sleep(self.poll_interval)
+            pod_list = yield self.client.list_pods(namespace=self.namespace, label_selector=selector)
+            finished = []
+            for pod in pod_list.items or []:
+                node = pods.get(pod.metadata.name)
+                state = pull_state(pod)
+                if node is not None and state != PULLING:
+                    status[node] = state
+                    finished.append(pod.metadata.name)
+                    if state == FAILED:
+                        self.log.warning("Could not pre-pull image '%s' on node '%s'", image, node)
+            for name in finished:
+                del pods[name]
+            self._observe(image, status)
+            if finished:
+                yield [self._delete(name) for name in finished]
+
+        for name, node in pods.items():
+            self.log.warning("Pre-pulling image '%s' on node '%s' timed out after %ds",
+                             image, node, self.timeout)
+            status[node] = FAILED
+        if pods:
+            yield [self._delete(name) for name in pods]
+        self._observe(image, status)
+        self.log.info("Image '%s' pre-pulled on %d of %d nodes", image,
+                      sum(state == PULLED for state in status.values()), len(status))
+        return dict(status)
+
+    @gen.coroutine
+    def _create(self, image, node):
+        name = "{}-{}".format(self.name, uuid.uuid4().hex[:8])
+        pod = Pod(name)
+        pod.add_label(PREPULL_LABEL, self.name)
+        pod.add_label(PREPULL_IMAGE_LABEL, image_label(image))
+        pod.add_annotation(PREPULL_IMAGE_LABEL, image)
+        pod.spec.node_name = node
+        pod.spec.restart_policy = "Never"
+        if self.tolerations:
+            pod.spec.tolerations = list(self.tolerations)
+        container = BaseContainer("prepull", image)
+        container.set_command(self.command)
+        container.env = []
+        container.set_resources({"cpu": "10m", "memory": "16Mi"}, {"cpu": "100m", "memory": "64Mi"})
+        pod.add_container(container)
+        try:
+            yield self.client.launch_pod(pod, namespace=self.namespace)
+        except ApiException as e:
+            self.log.warning("Could not create the pre-pull pod of image '%s' on node '%s': %s %s",
+                             image, node, e.status, e.reason)
+            return None
+        return name
+
+    @gen.coroutine
+    def _delete(self, name):
+        try:
+            yield self.client.delete_pod(name, namespace=self.namespace, grace_period_seconds=0)
+        except ApiException as e:
+            if e.status != 404:
+                self.log.warning("Could not delete pre-pull pod '%s': %s %s", name, e.status, e.reason)
+
+    def _observe(self, image, status):
+        for state in (PULLING, PULLED, FAILED):
+            PREPULL_NODES.labels(image=image, state=state).set(
+                sum(s == state for s in status.values()))
@@ -0,0 +1,153 @@
+import json
+import time
+import hashlib
+import logging
+
+from tornado import gen
+
+from .kube import pod_is_terminal, json_pointer
+from .metrics import SPAWN_DURATION_SECONDS, OPERATION_DURATION_SECONDS
+
+HASH_ANNOTATION = "pod-hash"
+SPEC_HASH_ANNOTATION = "pod-spec-hash"
+# environment variables that differ on every start without the pod being stale
+VOLATILE_ENV = frozenset(["JPY_API_TOKEN"])
+
+CREATE = "create"
+REUSE = "reuse"
+PATCH = "patch"
+REPLACE = "replace"
+RECREATE = "recreate"
+
+
+def _hash(obj):
+    return hashlib.sha1(json.dumps(obj, sort_keys=True, separators=(",", ":")).encode("utf8")).hexdigest()
+
+
+def manifest_hashes(manifest):
+    """`(hash, spec hash)` of a pod manifest.
+
+    The hash covers the labels, annotations and spec, the spec hash only the
+    part of the spec that can't change on a live pod (everything but the
+    container images). The `VOLATILE_ENV` variables are left out of both.
+    """
+    metadata = manifest["metadata"]
+    annotations = {key: value for key, value in (metadata.get("annotations") or {}).items()
+                   if key not in (HASH_ANNOTATION, SPEC_HASH_ANNOTATION)}
+    spec = dict(manifest["spec"])
+    spec["containers"] = [dict(container, env=[env for env in container.get("env") or []
+                                               if env["name"] not in VOLATILE_ENV])
+                          for container in spec["containers"]]
+    spec_hash = _hash(dict(spec, containers=[dict(container, image=None)
+                                             for container in spec["containers"]]))
+    return _hash([metadata.get("labels"), annotations, spec]), spec_hash
+
+
+def annotate(manifest):
+    """Add the `manifest_hashes` annotations to a pod manifest, in place"""
+    pod_hash, spec_hash = manifest_hashes(manifest)
+    manifest["metadata"] = metadata = dict(manifest["metadata"])
+    metadata["annotations"] = dict(metadata.get("annotations") or {})
+    metadata["annotations"][HASH_ANNOTATION] = pod_hash
+    metadata["annotations"][SPEC_HASH_ANNOTATION] = spec_hash
+    return manifest
+
+
+def plan(live, desired):
+    """Action taking the `live` `V1Pod` (or None) to the `desired` annotated manifest.
+
+    `live` must be read from the apiserver, not from the informer cache.
+    `REUSE` when the hashes match, `PATCH` (labels and annotations) or
+    `REPLACE` (container images too) when only the mutable fields changed
+    and `RECREATE` when the spec changed, the pod is done or being deleted.
+    Pods without a spec hash, created before the hashes, are adopted when
+    their container images match.
+    """
+    if live is None:
+        return CREATE
+    if live.metadata.deletion_timestamp or pod_is_terminal(live):
+        # a deleted pod keeps its hashes until it is gone
+        return RECREATE
+    annotations = live.metadata.annotations or {}
+    wanted = desired["metadata"]["annotations"]
+    if annotations.get(HASH_ANNOTATION) == wanted[HASH_ANNOTATION]:
+        return REUSE
+    spec_hash = annotations.get(SPEC_HASH_ANNOTATION)
+    if spec_hash is not None and spec_hash != wanted[SPEC_HASH_ANNOTATION]:
+        return RECREATE
+    live_images = [container.image for container in live.spec.containers or []]
+    images = [container.get("image") for container in desired["spec"]["containers"]]
+    if live_images == images:
+        return PATCH
+    return REPLACE if len(live_images) == len(images) else RECREATE
+
+
+class PodReconciler(object):
+    """Bring the pod of a user to its desired manifest with the fewest changes.
+
+    See `plan`: metadata changes are a JSON patch, image changes replace the
+    live pod (guarded by its `resourceVersion`), the kubelet restarts the
+    changed containers in place. Only a changed spec or a terminal pod is
+    deleted (through `deleter`, waiting for it to be gone) and created again.
+    """
+
+    def __init__(self, client, deleter, namespace=None, log=None):
+        self.client = client
+        self.deleter = deleter
+        self.namespace = namespace or client.default_namespace
+        self.log = log or logging.getLogger(__name__)
+
+    @gen.coroutine
+    def reconcile(self, live, desired, namespace=None):
+        """`(action, pod)`, pod is the updated or created `V1Pod`.
+
+        `live` is the pod as read from the apiserver (`get_pod(live=True)`).
+        """
+        action = plan(live, desired)
+        name = desired["metadata"]["name"]
+        namespace = namespace or self.namespace
+        if action != REUSE:
+            self.log.info("Pod '%s': %s", name, action)
+        if action == REUSE:
+            return action, live
+        if action == PATCH:
+            pod = yield self.client.patch_pod(name, self.patch(live, desired), namespace=namespace)
+            return action, pod
+        if action == REPLACE:
+            pod = yield self.client.replace_pod(name, self.replacement(live, desired),
+                                                namespace=namespace)
+            return action, pod
+        if action == RECREATE:
+            yield self.deleter.delete(name, grace_period=0, wait=True, namespace=namespace)
+        launched = time.time()
+        pod = yield self.client.launch_pod(desired, namespace=namespace)
+        duration = time.time() - launched
+        SPAWN_DURATION_SECONDS.labels("api_create").observe(duration)
+        OPERATION_DURATION_SECONDS.labels("launch_pod").observe(duration)
+        return action, pod
+
+    @staticmethod
+    def patch(live, desired):
+        """JSON patch setting the labels and annotations of `desired` on `live`"""
+        operations = []
+        for field in ("labels", "annotations"):
+            wanted = desired["metadata"].get(field) or {}
+            current = getattr(live.metadata, field)
+            if current is None:
+                operations.append({"op": "add", "path": json_pointer("metadata", field), "value": wanted})
+                continue
+            for key, value in sorted(wanted.items()):
+                if current.get(key) != value:
+                    operations.append({"op": "add", "path": json_pointer("metadata", field, key),
+                                       "value": value})
+        return operations
+
+    def replacement(self, live, desired):
+        """JSON of `live` with the labels, annotations and container images of `desired`"""
+        pod = self.client.client.sanitize_for_serialization(live)
+        metadata = pod["metadata"]
+        for field in ("labels", "annotations"):
+            metadata[field] = dict(metadata.get(field) or {}, **(desired["metadata"].get(field) or {}))
+        for container, wanted in zip(pod["spec"]["containers"], desired["spec"]["containers"]):
+            container["image"] = wanted["image"]
+        return pod
@@ -0,0 +1,54 @@
+import re
+
+# profile key -> (requirement, resource)
+RESOURCE_KEYS = {
+    "cpu_request": ("requests", "cpu"),
+    "cpu_limit": ("limits", "cpu"),
+    "memory_request": ("requests", "memory"),
+    "memory_limit": ("limits", "memory"),
+}
+
+QUANTITY = re.compile(r"^([0-9]+(?:\.[0-9]*)?|\.[0-9]+)(m|k|M|G|T|P|E|Ki|Mi|Gi|Ti|Pi|Ei)?$")
+
+SUFFIXES = {
+    None: 1, "m": 1e-3,
+    "k": 1e3, "M": 1e6, "G": 1e9, "T": 1e12, "P": 1e15, "E": 1e18,
+    "Ki": 2 ** 10, "Mi": 2 ** 20, "Gi": 2 ** 30, "Ti": 2 ** 40, "Pi": 2 ** 50, "Ei": 2 ** 60,
+}
+
+
+def parse_quantity(quantity):
+    """Value of a Kubernetes quantity (e.g. "250m" or "1Gi"), raises `ValueError`"""
+    match = QUANTITY.match(str(quantity))
+    if match is None:
+        raise ValueError("Invalid Kubernetes quantity {!r}".format(quantity))
+    return float(match.group(1)) * SUFFIXES[match.group(2)]
+
+
+def validate_profile(name, profile):
+    """Check the keys and quantities of a resource profile, raises `ValueError`"""
+    if not isinstance(profile, dict):
+        raise ValueError("Resource profile {!r} must be a dict".format(name))
+    unknown = set(profile) - set(RESOURCE_KEYS)
+    if unknown:
+        raise ValueError("Resource profile {!r} has unknown keys {}, expected {}".format(
+            name, sorted(unknown), sorted(RESOURCE_KEYS)))
+    for key, value in profile.items():
+        if value:
+            parse_quantity(value)
+    for resource in ("cpu", "memory"):
+        request = profile.get(resource + "_request")
+        limit = profile.get(resource + "_limit")
+        if request and limit and parse_quantity(request) > parse_quantity(limit):
+            raise ValueError("Resource profile {!r} requests more {} ({}) than its limit ({})".format(
+                name, resource, request, limit))
+
+
+def requirements(profile):
+    """`V1ResourceRequirements` JSON of a resource profile, empty values are left unset"""
+    result = {"requests": {}, "limits": {}}
+    for key, value in profile.items():
+        if value:
+            requirement, resource = RESOURCE_KEYS[key]
+            result[requirement][resource] = str(value)
+    return result
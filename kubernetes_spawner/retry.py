@@ -0,0 +1,107 @@
+import time
+import random
+import logging
+import threading
+
+from .metrics import API_RETRIES, API_CIRCUIT_OPEN
+from .swagger_client.rest import ApiException
+
+# methods sending the same request twice is harmless for
+IDEMPOTENT_METHODS = frozenset(["GET", "HEAD", "OPTIONS", "PUT", "DELETE"])
+
+
+class RetryPolicy(object):
+    """Retries of the failed Kubernetes API requests, see `RESTClientObject`.
+
+    Transient errors (no response, 429 and 5xx) of idempotent requests are
+    retried up to `max_retries` times after an exponential back off with
+    full jitter: a random delay up to `backoff * 2 ** (attempt - 1)`,
+    capped to `max_backoff` seconds. 429 Too Many Requests means the
+    request was not processed, it is retried whatever its method.
+    A `Retry-After` header is honored, up to `max_retry_after` seconds.
+    """
+
+    def __init__(self, max_retries=3, backoff=0.2, max_backoff=10, max_retry_after=30):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.max_retry_after = max_retry_after
+
+    def delay(self, method, attempt, error):
+        """Seconds to wait before the `attempt`th retry of a request that failed with `error`,
+        None to give up"""
+        if attempt > self.max_retries or not error.transient:
+            return None
+        if error.status != 429 and method not in IDEMPOTENT_METHODS:
+            return None
+        API_RETRIES.labels(method, str(error.status)).inc()
+        retry_after = error.retry_after()
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
+
+
+class CircuitOpenError(ApiException):
+    """Request not sent because the apiserver is considered unhealthy"""
+
+    def __init__(self, retry_in):
+        super(CircuitOpenError, self).__init__(
+            status=0, reason="Circuit open, the Kubernetes API is failing, retry in {:.0f}s".format(retry_in))
+
+
+class CircuitBreaker(object):
+    """Stop sending requests to an apiserver that keeps failing.
+
+    After `failure_threshold` transient errors in a row the circuit opens:
+    for `reset_timeout` seconds the requests fail right away with
+    `CircuitOpenError` instead of adding load to the apiserver. Then a
+    single trial request is let through (half open), its success closes
+    the circuit and its failure opens it again. Any response but a
+    transient error (e.g. 404) counts as a success.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half-open"
+
+    def __init__(self, failure_threshold=5, reset_timeout=30, log=None):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.log = log or logging.getLogger(__name__)
+
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened = 0
+        self._trial = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self._opened + self.reset_timeout - time.time()
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self.state = self.HALF_OPEN
+                self._trial = False
+            if self.state == self.HALF_OPEN:
+                if self._trial:
+                    raise CircuitOpenError(0)
+                self._trial = True
+
+    def record(self, error):
+        with self._lock:
+            if error is None or not error.transient:
+                if self.state != self.CLOSED:
+                    self.log.info("Kubernetes API is answering again, closing the circuit")
+                    API_CIRCUIT_OPEN.set(0)
+                self.state = self.CLOSED
+                self.failures = 0
+                return
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and
+                                                self.failures >= self.failure_threshold):
+                self.log.warning("Kubernetes API failed %d times in a row (%s), failing requests for %ss",
+                                 self.failures, error.status, self.reset_timeout)
+                self.state = self.OPEN
+                self._opened = time.time()
+                API_CIRCUIT_OPEN.set(1)
@@ -0,0 +1,148 @@
+import time
+import logging
+import threading
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from .swagger_client.rest import ApiException
+
+
+class ServiceIngressCache(object):
+    """Shared cache of the load balancer address of a service.
+
+    The address is kept up to date by a watch on the service running in
+    a daemon thread. While that watch is connected the cached address is
+    current, otherwise it is trusted for `ttl` seconds after it was last
+    seen and then read again from the apiserver.
+    When the apiserver can't be reached the last known address is used.
+    Concurrent reads of a stale address share one request.
+    A failing watch is retried after `retry_delay` seconds, doubled after
+    each failure up to `max_retry_delay`, and only logged as a warning
+    the first time.
+    """
+
+    def __init__(self, client, name, namespace=None, ttl=300, watch_timeout=300,
+                 retry_delay=5, max_retry_delay=300, log=None):
+        self.client = client
+        self.name = name
+        self.namespace = namespace or client.default_namespace
+        self.ttl = ttl
+        self.watch_timeout = watch_timeout
+        self.retry_delay = retry_delay
+        self.max_retry_delay = max_retry_delay
+        self.log = log or logging.getLogger(__name__)
+
+        self.address = None
+        self._updated = 0
+        self._watching = False
+        self._lookup = None
+        self._stopping = threading.Event()
+        self._thread = None
+
+    @property
+    def fresh(self):
+        if self.address is None:
+            return False
+        return self._watching or time.time() - self._updated < self.ttl
+
+    @gen.coroutine
+    def get(self):
+        """The ingress IP (or hostname) of the service"""
+        if self.fresh:
+            return self.address
+        lookup = self._lookup
+        if lookup is None:
+            lookup = self._lookup = self._read()
+            IOLoop.current().add_future(lookup, self._lookup_done)
+        address = yield lookup
+        return address
+
+    def _lookup_done(self, future):
+        if self._lookup is future:
+            self._lookup = None
+
+    @gen.coroutine
+    def _read(self):
+        try:
+            service = yield self.client.get_service(self.name, namespace=self.namespace)
+        except Exception as e:
+            if self.address is None:
+                raise
+            self.log.warning("Could not read service '%s', using the last known address %s: %s",
+                             self.name, self.address, e)
+            return self.address
+        self._update(service)
+        if self.address is None:
+            raise Exception("Service '{}' has no load balancer ingress".format(self.name))
+        return self.address
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name="service-watch-{}".format(self.name))
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._thread = None
+
+    def _run(self):
+        failures = 0
+        while not self._stopping.is_set():
+            try:
+                self._watch()
+                failures = 0
+            except Exception as e:
+                delay = min(self.retry_delay * 2 ** failures, self.max_retry_delay)
+                if failures:
+                    self.log.debug("Watch of service '%s' failed again, retrying in %ss: %s",
+                                   self.name, delay, e)
+                elif isinstance(e, ApiException):
+                    self.log.warning("Watch of service '%s' failed: %s %s, retrying in %ss",
+                                     self.name, e.status, e.reason, delay)
+                else:
+                    self.log.warning("Watch of service '%s' failed, retrying in %ss",
+                                     self.name, delay, exc_info=True)
+                failures += 1
+                self._stopping.wait(delay)
+            finally:
+                self._watching = False
+
+    def _watch(self):
+        # Without resource_version the watch starts with the current state of the service
+        events = self.client.watch_services(namespace=self.namespace,
+                                            field_selector="metadata.name={}".format(self.name),
+                                            timeout_seconds=self.watch_timeout)
+        for event_type, service in events:
+            if self._stopping.is_set():
+                return
+            if event_type == "ERROR":
+                raise Exception("Service watch error: {}".format(service.get("message")))
+            if event_type == "DELETED":
+                # keep the last address but read the service again once it expires
+                self._watching = False
+            else:
+                self._update(service)
+                self._watching = True
+
+    def _update(self, service):
+        address = ingress_address(service)
+        if address is None:
+            return
+        if address != self.address:
+            self.log.info("Service '%s' ingress address is %s", self.name, address)
+        self.address = address
+        self._updated = time.time()
+
+
+def ingress_address(service):
+    """First load balancer ingress IP or hostname of a `V1Service`, or None"""
+    status = service.status
+    load_balancer = status.load_balancer if status else None
+    ingress = load_balancer.ingress if load_balancer else None
+    if not ingress:
+        return None
+    return ingress[0].ip or ingress[0].hostname
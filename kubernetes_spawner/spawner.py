@@ -1,12 +1,28 @@
+import time
 import string
 from textwrap import dedent
 
 from tornado import gen
+from tornado.ioloop import IOLoop
 from escapism import escape
 from jupyterhub.spawner import Spawner
-from traitlets import Unicode, Bool, Int
+from traitlets import Unicode, Bool, Int, Float, Dict, List, Any, validate, TraitError
 
-from .kube import KubernetesClient, Pod, BaseContainer
+from .kube import KubernetesClient, Pod, PodTemplate, BaseContainer, PodFailedError
+from .kube import pod_is_ready, pod_is_terminal, USER_LABEL, HUB_LABEL, FATAL_WAITING_REASONS
+from .informer import PodInformer
+from .poller import BatchPoller
+from .pool import WarmPodPool, ENV_ANNOTATION
+from .service import ServiceIngressCache
+from .deleter import PodDeleter
+from .nodes import ImageLocality, prefer_nodes
+from .prepuller import ImagePrePuller
+from .reconcile import PodReconciler, annotate, plan, CREATE, RECREATE, REPLACE, REUSE
+from .admission import SpawnAdmission
+from .events import EventWatcher
+from .resources import RESOURCE_KEYS, parse_quantity, validate_profile, requirements
+from .metrics import SPAWN_DURATION_SECONDS, OPERATION_DURATION_SECONDS, POLLS, WARM_POOL_CLAIMS, SPAWN_FAILURES
+from .swagger_client.rest import ApiException
 
 
 class KubernetesSpawner(Spawner):
@@ -27,11 +43,179 @@ class KubernetesSpawner(Spawner):
         )
     )
 
+    namespace = Unicode(
+        "default",
+        config=True,
+        help=dedent(
+            """
+            Namespace of the single user pods. `{username}` is replaced by the escaped user name
+            for per-user namespaces, which must exist. The warm pod pool is disabled with
+            per-user namespaces.
+            """
+        )
+    )
+
+    hub_name = Unicode(
+        config=True,
+        help=dedent(
+            """
+            Value of the `hub` label of the pods, to tell apart the pods of several hubs.
+            Defaults to `pod_name_prefix`.
+            """
+        )
+    )
+
     container_image = Unicode("jupyterhub/singleuser", config=True)
     container_port = Int(8888, config=True)
     _container_safe_chars = set(string.ascii_letters + string.digits + '-')
     _container_escape_char = '_'
 
+    resource_cpu_request = Unicode(
+        "250m",
+        config=True,
+        help=dedent(
+            """
+            CPU guaranteed to each single user container, as a Kubernetes quantity (e.g. "250m" or "0.5").
+            Empty to leave it unset.
+            """
+        )
+    )
+
+    resource_cpu_limit = Unicode(
+        "250m",
+        config=True,
+        help=dedent(
+            """
+            Maximum CPU used by each single user container. Empty for no limit.
+            """
+        )
+    )
+
+    resource_memory_request = Unicode(
+        "1Gi",
+        config=True,
+        help=dedent(
+            """
+            Memory guaranteed to each single user container, as a Kubernetes quantity (e.g. "512Mi").
+            Empty to leave it unset.
+            """
+        )
+    )
+
+    resource_memory_limit = Unicode(
+        "1Gi",
+        config=True,
+        help=dedent(
+            """
+            Maximum memory used by each single user container. Empty for no limit.
+            """
+        )
+    )
+
+    resource_profiles = Dict(
+        config=True,
+        help=dedent(
+            """
+            Named resource profiles, e.g. `{"large": {"cpu_request": "1", "memory_limit": "4Gi"}}`.
+            The keys are `cpu_request`, `cpu_limit`, `memory_request` and `memory_limit`,
+            the missing ones default to the `resource_*` settings.
+            """
+        )
+    )
+
+    user_resource_profiles = Dict(
+        config=True,
+        help=dedent(
+            """
+            Resource profile name by user name.
+            """
+        )
+    )
+
+    group_resource_profiles = Dict(
+        config=True,
+        help=dedent(
+            """
+            Resource profile name by group name, for the users without a user profile.
+            When a user is in several of these groups the first group by name wins.
+            """
+        )
+    )
+
+    resource_profile_hook = Any(
+        None,
+        allow_none=True,
+        config=True,
+        help=dedent(
+            """
+            Callable taking the spawner and returning (or returning a future of) a profile name,
+            a profile dict or None to fall back to the user and group profiles.
+            It takes precedence over `user_resource_profiles` and `group_resource_profiles`.
+            """
+        )
+    )
+
+    node_selector = Dict(
+        config=True,
+        help=dedent(
+            """
+            Labels the nodes must have to run the single user pods, e.g. `{"role": "notebooks"}`.
+            """
+        )
+    )
+
+    tolerations = List(
+        Dict(),
+        config=True,
+        help=dedent(
+            """
+            Tolerations of the single user pods, as Kubernetes JSON,
+            e.g. `[{"key": "dedicated", "operator": "Equal", "value": "notebooks", "effect": "NoSchedule"}]`.
+            """
+        )
+    )
+
+    affinity = Dict(
+        config=True,
+        help=dedent(
+            """
+            Affinity of the single user pods, as the Kubernetes JSON of `spec.affinity`.
+            """
+        )
+    )
+
+    image_locality = Bool(
+        True,
+        config=True,
+        help=dedent(
+            """
+            Prefer scheduling the single user pods on the nodes that already have their image.
+            The nodes are listed every `image_locality_refresh_interval` seconds,
+            the hub Service Account needs `list` permission on nodes.
+            """
+        )
+    )
+
+    image_locality_weight = Int(
+        50,
+        config=True,
+        help=dedent(
+            """
+            Weight (1-100) of the node affinity preference for the nodes having the image.
+            """
+        )
+    )
+
+    image_locality_refresh_interval = Int(
+        60,
+        config=True,
+        help=dedent(
+            """
+            Seconds between two listings of the node images.
+            """
+        )
+    )
+
     persistent_volume_claim_name = Unicode(
         "",
         config=True,
@@ -157,7 +341,448 @@ class KubernetesSpawner(Spawner):
         )
     )
 
+    hub_service_cache_ttl = Int(
+        300,
+        config=True,
+        help=dedent(
+            """
+            Seconds the address read from `hub_ip_from_service` is trusted
+            when the watch on the service is not connected.
+            The last known address is still used when the apiserver can't be reached.
+            """
+        )
+    )
+
+    pod_informer = Bool(
+        True,
+        config=True,
+        help=dedent(
+            """
+            Keep an in memory cache of the pods, shared by all the spawners,
+            updated from a Kubernetes watch.
+            `poll` reads the pods from it instead of sending one API request
+            per user. `start` always reads its pod from the apiserver, the
+            cache can lag behind it.
+            """
+        )
+    )
+
+    pod_informer_resync_period = Int(
+        3600,
+        config=True,
+        help=dedent(
+            """
+            Seconds between full re-lists of the pods done by the pod informer.
+            """
+        )
+    )
+
+    k8s_api_threadpool_workers = Int(
+        20,
+        config=True,
+        help=dedent(
+            """
+            Number of threads running the (blocking) Kubernetes API requests.
+            This is the maximum number of concurrent requests to the apiserver.
+            """
+        )
+    )
+
+    k8s_watch_threadpool_workers = Int(
+        200,
+        config=True,
+        help=dedent(
+            """
+            Number of threads used to watch the pods that are starting.
+            This is the maximum number of spawns waiting for their pod to be ready at once.
+            """
+        )
+    )
+
+    k8s_api_pool_maxsize = Int(
+        0,
+        config=True,
+        help=dedent(
+            """
+            Number of connections to the apiserver kept alive for reuse.
+            0 keeps one per API and watch thread
+            (`k8s_api_threadpool_workers` + `k8s_watch_threadpool_workers`).
+            """
+        )
+    )
+
+    k8s_api_pool_block = Bool(
+        False,
+        config=True,
+        help=dedent(
+            """
+            When all the kept alive connections are in use wait for one to be free
+            instead of opening a new connection that is closed after the request.
+            """
+        )
+    )
+
+    k8s_api_connect_timeout = Float(
+        10,
+        config=True,
+        help=dedent(
+            """
+            Seconds to wait for a connection to the apiserver. 0 to wait forever.
+            """
+        )
+    )
+
+    k8s_api_read_timeout = Float(
+        60,
+        config=True,
+        help=dedent(
+            """
+            Seconds to wait for an apiserver response. 0 to wait forever.
+            Does not apply to watches.
+            """
+        )
+    )
+
+    k8s_api_max_retries = Int(
+        3,
+        config=True,
+        help=dedent(
+            """
+            Times a failed apiserver request is retried: connection errors, 429 and 5xx
+            of idempotent requests, after an exponential back off or the `Retry-After` delay.
+            """
+        )
+    )
+
+    k8s_api_retry_backoff = Float(
+        0.2,
+        config=True,
+        help=dedent(
+            """
+            Seconds of the first retry back off, doubled on each retry (with jitter).
+            """
+        )
+    )
+
+    k8s_api_circuit_breaker_threshold = Int(
+        5,
+        config=True,
+        help=dedent(
+            """
+            Failed apiserver requests in a row after which the requests fail fast
+            for `k8s_api_circuit_breaker_reset_timeout` seconds. 0 disables the circuit breaker.
+            """
+        )
+    )
+
+    k8s_api_circuit_breaker_reset_timeout = Float(
+        30,
+        config=True,
+        help=dedent(
+            """
+            Seconds the requests fail fast once the circuit breaker opened.
+            """
+        )
+    )
+
+    poll_batch_window = Float(
+        0.5,
+        config=True,
+        help=dedent(
+            """
+            When the pod informer is not used, `poll` calls arriving within this many seconds
+            are answered together by one list request. 0 disables batching.
+            """
+        )
+    )
+
+    poll_batch_size = Int(
+        100,
+        config=True,
+        help=dedent(
+            """
+            Maximum number of pods looked up by one batched poll request.
+            """
+        )
+    )
+
+    delete_concurrency = Int(
+        10,
+        config=True,
+        help=dedent(
+            """
+            Maximum number of pod delete requests sent at once when many users are stopped.
+            """
+        )
+    )
+
+    delete_batch_window = Float(
+        0.1,
+        config=True,
+        help=dedent(
+            """
+            Pods stopped within this many seconds are deleted together,
+            with one delete collection request when they have no grace period.
+            """
+        )
+    )
+
+    delete_grace_period = Int(
+        None,
+        allow_none=True,
+        config=True,
+        help=dedent(
+            """
+            Seconds given to the single user server to shut down when its pod is deleted.
+            None for the pod default (`terminationGracePeriodSeconds`).
+            """
+        )
+    )
+
+    delete_wait = Bool(
+        False,
+        config=True,
+        help=dedent(
+            """
+            Make `stop` wait until the pod is actually removed (up to `start_timeout` seconds).
+            """
+        )
+    )
+
+    warm_pool_size = Int(
+        0,
+        config=True,
+        help=dedent(
+            """
+            Number of pre-started pods, shared by all the users, waiting to be claimed on login.
+            0 disables the warm pod pool.
+            The image must wait for the user environment, see the README.
+            """
+        )
+    )
+
+    warm_pool_max_age = Int(
+        3600,
+        config=True,
+        help=dedent(
+            """
+            Seconds after which an unclaimed warm pod is replaced by a new one.
+            """
+        )
+    )
+
+    warm_pool_max_per_image = Int(
+        0,
+        config=True,
+        help=dedent(
+            """
+            Maximum number of warm pods of a single image. 0 for no limit.
+            """
+        )
+    )
+
+    warm_pool_refill_interval = Int(
+        30,
+        config=True,
+        help=dedent(
+            """
+            Seconds between two checks of the warm pod pool.
+            """
+        )
+    )
+
+    prepull = Bool(
+        False,
+        config=True,
+        help=dedent(
+            """
+            Pull `container_image` and `prepull_images` on every node from the hub start,
+            with short-lived pods pinned to each node, so the first users on a node don't wait
+            for the image pull. The hub Service Account needs `list` permission on nodes.
+            """
+        )
+    )
+
+    prepull_images = List(
+        Unicode(),
+        config=True,
+        help=dedent(
+            """
+            Images pre-pulled in addition to `container_image`, e.g. the next image to roll out.
+            """
+        )
+    )
+
+    prepull_timeout = Int(
+        600,
+        config=True,
+        help=dedent(
+            """
+            Seconds after which a node still pulling an image is reported as failed.
+            """
+        )
+    )
+
+    prepull_interval = Int(
+        600,
+        config=True,
+        help=dedent(
+            """
+            Seconds between two pre-pulls, to pull the images on the nodes added since.
+            """
+        )
+    )
+
+    spawn_max_inflight = Int(
+        20,
+        config=True,
+        help=dedent(
+            """
+            Maximum number of pods being created at once by the hub, the other spawns wait
+            in a first come first served queue and see their position in the spawn progress.
+            0 for no limit.
+            """
+        )
+    )
+
+    spawn_adaptive_limit = Bool(
+        True,
+        config=True,
+        help=dedent(
+            """
+            Lower the number of pods created at once (down to 1) while the apiserver is slow
+            or throttling, and raise it back (up to `spawn_max_inflight`) once it recovers.
+            """
+        )
+    )
+
+    spawn_target_api_latency = Float(
+        1.0,
+        config=True,
+        help=dedent(
+            """
+            90th percentile apiserver response time, in seconds, above which the apiserver
+            is considered overloaded by `spawn_adaptive_limit`.
+            """
+        )
+    )
+
+    spawn_events = Bool(
+        True,
+        config=True,
+        help=dedent(
+            """
+            Watch the pod events to log the timeline of each spawn (Scheduled, Pulling, Pulled,
+            Created, Started) and stop waiting for a pod on a `spawn_failure_events` event.
+            The hub Service Account needs `list` and `watch` permissions on events.
+            """
+        )
+    )
+
+    spawn_failure_events = List(
+        Unicode(),
+        ["Failed", "InspectFailed", "ErrImageNeverPull"],
+        config=True,
+        help=dedent(
+            """
+            Reasons of the pod events that fail the spawn right away, e.g. `Failed` for an image
+            that can't be pulled. Add `FailedScheduling` to fail when the pod can't be scheduled,
+            unless the cluster autoscales or uses volumes bound on demand.
+            """
+        )
+    )
+
+    spawn_failure_reasons = List(
+        Unicode(),
+        list(FATAL_WAITING_REASONS),
+        config=True,
+        help=dedent(
+            """
+            Waiting reasons of a container that fail the spawn as soon as the pod status shows them,
+            instead of after `start_timeout`. The pod is deleted.
+            """
+        )
+    )
+
+    spawn_unschedulable_timeout = Int(
+        30,
+        config=True,
+        help=dedent(
+            """
+            Seconds a pod can stay unschedulable (no node has room for it or matches its selector)
+            before the spawn fails and the pod is deleted, 0 to wait until `start_timeout`.
+            Raise it when the cluster autoscaler adds nodes for pending pods.
+            """
+        )
+    )
+
     _client = None
+    _poller = None
+    _warm_pool = None
+    _hub_service = None
+    _deleter = None
+    _image_nodes = None
+    _prepuller = None
+    _reconciler = None
+    _admission = None
+    _event_watcher = None
+    # `PodTemplate` by (spawner class, image, `pod_template_traits` values)
+    _pod_templates = {}
+    # traits read by `build_pod`, they are often set per user (e.g. in `pre_spawn_hook`)
+    pod_template_traits = ("hub_name", "pod_name_prefix", "container_port", "node_selector", "tolerations",
+                           "affinity", "volume_mode", "glusterfs_endpoint", "glusterfs_path",
+                           "nfs_server_ip", "nfs_server_share", "persistent_volume_claim_name",
+                           "resource_cpu_request", "resource_cpu_limit", "resource_memory_request",
+                           "resource_memory_limit")
+
+    @validate("resource_cpu_request", "resource_cpu_limit", "resource_memory_request",
+              "resource_memory_limit")
+    def _validate_quantity(self, proposal):
+        if proposal.value:
+            try:
+                parse_quantity(proposal.value)
+            except ValueError as e:
+                raise TraitError("{}: {}".format(proposal.trait.name, e))
+        return proposal.value
+
+    @validate("resource_profiles")
+    def _validate_resource_profiles(self, proposal):
+        for name, profile in proposal.value.items():
+            try:
+                validate_profile(name, profile)
+            except ValueError as e:
+                raise TraitError(str(e))
+        return proposal.value
+
+    @validate("user_resource_profiles", "group_resource_profiles")
+    def _validate_profile_names(self, proposal):
+        # the config is validated once all of it is loaded, `resource_profiles` included
+        unknown = sorted(set(proposal.value.values()) - set(self.resource_profiles))
+        if unknown:
+            raise TraitError("{}: unknown resource profiles {}".format(
+                proposal.trait.name, ", ".join(repr(name) for name in unknown)))
+        return proposal.value
+
+    @validate("resource_profile_hook")
+    def _validate_resource_profile_hook(self, proposal):
+        if proposal.value is not None and not callable(proposal.value):
+            raise TraitError("resource_profile_hook must be callable")
+        return proposal.value
+
+    @validate("image_locality_weight")
+    def _validate_image_locality_weight(self, proposal):
+        if not 1 <= proposal.value <= 100:
+            raise TraitError("image_locality_weight must be between 1 and 100")
+        return proposal.value
+
+    # Seconds between the pod creation and the pod being ready on the last start
+    time_to_ready = None
+
+    # Name of the warm pool pod claimed by the user, if any
+    pool_pod_name = None
+
+    # `SpawnEvents` of the last start that created or changed the pod
+    events = None
 
     @property
     def client(self):
@@ -172,51 +797,97 @@ class KubernetesSpawner(Spawner):
             if self.username and self.password:
                 self.log.debug("Creating Kubernetes client from username and password")
                 cls._client = KubernetesClient.from_username_password(self.host, self.username, self.password,
-                                                                      verify_ssl=self.verify_ssl)
+                                                                      **self._client_kwargs())
             else:
                 self.log.debug("Creating Kubernetes client from Service Account")
-                cls._client = KubernetesClient.from_service_account(self.host, verify_ssl=self.verify_ssl)
+                cls._client = KubernetesClient.from_service_account(self.host, **self._client_kwargs())
+
+            if self.pod_informer:
+                self.log.debug("Starting pod informer")
+                # with per-user namespaces only the pods of this hub are cached
+                per_user = self.per_user_namespaces
+                cls._client.informer = PodInformer(cls._client, namespace=self.namespace,
+                                                   all_namespaces=per_user,
+                                                   label_selector="{}={}".format(HUB_LABEL, self.hub_label)
+                                                   if per_user else None,
+                                                   resync_period=self.pod_informer_resync_period,
+                                                   log=self.log)
+                cls._client.informer.start()
+
+            self.event_watcher
+
+            # start filling the pool before the first login
+            self.warm_pool
+            self.image_nodes
+            self.prepuller
         return cls._client
 
+    def _client_kwargs(self):
+        return dict(verify_ssl=self.verify_ssl,
+                    max_workers=self.k8s_api_threadpool_workers,
+                    max_watches=self.k8s_watch_threadpool_workers,
+                    pool_maxsize=self.k8s_api_pool_maxsize,
+                    pool_block=self.k8s_api_pool_block,
+                    connect_timeout=self.k8s_api_connect_timeout or None,
+                    read_timeout=self.k8s_api_read_timeout or None,
+                    max_retries=self.k8s_api_max_retries,
+                    retry_backoff=self.k8s_api_retry_backoff,
+                    breaker_threshold=self.k8s_api_circuit_breaker_threshold,
+                    breaker_reset_timeout=self.k8s_api_circuit_breaker_reset_timeout)
+
     @gen.coroutine
     def start(self):
-        # TODO: handle stoped
         self.log.debug("Starting pod '%s'", self.pod_name)
-        pod = self.get_pod()
-
-        if pod is None:
-            self.log.debug("Pod '%s' NOT found. Creating it...", self.pod_name)
-
-            new_pod = Pod(name=self.pod_name)
-
-            # Create Jupyter container
-            container = BaseContainer(name='jupyter', image=self.container_image)
-            container.add_port(self.container_port)
-            for env_name, env_value in self.get_env_vars().items():
-                container.add_env(env_name, env_value)
-            # Mount volume to persist notebooks
-            vol_name = "notebooks"
-
-            if self.volume_mode == "glusterfs":
-                new_pod.add_glusterfs_volume( vol_name, self.glusterfs_endpoint, self.glusterfs_path)
-
-            if self.volume_mode == "nfs":
-                new_pod.add_nfs_volume(vol_name, self.nfs_server_ip, self.nfs_server_share)
-                
-            if self.volume_mode == "persistent_volume_claim":
-                new_pod.add_pvc_volume(vol_name, self.persistent_volume_claim_name)
-            
-            volume_path = self.volume_mountpath
-            if '{username}' in volume_path:
-                volume_path = volume_path.format(username=self.user.name)
-
-            container.add_volume(vol_name, volume_path)
-            new_pod.add_container(container)
-
-            self.client.launch_pod(new_pod)
-            pod = yield self.wait_for_new_pod()
-        else:
+        started = time.time()
+        self.events = None
+        # what is done next depends on the pod, don't trust the informer cache
+        pod = yield self.get_pod(live=True)
+
+        if self.pool_pod_name and (pod is None or pod_is_terminal(pod)):
+            # the claimed warm pod is gone, or done: start over with a pod of our own
+            if pod is not None:
+                yield self.deleter.delete(self.pod_name, grace_period=0, wait=True,
+                                          namespace=self.pod_namespace)
+            self.pool_pod_name = None
+            pod = yield self.get_pod(live=True)
+
+        if not self.pool_pod_name:
+            env = yield self.get_env_vars()
+            resources = yield self.get_resources()
+            if pod is None:
+                pod = yield self.claim_warm_pod(env, resources)
+
+        if self.pool_pod_name:
             self.log.debug("Pod '%s' FOUND", self.pod_name)
+            if not pod_is_ready(pod):
+                # e.g. restarting after a hub restart
+                pod = yield self.wait_for_new_pod()
+        else:
+            desired = self.desired_pod(env, resources)
+            slot = None
+            if self.admission is not None and plan(pod, desired) != REUSE:
+                queued = time.time()
+                slot = yield self.admission.acquire(self)
+                SPAWN_DURATION_SECONDS.labels("queue").observe(time.time() - queued)
+            if self.event_watcher is not None and plan(pod, desired) != REUSE:
+                self.events = self.event_watcher.track(self.pod_namespace, self.pod_name)
+            try:
+                try:
+                    action, pod = yield self.reconciler.reconcile(pod, desired, namespace=self.pod_namespace)
+                finally:
+                    if slot is not None:
+                        slot.release()
+                if self.events is not None:
+                    self.event_watcher.attach(self.events, pod.metadata.uid,
+                                              reused=action not in (CREATE, RECREATE))
+                # the containers of a replaced pod restart with the new images
+                if action == REPLACE or not pod_is_ready(pod):
+                    pod = yield self.wait_for_new_pod()
+            finally:
+                if self.events is not None:
+                    self.event_watcher.untrack(self.events)
+            if action in (CREATE, RECREATE):
+                SPAWN_DURATION_SECONDS.labels("total").observe(time.time() - started)
 
         ip = pod.status.pod_ip
         self.log.debug("Pod ready at '%s:%s'", ip, self.container_port)
@@ -225,13 +896,294 @@ class KubernetesSpawner(Spawner):
         self.user.server.port = self.container_port
         return ip, self.container_port
 
-    def get_pod(self):
-        return self.client.get_pod(self.pod_name)
+    def build_pod(self, name, image, env, volume_path, resources=None):
+        pod = Pod(name=name)
+        pod.add_label(HUB_LABEL, self.hub_label)
+
+        # Create Jupyter container
+        container = BaseContainer(name='jupyter', image=image)
+        container.add_port(self.container_port)
+        resources = resources or self.default_resources
+        container.set_resources(resources["requests"], resources["limits"])
+        if self.node_selector:
+            pod.spec.node_selector = dict(self.node_selector)
+        if self.tolerations:
+            pod.spec.tolerations = list(self.tolerations)
+        if self.affinity:
+            pod.spec.affinity = self.affinity
+        for env_name, env_value in env.items():
+            container.add_env(env_name, env_value)
+        # Mount volume to persist notebooks
+        vol_name = "notebooks"
+
+        if self.volume_mode == "glusterfs":
+            pod.add_glusterfs_volume(vol_name, self.glusterfs_endpoint, self.glusterfs_path)
+
+        if self.volume_mode == "nfs":
+            pod.add_nfs_volume(vol_name, self.nfs_server_ip, self.nfs_server_share)
+
+        if self.volume_mode == "persistent_volume_claim":
+            pod.add_pvc_volume(vol_name, self.persistent_volume_claim_name)
+
+        container.add_volume(vol_name, volume_path)
+        pod.add_container(container)
+        return pod
+
+    def render_pod(self, name, image, env, volume_path, resources=None):
+        """JSON manifest of `build_pod(name, image, env, volume_path, resources)`
+
+        `build_pod` is only called once per image and values of the
+        `pod_template_traits`, the user specific fields are filled in the
+        resulting template.
+        """
+        # repr of equal values built in another order only costs an extra template
+        key = (self.__class__, image, repr([getattr(self, name) for name in self.pod_template_traits]))
+        template = self._pod_templates.get(key)
+        if template is None:
+            pod = self.build_pod("{name}", image, {}, self.volume_mountpath)
+            template = self._pod_templates[key] = PodTemplate(self.client.client, pod)
+        return template.render(name, env, volume_path, resources)
+
+    def desired_pod(self, env, resources):
+        """Manifest of the pod of the user, annotated with its hashes (see `reconcile.annotate`)"""
+        volume_path = self.volume_mountpath
+        if '{username}' in volume_path:
+            volume_path = volume_path.format(username=self.user.name)
+        pod = self.render_pod(self.pod_name, self.container_image, env, volume_path, resources)
+        pod["metadata"]["labels"][USER_LABEL] = self.escaped_name
+        annotate(pod)
+        # a scheduling hint changing with the nodes, left out of the hashes
+        affinity = self.image_affinity(pod["spec"].get("affinity"), self.container_image)
+        if affinity:
+            pod["spec"]["affinity"] = affinity
+        return pod
+
+    @property
+    def image_nodes(self):
+        cls = self.__class__
+        if cls._image_nodes is None and self.image_locality:
+            cls._image_nodes = ImageLocality(self.client,
+                                             refresh_interval=self.image_locality_refresh_interval,
+                                             log=self.log)
+            cls._image_nodes.start()
+        return cls._image_nodes
+
+    def image_affinity(self, affinity, image):
+        """`affinity` preferring the nodes that have `image`"""
+        image_nodes = self.image_nodes
+        hostnames = image_nodes.hostnames(image) if image_nodes is not None else []
+        if not hostnames:
+            return affinity
+        return prefer_nodes(affinity, hostnames, self.image_locality_weight)
+
+    @property
+    def default_resources(self):
+        """Resource requirements (JSON) from the `resource_*` settings"""
+        return requirements(self._default_profile())
+
+    def _default_profile(self):
+        return {key: getattr(self, "resource_" + key) for key in RESOURCE_KEYS}
+
+    @gen.coroutine
+    def get_resources(self):
+        """Resource requirements (JSON) of the user's profile"""
+        profile = None
+        if self.resource_profile_hook is not None:
+            profile = yield gen.maybe_future(self.resource_profile_hook(self))
+        if profile is None:
+            profile = self.user_resource_profiles.get(self.user.name)
+        if profile is None:
+            groups = sorted(group.name for group in getattr(self.user, "groups", None) or [])
+            for group in groups:
+                if group in self.group_resource_profiles:
+                    profile = self.group_resource_profiles[group]
+                    break
+        if profile is None:
+            return self.default_resources
+
+        if isinstance(profile, dict):
+            name = "of user '{}'".format(self.user.name)
+        else:
+            name = profile
+            if name not in self.resource_profiles:
+                raise ValueError("Unknown resource profile {!r} for user '{}'".format(name, self.user.name))
+            profile = self.resource_profiles[name]
+        resolved = self._default_profile()
+        resolved.update(profile)
+        validate_profile(name, resolved)
+        return requirements(resolved)
+
+    def build_pool_pod(self, name, image):
+        pod = self.build_pod(name, image, {}, self.volume_mountpath)
+        pod.spec.affinity = self.image_affinity(pod.spec.affinity, image)
+        # The user environment is written in an annotation when the pod is claimed,
+        # the downward API keeps this file in sync with it
+        pod.add_downward_api_volume("pool-annotations", "annotations", "metadata.annotations")
+        container = pod.spec.containers[0]
+        container.add_volume("pool-annotations", "/etc/jupyterhub-pool")
+        container.add_env("JPY_POOL_ANNOTATIONS_FILE", "/etc/jupyterhub-pool/annotations")
+        container.add_env("JPY_POOL_ENV_ANNOTATION", ENV_ANNOTATION)
+        return pod
+
+    @property
+    def warm_pool(self):
+        cls = self.__class__
+        if cls._warm_pool is None and self.warm_pool_size:
+            if '{username}' in self.volume_mountpath:
+                self.log.warning("Warm pod pool disabled: volume_mountpath depends on the username")
+                return None
+            if self.per_user_namespaces:
+                self.log.warning("Warm pod pool disabled: namespace depends on the username")
+                return None
+            cls._warm_pool = WarmPodPool(self.client, self.build_pool_pod,
+                                         name="{}-pool".format(self.pod_name_prefix),
+                                         namespace=self.namespace,
+                                         size=self.warm_pool_size,
+                                         max_age=self.warm_pool_max_age,
+                                         max_per_image=self.warm_pool_max_per_image,
+                                         refill_interval=self.warm_pool_refill_interval,
+                                         log=self.log)
+            cls._warm_pool.start(self.container_image)
+        return cls._warm_pool
+
+    @property
+    def prepuller(self):
+        cls = self.__class__
+        if cls._prepuller is None and self.prepull:
+            cls._prepuller = ImagePrePuller(self.client,
+                                            name="{}-prepull".format(self.pod_name_prefix),
+                                            namespace=None if self.per_user_namespaces else self.namespace,
+                                            node_selector=self.node_selector,
+                                            tolerations=self.tolerations,
+                                            timeout=self.prepull_timeout,
+                                            interval=self.prepull_interval,
+                                            log=self.log)
+            images = [self.container_image]
+            images.extend(image for image in self.prepull_images if image not in images)
+            cls._prepuller.start(images)
+        return cls._prepuller
+
+    @gen.coroutine
+    def claim_warm_pod(self, env, resources):
+        pool = self.warm_pool
+        if pool is None:
+            return None
+        if resources != self.default_resources:
+            # the warm pods are started with the default resources
+            return None
+        pod = yield pool.claim(self.container_image, {USER_LABEL: self.escaped_name}, env)
+        WARM_POOL_CLAIMS.labels("miss" if pod is None else "hit").inc()
+        if pod is not None:
+            self.pool_pod_name = pod.metadata.name
+            self.log.info("Claimed warm pod '%s' for '%s'", self.pool_pod_name, self.user.name)
+        return pod
+
+    def get_state(self):
+        state = super(KubernetesSpawner, self).get_state()
+        if self.pool_pod_name:
+            state['pod_name'] = self.pool_pod_name
+        return state
+
+    def load_state(self, state):
+        super(KubernetesSpawner, self).load_state(state)
+        self.pool_pod_name = state.get('pod_name')
+
+    def clear_state(self):
+        super(KubernetesSpawner, self).clear_state()
+        self.pool_pod_name = None
+
+    def get_pod(self, live=False):
+        return self.client.get_pod(self.pod_name, namespace=self.pod_namespace, live=live)
+
+    @property
+    def poller(self):
+        cls = self.__class__
+        if cls._poller is None:
+            cls._poller = BatchPoller(self.client, window=self.poll_batch_window,
+                                      max_batch=self.poll_batch_size, log=self.log)
+        return cls._poller
+
+    @property
+    def admission(self):
+        cls = self.__class__
+        if cls._admission is None and self.spawn_max_inflight:
+            cls._admission = SpawnAdmission(max_limit=self.spawn_max_inflight,
+                                            adaptive=self.spawn_adaptive_limit,
+                                            target_latency=self.spawn_target_api_latency,
+                                            log=self.log)
+            self.client.observers.append(cls._admission.observe)
+        return cls._admission
+
+    @property
+    def event_watcher(self):
+        cls = self.__class__
+        if cls._event_watcher is None and self.spawn_events:
+            cls._event_watcher = EventWatcher(self.client, namespace=self.namespace,
+                                              all_namespaces=self.per_user_namespaces,
+                                              failure_reasons=self.spawn_failure_events,
+                                              log=self.log)
+            cls._event_watcher.start()
+        return cls._event_watcher
+
+    async def progress(self):
+        message = None
+        while True:
+            position = self.admission.position(self) if self.admission is not None else 0
+            if position:
+                event = {"progress": 10, "message": "Waiting to create your server, {} of {} in the queue".format(
+                    position, self.admission.queued)}
+            elif self.events is not None and self.events.last_message:
+                event = {"progress": 50, "message": self.events.last_message}
+            else:
+                event = {"progress": 50, "message": "Starting your server..."}
+            if event["message"] != message:
+                message = event["message"]
+                yield event
+            await gen.sleep(1)
+
+    @property
+    def reconciler(self):
+        cls = self.__class__
+        if cls._reconciler is None:
+            cls._reconciler = PodReconciler(self.client, self.deleter, log=self.log)
+        return cls._reconciler
+
+    @property
+    def deleter(self):
+        cls = self.__class__
+        if cls._deleter is None:
+            cls._deleter = PodDeleter(self.client, concurrency=self.delete_concurrency,
+                                      window=self.delete_batch_window,
+                                      wait_timeout=self.start_timeout, log=self.log)
+        return cls._deleter
+
+    @property
+    def hub_service(self):
+        cls = self.__class__
+        if cls._hub_service is None:
+            cls._hub_service = ServiceIngressCache(self.client, self.hub_ip_from_service,
+                                                   ttl=self.hub_service_cache_ttl, log=self.log)
+            cls._hub_service.start()
+        return cls._hub_service
 
     @property
     def pod_name(self):
+        if self.pool_pod_name:
+            return self.pool_pod_name
         return "{}-{}".format(self.pod_name_prefix, self.escaped_name)
 
+    @property
+    def pod_namespace(self):
+        return self.namespace.format(username=self.escaped_name)
+
+    @property
+    def per_user_namespaces(self):
+        return '{username}' in self.namespace
+
+    @property
+    def hub_label(self):
+        return self.hub_name or self.pod_name_prefix
+
     @property
     def escaped_name(self):
         return escape(self.user.name,
@@ -239,6 +1191,7 @@ class KubernetesSpawner(Spawner):
                       escape_char=self._container_escape_char,
                       )
 
+    @gen.coroutine
     def get_env_vars(self):
         env = super(KubernetesSpawner, self).get_env()
         ret = {}
@@ -247,20 +1200,22 @@ class KubernetesSpawner(Spawner):
         ret['JPY_COOKIE_NAME'] = self.user.server.cookie_name
         ret['JPY_BASE_URL'] = self.user.server.base_url
         ret['JPY_HUB_PREFIX'] = self.hub.server.base_url
-        ret['JPY_HUB_API_URL'] = self._hub_api_url()
+        ret['JPY_HUB_API_URL'] = yield self._hub_api_url()
         if self.notebook_dir:
             self.notebook_dir = self.notebook_dir.replace("%U", self.user.name)
             self.notebook_dir = self.notebook_dir.replace("{username}", self.user.name)
             ret['NOTEBOOK_DIR'] = self.notebook_dir
         return ret
 
+    @gen.coroutine
     def _hub_api_url(self):
         if self.hub_ip:
             ip = self.hub_ip
             port = self.hub_port
         elif self.hub_ip_from_service:
-            api_service = self.client.get_service(self.hub_ip_from_service)
-            ip = api_service.status.load_balancer.ingress[0].ip
+            started = time.time()
+            ip = yield self.hub_service.get()
+            OPERATION_DURATION_SECONDS.labels("hub_api_url").observe(time.time() - started)
             port = None
         else:
             return self.hub.api_url
@@ -274,19 +1229,64 @@ class KubernetesSpawner(Spawner):
     @gen.coroutine
     def wait_for_new_pod(self):
         self.log.debug("Waiting for new pod '%s' to be 'RUNNING'", self.pod_name)
-        while True:
-            pod = self.get_pod()
-            if pod.status.phase == 'Running':
-                self.log.debug("Pod '%s' is finally running", self.pod_name)
-                return pod
-            elif pod.status.phase in ('Failed', 'Unknown'):
-                raise Exception('Couldn\'t launch pod :(')
-            elif pod.status.phase in ('Pending',):
-                yield gen.sleep(5)
+        started = time.time()
+        timings = {}
+        ready = self.client.wait_for_pod_ready(self.pod_name, namespace=self.pod_namespace,
+                                               timeout=self.start_timeout, timings=timings,
+                                               failure_reasons=self.spawn_failure_reasons,
+                                               unschedulable_timeout=self.spawn_unschedulable_timeout)
+        try:
+            if self.events is not None:
+                # the first of the pod being ready and a failure event
+                yield gen.WaitIterator(ready, self.events.failure).next()
+                if self.events.failure.done():
+                    # the wait ends with the pod deletion, its outcome no longer matters
+                    IOLoop.current().add_future(ready, lambda f: f.exception())
+                    reason, message = self.events.failure.result()
+                    raise PodFailedError("{}: {}".format(reason, message), reason=reason)
+            pod = yield ready
+        except PodFailedError as e:
+            SPAWN_FAILURES.labels(e.reason or "unknown").inc()
+            if e.reason != "Deleted":
+                # give the resources of a pod that can't start back to the cluster right away
+                self.log.warning("Deleting pod '%s' that won't start: %s", self.pod_name, e)
+                try:
+                    yield self.deleter.delete(self.pod_name, grace_period=0, namespace=self.pod_namespace)
+                except ApiException:
+                    self.log.warning("Failed to delete pod '%s'", self.pod_name, exc_info=True)
+            raise PodFailedError('Couldn\'t launch pod :( {}'.format(e), reason=e.reason, container=e.container)
+        self.time_to_ready = time.time() - started
+        OPERATION_DURATION_SECONDS.labels("wait_for_new_pod").observe(self.time_to_ready)
+        # the pod is created right before the wait starts
+        previous = started
+        for phase, event in (("scheduling", "scheduled"), ("image_pull", "started"), ("ready", "ready")):
+            if event in timings:
+                SPAWN_DURATION_SECONDS.labels(phase).observe(timings[event] - previous)
+                previous = timings[event]
+        self.log.info("Pod '%s' is ready after %.2fs", self.pod_name, self.time_to_ready)
+        if self.events is not None and self.events.times:
+            self.log.info("Pod '%s' events: %s", self.pod_name, self.events.timeline())
+        return pod
 
     @gen.coroutine
     def poll(self):
-        created_pod = self.get_pod()
+        started = time.time()
+        informer = self.client.informer
+        from_informer = informer is not None and informer.synced and informer.covers(self.pod_namespace)
+        try:
+            if self.poll_batch_window and not from_informer:
+                created_pod = yield self.poller.get_pod(self.pod_name, namespace=self.pod_namespace)
+            else:
+                created_pod = yield self.get_pod()
+        except ApiException as e:
+            if not e.transient:
+                raise
+            # an apiserver failing or throttling is no sign of the pod being gone
+            self.log.warning("Poll: could not get pod '%s', assuming it is still running: %s %s",
+                             self.pod_name, e.status, e.reason.splitlines()[0] if e.reason else "")
+            return None
+        POLLS.labels("informer" if from_informer else "api").inc()
+        OPERATION_DURATION_SECONDS.labels("poll").observe(time.time() - started)
         if created_pod is not None and created_pod.status.phase in ('Running',):
             self.log.debug("Poll: Pod '%s' FOUND", self.pod_name)
             return None
@@ -295,5 +1295,14 @@ class KubernetesSpawner(Spawner):
             return 0
 
     @gen.coroutine
-    def stop(self):
-        self.client.delete_pod(self.pod_name)
+    def stop(self, now=False):
+        grace_period = 0 if now else self.delete_grace_period
+        wait = self.delete_wait and not now
+        if self.admission is not None:
+            # a start still waiting in the queue
+            self.admission.cancel(self)
+        self.log.debug("Deleting pod '%s'", self.pod_name)
+        started = time.time()
+        yield self.deleter.delete(self.pod_name, grace_period=grace_period, wait=wait,
+                                  namespace=self.pod_namespace)
+        OPERATION_DURATION_SECONDS.labels("stop").observe(time.time() - started)
@@ -0,0 +1,94 @@
+import threading
+
+from .kube import NAME_LABEL, USER_LABEL, HUB_LABEL
+from .pool import POOL_LABEL
+
+
+def _label(key):
+    return lambda pod: (pod.metadata.labels or {}).get(key)
+
+
+# index name -> function giving the indexed value of a pod (None to leave it out)
+INDEXES = {
+    "namespace": lambda pod: pod.metadata.namespace,
+    "name": _label(NAME_LABEL),
+    "user": _label(USER_LABEL),
+    "hub": _label(HUB_LABEL),
+    "pool": _label(POOL_LABEL),
+    "node": lambda pod: pod.spec.node_name if pod.spec is not None else None,
+}
+
+
+class PodStore(object):
+    """Thread safe in memory pods, by namespace and name and by secondary indexes.
+
+    Every pod is kept under `(namespace, name)` and each of the `indexes`
+    maps a value to the set of keys of the pods having it, so `by_index`
+    (e.g. all the pods on a node, or of a hub) costs the size of its
+    answer instead of a list request. The default indexes are the ones of
+    `INDEXES`: namespace, node and the `name`, `user`, `hub` and `pool` labels.
+    """
+
+    def __init__(self, indexes=None):
+        self.indexes = dict(INDEXES, **(indexes or {}))
+        self._pods = {}
+        self._index = {index: {} for index in self.indexes}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._pods)
+
+    def get(self, namespace, name):
+        with self._lock:
+            return self._pods.get((namespace, name))
+
+    def list(self):
+        with self._lock:
+            return list(self._pods.values())
+
+    def by_index(self, index, value):
+        """Pods whose `index` value is `value`"""
+        with self._lock:
+            return [self._pods[key] for key in self._index[index].get(value, ())]
+
+    def index_values(self, index):
+        """Values of `index` with at least one pod"""
+        with self._lock:
+            return list(self._index[index])
+
+    def replace(self, pods):
+        """Replace all the pods, e.g. with the result of a list"""
+        with self._lock:
+            self._pods = {}
+            self._index = {index: {} for index in self.indexes}
+            for pod in pods:
+                self._add(pod)
+
+    def update(self, pod):
+        with self._lock:
+            self._remove((pod.metadata.namespace, pod.metadata.name))
+            self._add(pod)
+
+    def delete(self, namespace, name):
+        with self._lock:
+            self._remove((namespace, name))
+
+    def _add(self, pod):
+        key = (pod.metadata.namespace, pod.metadata.name)
+        self._pods[key] = pod
+        for index, function in self.indexes.items():
+            value = function(pod)
+            if value is not None:
+                self._index[index].setdefault(value, set()).add(key)
+
+    def _remove(self, key):
+        pod = self._pods.pop(key, None)
+        if pod is None:
+            return
+        for index, function in self.indexes.items():
+            value = function(pod)
+            keys = self._index[index].get(value)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._index[index][value]
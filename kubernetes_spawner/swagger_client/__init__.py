@@ -1,131 +1,8 @@
 from __future__ import absolute_import
 
-# import models into sdk package
-from .models.v1_persistent_volume import V1PersistentVolume
-from .models.v1_tcp_socket_action import V1TCPSocketAction
-from .models.v1_resource_quota_status import V1ResourceQuotaStatus
-from .models.v1_container_state_terminated import V1ContainerStateTerminated
-from .models.v1_replication_controller_list import V1ReplicationControllerList
-from .models.v1_capability import V1Capability
-from .models.v1_pod import V1Pod
-from .models.v1_event import V1Event
-from .models.v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from .models.v1_host_path_volume_source import V1HostPathVolumeSource
-from .models.v1_config_map_key_selector import V1ConfigMapKeySelector
-from .models.v1_volume import V1Volume
-from .models.v1_container_state_running import V1ContainerStateRunning
-from .models.v1_delete_options import V1DeleteOptions
-from .models.v1_pod_template_spec import V1PodTemplateSpec
-from .models.v1_secret_list import V1SecretList
-from .models.v1_nfs_volume_source import V1NFSVolumeSource
-from .models.v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from .models.v1_capabilities import V1Capabilities
-from .models.v1_component_condition import V1ComponentCondition
-from .models.unversioned_status import UnversionedStatus
-from .models.v1_service_status import V1ServiceStatus
-from .models.unversioned_status_details import UnversionedStatusDetails
-from .models.v1_secret_volume_source import V1SecretVolumeSource
-from .models.v1_resource_requirements import V1ResourceRequirements
-from .models.v1_persistent_volume_claim import V1PersistentVolumeClaim
-from .models.unversioned_patch import UnversionedPatch
-from .models.v1_namespace_status import V1NamespaceStatus
-from .models.v1_persistent_volume_access_mode import V1PersistentVolumeAccessMode
-from .models.v1_resource_quota_spec import V1ResourceQuotaSpec
-from .models.v1_persistent_volume_spec import V1PersistentVolumeSpec
-from .models.v1_exec_action import V1ExecAction
-from .models.v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from .models.v1_service_spec import V1ServiceSpec
-from .models.v1_service_list import V1ServiceList
-from .models.v1_persistent_volume_list import V1PersistentVolumeList
-from .models.v1_container_status import V1ContainerStatus
-from .models.v1_handler import V1Handler
-from .models.v1_node_address import V1NodeAddress
-from .models.v1_fc_volume_source import V1FCVolumeSource
-from .models.v1_endpoint_port import V1EndpointPort
-from .models.v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from .models.v1_endpoint_subset import V1EndpointSubset
-from .models.v1_limit_range_list import V1LimitRangeList
-from .models.v1_container import V1Container
-from .models.v1_pod_spec import V1PodSpec
-from .models.v1_flocker_volume_source import V1FlockerVolumeSource
-from .models.v1_persistent_volume_status import V1PersistentVolumeStatus
-from .models.v1_rbd_volume_source import V1RBDVolumeSource
-from .models.v1_load_balancer_ingress import V1LoadBalancerIngress
-from .models.v1_security_context import V1SecurityContext
-from .models.v1_service_port import V1ServicePort
-from .models.v1_namespace import V1Namespace
-from .models.v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from .models.v1_endpoints_list import V1EndpointsList
-from .models.v1_node_list import V1NodeList
-from .models.v1_event_source import V1EventSource
-from .models.v1_env_var_source import V1EnvVarSource
-from .models.unversioned_list_meta import UnversionedListMeta
-from .models.v1_limit_range_spec import V1LimitRangeSpec
-from .models.v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from .models.v1_replication_controller import V1ReplicationController
-from .models.v1_namespace_list import V1NamespaceList
-from .models.integer import Integer
-from .models.v1_volume_mount import V1VolumeMount
-from .models.v1_node_status import V1NodeStatus
-from .models.v1_replication_controller_status import V1ReplicationControllerStatus
-from .models.v1_pod_condition import V1PodCondition
-from .models.v1_node_condition import V1NodeCondition
-from .models.v1_pod_security_context import V1PodSecurityContext
-from .models.v1_service_account import V1ServiceAccount
-from .models.v1_pod_template import V1PodTemplate
-from .models.v1_pod_list import V1PodList
-from .models.v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from .models.v1_node_spec import V1NodeSpec
-from .models.v1_http_get_action import V1HTTPGetAction
-from .models.v1_resource_quota_list import V1ResourceQuotaList
-from .models.v1_daemon_endpoint import V1DaemonEndpoint
-from .models.v1_service_account_list import V1ServiceAccountList
-from .models.v1_probe import V1Probe
-from .models.v1_namespace_spec import V1NamespaceSpec
-from .models.v1_iscsi_volume_source import V1ISCSIVolumeSource
-from .models.v1_event_list import V1EventList
-from .models.v1_load_balancer_status import V1LoadBalancerStatus
-from .models.v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from .models.v1_component_status import V1ComponentStatus
-from .models.v1_git_repo_volume_source import V1GitRepoVolumeSource
-from .models.v1_object_meta import V1ObjectMeta
-from .models.v1_secret_key_selector import V1SecretKeySelector
-from .models.v1_local_object_reference import V1LocalObjectReference
-from .models.v1_flex_volume_source import V1FlexVolumeSource
-from .models.v1_container_port import V1ContainerPort
-from .models.v1_secret import V1Secret
-from .models.v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from .models.v1_container_state import V1ContainerState
-from .models.v1_endpoints import V1Endpoints
-from .models.v1_cinder_volume_source import V1CinderVolumeSource
-from .models.v1_pod_status import V1PodStatus
-from .models.v1_se_linux_options import V1SELinuxOptions
-from .models.v1_service import V1Service
-from .models.v1_object_reference import V1ObjectReference
-from .models.v1_object_field_selector import V1ObjectFieldSelector
-from .models.v1_component_status_list import V1ComponentStatusList
-from .models.v1_lifecycle import V1Lifecycle
-from .models.v1_node_system_info import V1NodeSystemInfo
-from .models.json_watch_event import JsonWatchEvent
-from .models.v1_endpoint_address import V1EndpointAddress
-from .models.v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from .models.v1_binding import V1Binding
-from .models.v1_node import V1Node
-from .models.v1_resource_quota import V1ResourceQuota
-from .models.v1_env_var import V1EnvVar
-from .models.unversioned_status_cause import UnversionedStatusCause
-from .models.v1_replication_controller_spec import V1ReplicationControllerSpec
-from .models.v1_container_state_waiting import V1ContainerStateWaiting
-from .models.v1_pod_template_list import V1PodTemplateList
-from .models.v1_limit_range_item import V1LimitRangeItem
-from .models.v1_finalizer_name import V1FinalizerName
-from .models.v1_limit_range import V1LimitRange
-from .models.v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from .models.v1_container_image import V1ContainerImage
-from .models.v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
-
-# import apis into sdk package
-from .apis.apiv_api import ApivApi
+# models and apis are loaded on first access (PEP 562)
+from . import models
+from . import apis
 
 # import ApiClient
 from .api_client import ApiClient
@@ -133,3 +10,15 @@ from .api_client import ApiClient
 from .configuration import Configuration
 
 configuration = Configuration()
+
+
+def __getattr__(name):
+    if name in models.__all__:
+        return getattr(models, name)
+    if name in apis.__all__:
+        return getattr(apis, name)
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(models.__all__) | set(apis.__all__))
@@ -32,6 +32,7 @@ import mimetypes
 import random
 import tempfile
 import threading
+from operator import attrgetter
 
 from datetime import datetime
 from datetime import date
@@ -65,13 +66,25 @@ class ApiClient(object):
     :param host: The base path for the server to call.
     :param header_name: a header to pass when making calls to the API.
     :param header_value: a header value to pass when making calls to the API.
+    :param body_as_bytes: serialize request bodies straight to JSON bytes
+        instead of building an intermediate sanitized dict first.
+    :param rest_client: the `RESTClientObject` sending the requests,
+        e.g. with a different connection pool size.
     """
-    def __init__(self, host=None, header_name=None, header_value=None, cookie=None):
+    def __init__(self, host=None, header_name=None, header_value=None, cookie=None,
+                 body_as_bytes=False, rest_client=None):
 
         """
         Constructor of the class.
         """
-        self.rest_client = RESTClientObject()
+        self.rest_client = rest_client or RESTClientObject()
+        self.body_as_bytes = body_as_bytes
+        # compiled decoders by type (class name string or class literal)
+        self._decoders = {}
+        # compiled encoders and (attribute, json key) plans by class
+        self._encoders = {}
+        self._model_plans = {}
+        self._json_encoder = json.JSONEncoder(default=self.__encode_default)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -103,11 +116,12 @@ class ApiClient(object):
     def __call_api(self, resource_path, method,
                    path_params=None, query_params=None, header_params=None,
                    body=None, post_params=None, files=None,
-                   response_type=None, auth_settings=None, callback=None):
+                   response_type=None, auth_settings=None, callback=None,
+                   _preload_content=True):
 
-        # headers parameters
-        header_params = header_params or {}
-        header_params.update(self.default_headers)
+        # headers parameters, the ones set by the operation
+        # (e.g. a patch Content-Type) win over the default ones
+        header_params = dict(self.default_headers, **(header_params or {}))
         if self.cookie:
             header_params['Cookie'] = self.cookie
         if header_params:
@@ -137,7 +151,10 @@ class ApiClient(object):
 
         # body
         if body:
-            body = self.sanitize_for_serialization(body)
+            if self.body_as_bytes:
+                body = self.serialize_to_bytes(body)
+            else:
+                body = self.sanitize_for_serialization(body)
 
         # request url
         url = self.host + resource_path
@@ -146,10 +163,18 @@ class ApiClient(object):
         response_data = self.request(method, url,
                                      query_params=query_params,
                                      headers=header_params,
-                                     post_params=post_params, body=body)
+                                     post_params=post_params, body=body,
+                                     _preload_content=_preload_content)
 
         self.last_response = response_data
 
+        # streamed responses are handed back undecoded
+        if not _preload_content:
+            if callback:
+                callback(response_data)
+                return
+            return response_data
+
         # deserialize response data
         if response_type:
             deserialized_data = self.deserialize(response_data, response_type)
@@ -187,36 +212,109 @@ class ApiClient(object):
         If obj is dict, return the dict.
         If obj is swagger model, return the properties dict.
 
+        The work to do for each class is compiled once, see `__encoder`.
+
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
+        return self.__encoder(type(obj))(obj)
+
+    def serialize_to_bytes(self, obj):
+        """
+        Serializes an object to utf8 JSON bytes.
+
+        Gives the same bytes as `json.dumps(sanitize_for_serialization(obj))`
+        but lets the json encoder walk the lists and dicts, only models
+        and dates are converted along the way.
+
+        :param obj: The data to serialize.
+        :return: bytes.
+        """
+        return self._json_encoder.encode(obj).encode('utf8')
+
+    def __encode_default(self, obj):
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+        keys, values = self.__model_plan(type(obj))
+        return {key: value for key, value in zip(keys, values(obj))
+                if value is not None}
+
+    def __model_plan(self, klass):
+        """
+        Gets the json keys of a model class and a function
+        returning the values of the matching attributes.
+        """
+        try:
+            return self._model_plans[klass]
+        except KeyError:
+            keys = tuple(klass.attribute_map[attr] for attr in klass.swagger_types)
+            # read the slots behind the generated properties, these getters
+            # only return the private attribute
+            attrs = ['_' + attr for attr in klass.swagger_types]
+            if len(attrs) == 1:
+                getter = attrgetter(attrs[0])
+                values = lambda obj: (getter(obj),)
+            elif attrs:
+                values = attrgetter(*attrs)
+            else:
+                values = lambda obj: ()
+            plan = self._model_plans[klass] = (keys, values)
+            return plan
+
+    def __encoder(self, klass):
+        """
+        Gets the encoder of a class, compiling it the first time.
+
+        :param klass: class literal.
+
+        :return: function sanitizing instances of `klass`.
+        """
+        try:
+            return self._encoders[klass]
+        except KeyError:
+            encoder = self._encoders[klass] = self.__compile_encoder(klass)
+            return encoder
+
+    def __compile_encoder(self, klass):
         types = (str, int, float, bool, tuple)
         if sys.version_info < (3,0):
             types = types + (unicode,)
-        if isinstance(obj, type(None)):
-            return None
-        elif isinstance(obj, types):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, (datetime, date)):
-            return obj.isoformat()
+        # values of these exact types are kept as they are without a lookup
+        natives = frozenset(types)
+        encoders = self._encoders
+        encoder = self.__encoder
+
+        def sanitize(val):
+            if type(val) in natives:
+                return val
+            return (encoders.get(type(val)) or encoder(type(val)))(val)
+
+        if klass is type(None) or issubclass(klass, types):
+            return lambda obj: obj
+        elif issubclass(klass, list):
+            return lambda obj: [sanitize(sub_obj) for sub_obj in obj]
+        elif issubclass(klass, (datetime, date)):
+            return lambda obj: obj.isoformat()
+        elif issubclass(klass, dict):
+            return lambda obj: {key: sanitize(val)
+                                for key, val in iteritems(obj)}
         else:
-            if isinstance(obj, dict):
-                obj_dict = obj
-            else:
-                # Convert model obj to dict except
-                # attributes `swagger_types`, `attribute_map`
-                # and attributes which value is not None.
-                # Convert attribute name to json key in
-                # model definition for request.
-                obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                            for attr, _ in iteritems(obj.swagger_types)
-                            if getattr(obj, attr) is not None}
-
-            return {key: self.sanitize_for_serialization(val)
-                    for key, val in iteritems(obj_dict)}
+            # Convert model obj to dict except
+            # attributes `swagger_types`, `attribute_map`
+            # and attributes which value is not None.
+            # Convert attribute name to json key in
+            # model definition for request.
+            keys, values = self.__model_plan(klass)
+
+            def encode(obj):
+                result = {}
+                for key, val in zip(keys, values(obj)):
+                    if val is not None:
+                        if type(val) not in natives:
+                            val = (encoders.get(type(val)) or encoder(type(val)))(val)
+                        result[key] = val
+                return result
+            return encode
 
     def deserialize(self, response, response_type):
         """
@@ -241,6 +339,20 @@ class ApiClient(object):
 
         return self.__deserialize(data, response_type)
 
+    def deserialize_data(self, data, response_type):
+        """
+        Deserializes already decoded json data into an object.
+
+        Used for payloads that do not come from a full response body,
+        e.g. the `object` of a streamed watch event.
+
+        :param data: dict, list or str.
+        :param response_type: class literal or string of class name.
+
+        :return: deserialized object.
+        """
+        return self.__deserialize(data, response_type)
+
     def __deserialize(self, data, klass):
         """
         Deserializes dict, list, str into an object.
@@ -250,19 +362,42 @@ class ApiClient(object):
 
         :return: object.
         """
-        if data is None:
-            return None
+        return self.__decoder(klass)(data)
+
+    def __decoder(self, klass):
+        """
+        Gets the decoder of a type, compiling it the first time.
+
+        :param klass: class literal, or string of class name.
+
+        :return: function decoding dict, list or str data into `klass`.
+        """
+        try:
+            return self._decoders[klass]
+        except KeyError:
+            decoder = self._decoders[klass] = self.__compile_decoder(klass)
+            return decoder
+
+    def __compile_decoder(self, klass):
+        """
+        Compiles the decoder of a type.
+
+        The type string is parsed once and each model gets a plan of
+        (json key, attribute, sub-decoder) built on its first use,
+        instead of resolving the types of every nested field for every object.
+
+        :param klass: class literal, or string of class name.
 
+        :return: function decoding dict, list or str data into `klass`.
+        """
         if type(klass) == str:
             if klass.startswith('list['):
                 sub_kls = re.match('list\[(.*)\]', klass).group(1)
-                return [self.__deserialize(sub_data, sub_kls)
-                        for sub_data in data]
+                return self.__compile_list_decoder(self.__decoder(sub_kls))
 
             if klass.startswith('dict('):
                 sub_kls = re.match('dict\(([^,]*), (.*)\)', klass).group(2)
-                return {k: self.__deserialize(v, sub_kls)
-                        for k, v in iteritems(data)}
+                return self.__compile_dict_decoder(self.__decoder(sub_kls))
 
             # convert str to class
             # for native types
@@ -271,23 +406,65 @@ class ApiClient(object):
                 klass = eval(klass)
             # for model types
             else:
-                klass = eval('models.' + klass)
+                klass = getattr(models, klass)
 
         if klass in [int, float, str, bool]:
-            return self.__deserialize_primitive(data, klass)
+            return self.__compile_native_decoder(self.__deserialize_primitive, klass)
         elif klass == object:
-            return self.__deserialize_object(data)
+            return self.__compile_native_decoder(self.__deserialize_object)
         elif klass == date:
-            return self.__deserialize_date(data)
+            return self.__compile_native_decoder(self.__deserialize_date)
         elif klass == datetime:
-            return self.__deserialize_datatime(data)
+            return self.__compile_native_decoder(self.__deserialize_datatime)
         else:
-            return self.__deserialize_model(data, klass)
+            return self.__compile_model_decoder(klass)
+
+    def __compile_list_decoder(self, sub_decoder):
+        def decode(data):
+            if data is None:
+                return None
+            return [sub_decoder(sub_data) for sub_data in data]
+        return decode
+
+    def __compile_dict_decoder(self, sub_decoder):
+        def decode(data):
+            if data is None:
+                return None
+            return {k: sub_decoder(v) for k, v in iteritems(data)}
+        return decode
+
+    def __compile_native_decoder(self, function, *args):
+        def decode(data):
+            if data is None:
+                return None
+            return function(data, *args)
+        return decode
+
+    def __compile_model_decoder(self, klass):
+        # the plan is built on first use so self referencing models compile
+        plans = []
+
+        def decode(data):
+            if data is None:
+                return None
+            instance = klass()
+            if not plans:
+                # the generated setters only assign the private attribute
+                plans.append([(instance.attribute_map[attr], '_' + attr,
+                               self.__decoder(attr_type))
+                              for attr, attr_type in iteritems(instance.swagger_types)])
+            if isinstance(data, (list, dict)):
+                for key, attr, sub_decoder in plans[0]:
+                    if key in data:
+                        setattr(instance, attr, sub_decoder(data[key]))
+            return instance
+        return decode
 
     def call_api(self, resource_path, method,
                  path_params=None, query_params=None, header_params=None,
                  body=None, post_params=None, files=None,
-                 response_type=None, auth_settings=None, callback=None):
+                 response_type=None, auth_settings=None, callback=None,
+                 _preload_content=True):
         """
         Makes the HTTP request (synchronous) and return the deserialized data.
         To make an async request, define a function for callback.
@@ -308,6 +485,9 @@ class ApiClient(object):
         :param callback function: Callback function for asynchronous request.
             If provide this parameter,
             the request will be called asynchronously.
+        :param _preload_content: if False, the urllib3.HTTPResponse object
+            is returned without reading or deserializing the response data.
+            Used to stream `watch` responses.
         :return:
             If provide parameter callback,
             the request will be called asynchronously.
@@ -319,7 +499,8 @@ class ApiClient(object):
             return self.__call_api(resource_path, method,
                                    path_params, query_params, header_params,
                                    body, post_params, files,
-                                   response_type, auth_settings, callback)
+                                   response_type, auth_settings, callback,
+                                   _preload_content)
         else:
             thread = threading.Thread(target=self.__call_api,
                                       args=(resource_path, method,
@@ -327,23 +508,25 @@ class ApiClient(object):
                                             header_params, body,
                                             post_params, files,
                                             response_type, auth_settings,
-                                            callback))
+                                            callback, _preload_content))
         thread.start()
         return thread
 
     def request(self, method, url, query_params=None, headers=None,
-                post_params=None, body=None):
+                post_params=None, body=None, _preload_content=True):
         """
         Makes the HTTP request using RESTClient.
         """
         if method == "GET":
             return self.rest_client.GET(url,
                                         query_params=query_params,
-                                        headers=headers)
+                                        headers=headers,
+                                        preload_content=_preload_content)
         elif method == "HEAD":
             return self.rest_client.HEAD(url,
                                          query_params=query_params,
-                                         headers=headers)
+                                         headers=headers,
+                                         preload_content=_preload_content)
         elif method == "OPTIONS":
             return self.rest_client.OPTIONS(url,
                                             query_params=query_params,
@@ -371,7 +554,9 @@ class ApiClient(object):
         elif method == "DELETE":
             return self.rest_client.DELETE(url,
                                            query_params=query_params,
-                                           headers=headers)
+                                           headers=headers,
+                                           body=body,
+                                           preload_content=_preload_content)
         else:
             raise ValueError(
                 "http method must be `GET`, `HEAD`,"
@@ -556,22 +741,3 @@ class ApiClient(object):
                 reason="Failed to parse `{0}` into a datetime object".
                 format(string)
             )
-
-    def __deserialize_model(self, data, klass):
-        """
-        Deserializes list or dict to model.
-
-        :param data: dict, list.
-        :param klass: class literal.
-        :return: model object.
-        """
-        instance = klass()
-
-        for attr, attr_type in iteritems(instance.swagger_types):
-            if data is not None \
-               and instance.attribute_map[attr] in data\
-               and isinstance(data, (list, dict)):
-                value = data[instance.attribute_map[attr]]
-                setattr(instance, attr, self.__deserialize(value, attr_type))
-
-        return instance
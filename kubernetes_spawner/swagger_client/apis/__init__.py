@@ -1,4 +1,32 @@
 from __future__ import absolute_import
 
-# import apis into api package
-from .apiv_api import ApivApi
+import sys
+from importlib import import_module
+
+# The apis are imported on first access (PEP 562)
+# api name -> module of the apis package
+_apis = {
+    'ApivApi': 'apiv_api',
+}
+
+__all__ = list(_apis)
+
+
+def __getattr__(name):
+    try:
+        module = _apis[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    api = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = api
+    return api
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ before python 3.7, import them all
+    for _name in __all__:
+        __getattr__(_name)
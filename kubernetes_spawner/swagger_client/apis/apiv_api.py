@@ -16076,6 +16076,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16083,6 +16085,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16143,7 +16146,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_event_list(self, **kwargs):
@@ -16167,6 +16171,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16174,6 +16180,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16234,7 +16241,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_limit_range_list(self, **kwargs):
@@ -16258,6 +16266,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16265,6 +16275,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16325,7 +16336,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_namespace_list(self, **kwargs):
@@ -16349,6 +16361,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16356,6 +16370,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16416,7 +16431,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_endpoints_list(self, namespace, **kwargs):
@@ -16441,6 +16457,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16448,6 +16466,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16513,7 +16532,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_endpoints(self, namespace, name, **kwargs):
@@ -16539,6 +16559,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16546,6 +16568,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16616,7 +16639,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_event_list(self, namespace, **kwargs):
@@ -16641,6 +16665,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16648,6 +16674,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16713,7 +16740,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_event(self, namespace, name, **kwargs):
@@ -16739,6 +16767,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16746,6 +16776,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16816,7 +16847,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_limit_range_list(self, namespace, **kwargs):
@@ -16841,6 +16873,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16848,6 +16882,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -16913,7 +16948,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_limit_range(self, namespace, name, **kwargs):
@@ -16939,6 +16975,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -16946,6 +16984,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17016,7 +17055,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_persistent_volume_claim_list(self, namespace, **kwargs):
@@ -17041,6 +17081,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17048,6 +17090,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17113,7 +17156,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_persistent_volume_claim(self, namespace, name, **kwargs):
@@ -17139,6 +17183,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17146,6 +17192,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17216,7 +17263,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_pod_list(self, namespace, **kwargs):
@@ -17241,6 +17289,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17248,6 +17298,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17313,7 +17364,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_pod(self, namespace, name, **kwargs):
@@ -17339,6 +17391,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17346,6 +17400,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17416,7 +17471,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_pod_template_list(self, namespace, **kwargs):
@@ -17441,6 +17497,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17448,6 +17506,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17513,7 +17572,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_pod_template(self, namespace, name, **kwargs):
@@ -17539,6 +17599,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17546,6 +17608,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17616,7 +17679,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_replication_controller_list(self, namespace, **kwargs):
@@ -17641,6 +17705,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17648,6 +17714,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17713,7 +17780,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_replication_controller(self, namespace, name, **kwargs):
@@ -17739,6 +17807,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17746,6 +17816,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17816,7 +17887,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_resource_quota_list(self, namespace, **kwargs):
@@ -17841,6 +17913,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17848,6 +17922,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -17913,7 +17988,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_resource_quota(self, namespace, name, **kwargs):
@@ -17939,6 +18015,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -17946,6 +18024,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18016,7 +18095,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_secret_list(self, namespace, **kwargs):
@@ -18041,6 +18121,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18048,6 +18130,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18113,7 +18196,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_secret(self, namespace, name, **kwargs):
@@ -18139,6 +18223,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18146,6 +18232,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18216,7 +18303,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_service_account_list(self, namespace, **kwargs):
@@ -18241,6 +18329,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18248,6 +18338,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18313,7 +18404,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_service_account(self, namespace, name, **kwargs):
@@ -18339,6 +18431,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18346,6 +18440,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18416,7 +18511,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_service_list(self, namespace, **kwargs):
@@ -18441,6 +18537,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18448,6 +18546,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18513,7 +18612,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_service(self, namespace, name, **kwargs):
@@ -18539,6 +18639,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18546,6 +18648,7 @@ class ApivApi(object):
 
         all_params = ['namespace', 'name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18616,7 +18719,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_namespace(self, name, **kwargs):
@@ -18641,6 +18745,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18648,6 +18754,7 @@ class ApivApi(object):
 
         all_params = ['name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18713,7 +18820,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_node_list(self, **kwargs):
@@ -18737,6 +18845,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18744,6 +18854,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18804,7 +18915,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_node(self, name, **kwargs):
@@ -18829,6 +18941,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18836,6 +18950,7 @@ class ApivApi(object):
 
         all_params = ['name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18901,7 +19016,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_persistent_volume_claim_list(self, **kwargs):
@@ -18925,6 +19041,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -18932,6 +19050,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -18992,7 +19111,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_persistent_volume_list(self, **kwargs):
@@ -19016,6 +19136,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19023,6 +19145,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19083,7 +19206,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_namespaced_persistent_volume(self, name, **kwargs):
@@ -19108,6 +19232,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19115,6 +19241,7 @@ class ApivApi(object):
 
         all_params = ['name', 'pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19180,7 +19307,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_pod_list(self, **kwargs):
@@ -19204,6 +19332,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19211,6 +19341,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19271,7 +19402,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_pod_template_list(self, **kwargs):
@@ -19295,6 +19427,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19302,6 +19436,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19362,7 +19497,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_replication_controller_list(self, **kwargs):
@@ -19386,6 +19522,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19393,6 +19531,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19453,7 +19592,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_resource_quota_list(self, **kwargs):
@@ -19477,6 +19617,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19484,6 +19626,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19544,7 +19687,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_secret_list(self, **kwargs):
@@ -19568,6 +19712,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19575,6 +19721,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19635,7 +19782,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_service_account_list(self, **kwargs):
@@ -19659,6 +19807,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19666,6 +19816,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19726,7 +19877,8 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
 
     def watch_service_list(self, **kwargs):
@@ -19750,6 +19902,8 @@ class ApivApi(object):
         :param bool watch: Watch for changes to the described resources and return them as a stream of add, update, and remove notifications. Specify resourceVersion.
         :param str resource_version: When specified with a watch call, shows changes that occur after that particular version of a resource. Defaults to changes from the beginning of history.
         :param int timeout_seconds: Timeout for the list/watch call.
+        :param bool _preload_content: if False, the raw urllib3.HTTPResponse
+            is returned so the event stream can be consumed incrementally.
         :return: JsonWatchEvent
                  If the method is called asynchronously,
                  returns the request thread.
@@ -19757,6 +19911,7 @@ class ApivApi(object):
 
         all_params = ['pretty', 'label_selector', 'field_selector', 'watch', 'resource_version', 'timeout_seconds']
         all_params.append('callback')
+        all_params.append('_preload_content')
 
         params = locals()
         for key, val in iteritems(params['kwargs']):
@@ -19817,5 +19972,6 @@ class ApivApi(object):
                                             files=files,
                                             response_type='JsonWatchEvent',
                                             auth_settings=auth_settings,
-                                            callback=params.get('callback'))
+                                            callback=params.get('callback'),
+                                            _preload_content=params.get('_preload_content', True))
         return response
@@ -1,125 +1,154 @@
 from __future__ import absolute_import
 
-# import models into model package
-from .v1_persistent_volume import V1PersistentVolume
-from .v1_tcp_socket_action import V1TCPSocketAction
-from .v1_resource_quota_status import V1ResourceQuotaStatus
-from .v1_container_state_terminated import V1ContainerStateTerminated
-from .v1_replication_controller_list import V1ReplicationControllerList
-from .v1_capability import V1Capability
-from .v1_pod import V1Pod
-from .v1_event import V1Event
-from .v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from .v1_host_path_volume_source import V1HostPathVolumeSource
-from .v1_config_map_key_selector import V1ConfigMapKeySelector
-from .v1_volume import V1Volume
-from .v1_container_state_running import V1ContainerStateRunning
-from .v1_delete_options import V1DeleteOptions
-from .v1_pod_template_spec import V1PodTemplateSpec
-from .v1_secret_list import V1SecretList
-from .v1_nfs_volume_source import V1NFSVolumeSource
-from .v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from .v1_capabilities import V1Capabilities
-from .v1_component_condition import V1ComponentCondition
-from .unversioned_status import UnversionedStatus
-from .v1_service_status import V1ServiceStatus
-from .unversioned_status_details import UnversionedStatusDetails
-from .v1_secret_volume_source import V1SecretVolumeSource
-from .v1_resource_requirements import V1ResourceRequirements
-from .v1_persistent_volume_claim import V1PersistentVolumeClaim
-from .unversioned_patch import UnversionedPatch
-from .v1_namespace_status import V1NamespaceStatus
-from .v1_persistent_volume_access_mode import V1PersistentVolumeAccessMode
-from .v1_resource_quota_spec import V1ResourceQuotaSpec
-from .v1_persistent_volume_spec import V1PersistentVolumeSpec
-from .v1_exec_action import V1ExecAction
-from .v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from .v1_service_spec import V1ServiceSpec
-from .v1_service_list import V1ServiceList
-from .v1_persistent_volume_list import V1PersistentVolumeList
-from .v1_container_status import V1ContainerStatus
-from .v1_handler import V1Handler
-from .v1_node_address import V1NodeAddress
-from .v1_fc_volume_source import V1FCVolumeSource
-from .v1_endpoint_port import V1EndpointPort
-from .v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from .v1_endpoint_subset import V1EndpointSubset
-from .v1_limit_range_list import V1LimitRangeList
-from .v1_container import V1Container
-from .v1_pod_spec import V1PodSpec
-from .v1_flocker_volume_source import V1FlockerVolumeSource
-from .v1_persistent_volume_status import V1PersistentVolumeStatus
-from .v1_rbd_volume_source import V1RBDVolumeSource
-from .v1_load_balancer_ingress import V1LoadBalancerIngress
-from .v1_security_context import V1SecurityContext
-from .v1_service_port import V1ServicePort
-from .v1_namespace import V1Namespace
-from .v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from .v1_endpoints_list import V1EndpointsList
-from .v1_node_list import V1NodeList
-from .v1_event_source import V1EventSource
-from .v1_env_var_source import V1EnvVarSource
-from .unversioned_list_meta import UnversionedListMeta
-from .v1_limit_range_spec import V1LimitRangeSpec
-from .v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from .v1_replication_controller import V1ReplicationController
-from .v1_namespace_list import V1NamespaceList
-from .integer import Integer
-from .v1_volume_mount import V1VolumeMount
-from .v1_node_status import V1NodeStatus
-from .v1_replication_controller_status import V1ReplicationControllerStatus
-from .v1_pod_condition import V1PodCondition
-from .v1_node_condition import V1NodeCondition
-from .v1_pod_security_context import V1PodSecurityContext
-from .v1_service_account import V1ServiceAccount
-from .v1_pod_template import V1PodTemplate
-from .v1_pod_list import V1PodList
-from .v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from .v1_node_spec import V1NodeSpec
-from .v1_http_get_action import V1HTTPGetAction
-from .v1_resource_quota_list import V1ResourceQuotaList
-from .v1_daemon_endpoint import V1DaemonEndpoint
-from .v1_service_account_list import V1ServiceAccountList
-from .v1_probe import V1Probe
-from .v1_namespace_spec import V1NamespaceSpec
-from .v1_iscsi_volume_source import V1ISCSIVolumeSource
-from .v1_event_list import V1EventList
-from .v1_load_balancer_status import V1LoadBalancerStatus
-from .v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from .v1_component_status import V1ComponentStatus
-from .v1_git_repo_volume_source import V1GitRepoVolumeSource
-from .v1_object_meta import V1ObjectMeta
-from .v1_secret_key_selector import V1SecretKeySelector
-from .v1_local_object_reference import V1LocalObjectReference
-from .v1_flex_volume_source import V1FlexVolumeSource
-from .v1_container_port import V1ContainerPort
-from .v1_secret import V1Secret
-from .v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from .v1_container_state import V1ContainerState
-from .v1_endpoints import V1Endpoints
-from .v1_cinder_volume_source import V1CinderVolumeSource
-from .v1_pod_status import V1PodStatus
-from .v1_se_linux_options import V1SELinuxOptions
-from .v1_service import V1Service
-from .v1_object_reference import V1ObjectReference
-from .v1_object_field_selector import V1ObjectFieldSelector
-from .v1_component_status_list import V1ComponentStatusList
-from .v1_lifecycle import V1Lifecycle
-from .v1_node_system_info import V1NodeSystemInfo
-from .json_watch_event import JsonWatchEvent
-from .v1_endpoint_address import V1EndpointAddress
-from .v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from .v1_binding import V1Binding
-from .v1_node import V1Node
-from .v1_resource_quota import V1ResourceQuota
-from .v1_env_var import V1EnvVar
-from .unversioned_status_cause import UnversionedStatusCause
-from .v1_replication_controller_spec import V1ReplicationControllerSpec
-from .v1_container_state_waiting import V1ContainerStateWaiting
-from .v1_pod_template_list import V1PodTemplateList
-from .v1_limit_range_item import V1LimitRangeItem
-from .v1_finalizer_name import V1FinalizerName
-from .v1_limit_range import V1LimitRange
-from .v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from .v1_container_image import V1ContainerImage
-from .v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
+import sys
+from importlib import import_module
+
+# Models are imported on first access (PEP 562), most of them are never used
+# and importing them all slows down the start of the hub.
+# model name -> module of the model package
+_models = {
+    'V1PersistentVolume': 'v1_persistent_volume',
+    'V1TCPSocketAction': 'v1_tcp_socket_action',
+    'V1ResourceQuotaStatus': 'v1_resource_quota_status',
+    'V1ContainerStateTerminated': 'v1_container_state_terminated',
+    'V1ReplicationControllerList': 'v1_replication_controller_list',
+    'V1Capability': 'v1_capability',
+    'V1Pod': 'v1_pod',
+    'V1Event': 'v1_event',
+    'V1NodeDaemonEndpoints': 'v1_node_daemon_endpoints',
+    'V1HostPathVolumeSource': 'v1_host_path_volume_source',
+    'V1ConfigMapKeySelector': 'v1_config_map_key_selector',
+    'V1Volume': 'v1_volume',
+    'V1ContainerStateRunning': 'v1_container_state_running',
+    'V1DeleteOptions': 'v1_delete_options',
+    'V1PodTemplateSpec': 'v1_pod_template_spec',
+    'V1SecretList': 'v1_secret_list',
+    'V1NFSVolumeSource': 'v1_nfs_volume_source',
+    'V1CephFSVolumeSource': 'v1_ceph_fs_volume_source',
+    'V1Capabilities': 'v1_capabilities',
+    'V1ComponentCondition': 'v1_component_condition',
+    'UnversionedStatus': 'unversioned_status',
+    'V1ServiceStatus': 'v1_service_status',
+    'UnversionedStatusDetails': 'unversioned_status_details',
+    'V1SecretVolumeSource': 'v1_secret_volume_source',
+    'V1ResourceRequirements': 'v1_resource_requirements',
+    'V1PersistentVolumeClaim': 'v1_persistent_volume_claim',
+    'UnversionedPatch': 'unversioned_patch',
+    'V1NamespaceStatus': 'v1_namespace_status',
+    'V1PersistentVolumeAccessMode': 'v1_persistent_volume_access_mode',
+    'V1ResourceQuotaSpec': 'v1_resource_quota_spec',
+    'V1PersistentVolumeSpec': 'v1_persistent_volume_spec',
+    'V1ExecAction': 'v1_exec_action',
+    'V1PersistentVolumeClaimVolumeSource': 'v1_persistent_volume_claim_volume_source',
+    'V1ServiceSpec': 'v1_service_spec',
+    'V1ServiceList': 'v1_service_list',
+    'V1PersistentVolumeList': 'v1_persistent_volume_list',
+    'V1ContainerStatus': 'v1_container_status',
+    'V1Handler': 'v1_handler',
+    'V1NodeAddress': 'v1_node_address',
+    'V1FCVolumeSource': 'v1_fc_volume_source',
+    'V1EndpointPort': 'v1_endpoint_port',
+    'V1DownwardAPIVolumeFile': 'v1_downward_api_volume_file',
+    'V1EndpointSubset': 'v1_endpoint_subset',
+    'V1LimitRangeList': 'v1_limit_range_list',
+    'V1Container': 'v1_container',
+    'V1PodSpec': 'v1_pod_spec',
+    'V1FlockerVolumeSource': 'v1_flocker_volume_source',
+    'V1PersistentVolumeStatus': 'v1_persistent_volume_status',
+    'V1RBDVolumeSource': 'v1_rbd_volume_source',
+    'V1LoadBalancerIngress': 'v1_load_balancer_ingress',
+    'V1SecurityContext': 'v1_security_context',
+    'V1ServicePort': 'v1_service_port',
+    'V1Namespace': 'v1_namespace',
+    'V1GCEPersistentDiskVolumeSource': 'v1_gce_persistent_disk_volume_source',
+    'V1EndpointsList': 'v1_endpoints_list',
+    'V1NodeList': 'v1_node_list',
+    'V1EventSource': 'v1_event_source',
+    'V1EnvVarSource': 'v1_env_var_source',
+    'UnversionedListMeta': 'unversioned_list_meta',
+    'V1LimitRangeSpec': 'v1_limit_range_spec',
+    'V1PersistentVolumeClaimSpec': 'v1_persistent_volume_claim_spec',
+    'V1ReplicationController': 'v1_replication_controller',
+    'V1NamespaceList': 'v1_namespace_list',
+    'Integer': 'integer',
+    'V1VolumeMount': 'v1_volume_mount',
+    'V1NodeStatus': 'v1_node_status',
+    'V1ReplicationControllerStatus': 'v1_replication_controller_status',
+    'V1PodCondition': 'v1_pod_condition',
+    'V1NodeCondition': 'v1_node_condition',
+    'V1PodSecurityContext': 'v1_pod_security_context',
+    'V1ServiceAccount': 'v1_service_account',
+    'V1PodTemplate': 'v1_pod_template',
+    'V1PodList': 'v1_pod_list',
+    'V1EmptyDirVolumeSource': 'v1_empty_dir_volume_source',
+    'V1NodeSpec': 'v1_node_spec',
+    'V1HTTPGetAction': 'v1_http_get_action',
+    'V1ResourceQuotaList': 'v1_resource_quota_list',
+    'V1DaemonEndpoint': 'v1_daemon_endpoint',
+    'V1ServiceAccountList': 'v1_service_account_list',
+    'V1Probe': 'v1_probe',
+    'V1NamespaceSpec': 'v1_namespace_spec',
+    'V1ISCSIVolumeSource': 'v1_iscsi_volume_source',
+    'V1EventList': 'v1_event_list',
+    'V1LoadBalancerStatus': 'v1_load_balancer_status',
+    'V1PersistentVolumeClaimList': 'v1_persistent_volume_claim_list',
+    'V1ComponentStatus': 'v1_component_status',
+    'V1GitRepoVolumeSource': 'v1_git_repo_volume_source',
+    'V1ObjectMeta': 'v1_object_meta',
+    'V1SecretKeySelector': 'v1_secret_key_selector',
+    'V1LocalObjectReference': 'v1_local_object_reference',
+    'V1FlexVolumeSource': 'v1_flex_volume_source',
+    'V1ContainerPort': 'v1_container_port',
+    'V1Secret': 'v1_secret',
+    'V1DownwardAPIVolumeSource': 'v1_downward_api_volume_source',
+    'V1ContainerState': 'v1_container_state',
+    'V1Endpoints': 'v1_endpoints',
+    'V1CinderVolumeSource': 'v1_cinder_volume_source',
+    'V1PodStatus': 'v1_pod_status',
+    'V1SELinuxOptions': 'v1_se_linux_options',
+    'V1Service': 'v1_service',
+    'V1ObjectReference': 'v1_object_reference',
+    'V1ObjectFieldSelector': 'v1_object_field_selector',
+    'V1ComponentStatusList': 'v1_component_status_list',
+    'V1Lifecycle': 'v1_lifecycle',
+    'V1NodeSystemInfo': 'v1_node_system_info',
+    'JsonWatchEvent': 'json_watch_event',
+    'V1EndpointAddress': 'v1_endpoint_address',
+    'V1AWSElasticBlockStoreVolumeSource': 'v1_aws_elastic_block_store_volume_source',
+    'V1Binding': 'v1_binding',
+    'V1Node': 'v1_node',
+    'V1ResourceQuota': 'v1_resource_quota',
+    'V1EnvVar': 'v1_env_var',
+    'UnversionedStatusCause': 'unversioned_status_cause',
+    'V1ReplicationControllerSpec': 'v1_replication_controller_spec',
+    'V1ContainerStateWaiting': 'v1_container_state_waiting',
+    'V1PodTemplateList': 'v1_pod_template_list',
+    'V1LimitRangeItem': 'v1_limit_range_item',
+    'V1FinalizerName': 'v1_finalizer_name',
+    'V1LimitRange': 'v1_limit_range',
+    'V1GlusterfsVolumeSource': 'v1_glusterfs_volume_source',
+    'V1ContainerImage': 'v1_container_image',
+    'V1PersistentVolumeClaimStatus': 'v1_persistent_volume_claim_status',
+}
+
+__all__ = list(_models)
+
+
+def __getattr__(name):
+    try:
+        module = _models[name]
+    except KeyError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    model = getattr(import_module('.' + module, __name__), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if sys.version_info < (3, 7):
+    # no module __getattr__ before python 3.7, import them all
+    for _name in __all__:
+        __getattr__(_name)
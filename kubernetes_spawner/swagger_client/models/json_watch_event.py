@@ -26,26 +26,28 @@ class JsonWatchEvent(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'type': 'str',
+        'object': 'str'
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'object': 'object'
+    }
+
+    __slots__ = ('_type', '_object')
+
     def __init__(self):
         """
         JsonWatchEvent - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'type': 'str',
-            'object': 'str'
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'object': 'object'
-        }
-
         self._type = None
         self._object = None
 
@@ -125,11 +127,14 @@ class JsonWatchEvent(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,26 +26,28 @@ class UnversionedListMeta(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'self_link': 'str',
+        'resource_version': 'str'
+    }
+
+    attribute_map = {
+        'self_link': 'selfLink',
+        'resource_version': 'resourceVersion'
+    }
+
+    __slots__ = ('_self_link', '_resource_version')
+
     def __init__(self):
         """
         UnversionedListMeta - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'self_link': 'str',
-            'resource_version': 'str'
-        }
-
-        self.attribute_map = {
-            'self_link': 'selfLink',
-            'resource_version': 'resourceVersion'
-        }
-
         self._self_link = None
         self._resource_version = None
 
@@ -125,11 +127,14 @@ class UnversionedListMeta(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
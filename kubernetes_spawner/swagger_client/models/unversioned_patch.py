@@ -26,24 +26,23 @@ class UnversionedPatch(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {}
+
+    attribute_map = {}
+
+    __slots__ = ()
+
     def __init__(self):
         """
         UnversionedPatch - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            
-        }
-
-        self.attribute_map = {
-            
-        }
-
+        pass
 
     def to_dict(self):
         """
@@ -77,11 +76,14 @@ class UnversionedPatch(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
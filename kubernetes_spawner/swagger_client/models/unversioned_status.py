@@ -26,38 +26,40 @@ class UnversionedStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'kind': 'str',
+        'api_version': 'str',
+        'metadata': 'UnversionedListMeta',
+        'status': 'str',
+        'message': 'str',
+        'reason': 'str',
+        'details': 'UnversionedStatusDetails',
+        'code': 'int'
+    }
+
+    attribute_map = {
+        'kind': 'kind',
+        'api_version': 'apiVersion',
+        'metadata': 'metadata',
+        'status': 'status',
+        'message': 'message',
+        'reason': 'reason',
+        'details': 'details',
+        'code': 'code'
+    }
+
+    __slots__ = ('_kind', '_api_version', '_metadata', '_status', '_message', '_reason', '_details', '_code')
+
     def __init__(self):
         """
         UnversionedStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'kind': 'str',
-            'api_version': 'str',
-            'metadata': 'UnversionedListMeta',
-            'status': 'str',
-            'message': 'str',
-            'reason': 'str',
-            'details': 'UnversionedStatusDetails',
-            'code': 'int'
-        }
-
-        self.attribute_map = {
-            'kind': 'kind',
-            'api_version': 'apiVersion',
-            'metadata': 'metadata',
-            'status': 'status',
-            'message': 'message',
-            'reason': 'reason',
-            'details': 'details',
-            'code': 'code'
-        }
-
+        """
         self._kind = None
         self._api_version = None
         self._metadata = None
@@ -275,11 +277,14 @@ class UnversionedStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,28 +26,30 @@ class UnversionedStatusCause(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'reason': 'str',
+        'message': 'str',
+        'field': 'str'
+    }
+
+    attribute_map = {
+        'reason': 'reason',
+        'message': 'message',
+        'field': 'field'
+    }
+
+    __slots__ = ('_reason', '_message', '_field')
+
     def __init__(self):
         """
         UnversionedStatusCause - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'reason': 'str',
-            'message': 'str',
-            'field': 'str'
-        }
-
-        self.attribute_map = {
-            'reason': 'reason',
-            'message': 'message',
-            'field': 'field'
-        }
-
         self._reason = None
         self._message = None
         self._field = None
@@ -150,11 +152,14 @@ class UnversionedStatusCause(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,32 +26,34 @@ class UnversionedStatusDetails(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'group': 'str',
+        'kind': 'str',
+        'causes': 'list[UnversionedStatusCause]',
+        'retry_after_seconds': 'int'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'group': 'group',
+        'kind': 'kind',
+        'causes': 'causes',
+        'retry_after_seconds': 'retryAfterSeconds'
+    }
+
+    __slots__ = ('_name', '_group', '_kind', '_causes', '_retry_after_seconds')
+
     def __init__(self):
         """
         UnversionedStatusDetails - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'group': 'str',
-            'kind': 'str',
-            'causes': 'list[UnversionedStatusCause]',
-            'retry_after_seconds': 'int'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'group': 'group',
-            'kind': 'kind',
-            'causes': 'causes',
-            'retry_after_seconds': 'retryAfterSeconds'
-        }
-
+        """
         self._name = None
         self._group = None
         self._kind = None
@@ -200,11 +202,14 @@ class UnversionedStatusDetails(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,30 +26,32 @@ class V1AWSElasticBlockStoreVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'volume_id': 'str',
+        'fs_type': 'str',
+        'partition': 'int',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'volume_id': 'volumeID',
+        'fs_type': 'fsType',
+        'partition': 'partition',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_volume_id', '_fs_type', '_partition', '_read_only')
+
     def __init__(self):
         """
         V1AWSElasticBlockStoreVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'volume_id': 'str',
-            'fs_type': 'str',
-            'partition': 'int',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'volume_id': 'volumeID',
-            'fs_type': 'fsType',
-            'partition': 'partition',
-            'read_only': 'readOnly'
-        }
-
+        """
         self._volume_id = None
         self._fs_type = None
         self._partition = None
@@ -175,11 +177,14 @@ class V1AWSElasticBlockStoreVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,26 +26,28 @@ class V1Capabilities(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'add': 'list[V1Capability]',
+        'drop': 'list[V1Capability]'
+    }
+
+    attribute_map = {
+        'add': 'add',
+        'drop': 'drop'
+    }
+
+    __slots__ = ('_add', '_drop')
+
     def __init__(self):
         """
         V1Capabilities - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'add': 'list[V1Capability]',
-            'drop': 'list[V1Capability]'
-        }
-
-        self.attribute_map = {
-            'add': 'add',
-            'drop': 'drop'
-        }
-
         self._add = None
         self._drop = None
 
@@ -125,11 +127,14 @@ class V1Capabilities(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
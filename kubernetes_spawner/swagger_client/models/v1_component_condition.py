@@ -26,30 +26,32 @@ class V1ComponentCondition(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'type': 'str',
+        'status': 'str',
+        'message': 'str',
+        'error': 'str'
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'status': 'status',
+        'message': 'message',
+        'error': 'error'
+    }
+
+    __slots__ = ('_type', '_status', '_message', '_error')
+
     def __init__(self):
         """
         V1ComponentCondition - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'type': 'str',
-            'status': 'str',
-            'message': 'str',
-            'error': 'str'
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'status': 'status',
-            'message': 'message',
-            'error': 'error'
-        }
-
+        """
         self._type = None
         self._status = None
         self._message = None
@@ -175,11 +177,14 @@ class V1ComponentCondition(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
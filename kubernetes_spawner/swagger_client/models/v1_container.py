@@ -26,58 +26,60 @@ class V1Container(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'image': 'str',
+        'command': 'list[str]',
+        'args': 'list[str]',
+        'working_dir': 'str',
+        'ports': 'list[V1ContainerPort]',
+        'env': 'list[V1EnvVar]',
+        'resources': 'V1ResourceRequirements',
+        'volume_mounts': 'list[V1VolumeMount]',
+        'liveness_probe': 'V1Probe',
+        'readiness_probe': 'V1Probe',
+        'lifecycle': 'V1Lifecycle',
+        'termination_message_path': 'str',
+        'image_pull_policy': 'str',
+        'security_context': 'V1SecurityContext',
+        'stdin': 'bool',
+        'stdin_once': 'bool',
+        'tty': 'bool'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'image': 'image',
+        'command': 'command',
+        'args': 'args',
+        'working_dir': 'workingDir',
+        'ports': 'ports',
+        'env': 'env',
+        'resources': 'resources',
+        'volume_mounts': 'volumeMounts',
+        'liveness_probe': 'livenessProbe',
+        'readiness_probe': 'readinessProbe',
+        'lifecycle': 'lifecycle',
+        'termination_message_path': 'terminationMessagePath',
+        'image_pull_policy': 'imagePullPolicy',
+        'security_context': 'securityContext',
+        'stdin': 'stdin',
+        'stdin_once': 'stdinOnce',
+        'tty': 'tty'
+    }
+
+    __slots__ = ('_name', '_image', '_command', '_args', '_working_dir', '_ports', '_env', '_resources', '_volume_mounts', '_liveness_probe', '_readiness_probe', '_lifecycle', '_termination_message_path', '_image_pull_policy', '_security_context', '_stdin', '_stdin_once', '_tty')
+
     def __init__(self):
         """
         V1Container - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'image': 'str',
-            'command': 'list[str]',
-            'args': 'list[str]',
-            'working_dir': 'str',
-            'ports': 'list[V1ContainerPort]',
-            'env': 'list[V1EnvVar]',
-            'resources': 'V1ResourceRequirements',
-            'volume_mounts': 'list[V1VolumeMount]',
-            'liveness_probe': 'V1Probe',
-            'readiness_probe': 'V1Probe',
-            'lifecycle': 'V1Lifecycle',
-            'termination_message_path': 'str',
-            'image_pull_policy': 'str',
-            'security_context': 'V1SecurityContext',
-            'stdin': 'bool',
-            'stdin_once': 'bool',
-            'tty': 'bool'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'image': 'image',
-            'command': 'command',
-            'args': 'args',
-            'working_dir': 'workingDir',
-            'ports': 'ports',
-            'env': 'env',
-            'resources': 'resources',
-            'volume_mounts': 'volumeMounts',
-            'liveness_probe': 'livenessProbe',
-            'readiness_probe': 'readinessProbe',
-            'lifecycle': 'lifecycle',
-            'termination_message_path': 'terminationMessagePath',
-            'image_pull_policy': 'imagePullPolicy',
-            'security_context': 'securityContext',
-            'stdin': 'stdin',
-            'stdin_once': 'stdinOnce',
-            'tty': 'tty'
-        }
-
+        """
         self._name = None
         self._image = None
         self._command = None
@@ -525,11 +527,14 @@ class V1Container(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
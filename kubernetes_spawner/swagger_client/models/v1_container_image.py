@@ -26,26 +26,28 @@ class V1ContainerImage(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'repo_tags': 'list[str]',
+        'size': 'int'
+    }
+
+    attribute_map = {
+        'repo_tags': 'repoTags',
+        'size': 'size'
+    }
+
+    __slots__ = ('_repo_tags', '_size')
+
     def __init__(self):
         """
         V1ContainerImage - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'repo_tags': 'list[str]',
-            'size': 'int'
-        }
-
-        self.attribute_map = {
-            'repo_tags': 'repoTags',
-            'size': 'size'
-        }
-
         self._repo_tags = None
         self._size = None
 
@@ -125,11 +127,14 @@ class V1ContainerImage(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
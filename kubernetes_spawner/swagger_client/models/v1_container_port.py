@@ -26,32 +26,34 @@ class V1ContainerPort(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'host_port': 'int',
+        'container_port': 'int',
+        'protocol': 'str',
+        'host_ip': 'str'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'host_port': 'hostPort',
+        'container_port': 'containerPort',
+        'protocol': 'protocol',
+        'host_ip': 'hostIP'
+    }
+
+    __slots__ = ('_name', '_host_port', '_container_port', '_protocol', '_host_ip')
+
     def __init__(self):
         """
         V1ContainerPort - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'host_port': 'int',
-            'container_port': 'int',
-            'protocol': 'str',
-            'host_ip': 'str'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'host_port': 'hostPort',
-            'container_port': 'containerPort',
-            'protocol': 'protocol',
-            'host_ip': 'hostIP'
-        }
-
+        """
         self._name = None
         self._host_port = None
         self._container_port = None
@@ -200,11 +202,14 @@ class V1ContainerPort(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
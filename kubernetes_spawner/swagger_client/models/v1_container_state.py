@@ -26,28 +26,30 @@ class V1ContainerState(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'waiting': 'V1ContainerStateWaiting',
+        'running': 'V1ContainerStateRunning',
+        'terminated': 'V1ContainerStateTerminated'
+    }
+
+    attribute_map = {
+        'waiting': 'waiting',
+        'running': 'running',
+        'terminated': 'terminated'
+    }
+
+    __slots__ = ('_waiting', '_running', '_terminated')
+
     def __init__(self):
         """
         V1ContainerState - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'waiting': 'V1ContainerStateWaiting',
-            'running': 'V1ContainerStateRunning',
-            'terminated': 'V1ContainerStateTerminated'
-        }
-
-        self.attribute_map = {
-            'waiting': 'waiting',
-            'running': 'running',
-            'terminated': 'terminated'
-        }
-
         self._waiting = None
         self._running = None
         self._terminated = None
@@ -150,11 +152,14 @@ class V1ContainerState(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
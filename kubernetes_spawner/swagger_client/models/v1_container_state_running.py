@@ -26,24 +26,26 @@ class V1ContainerStateRunning(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'started_at': 'str'
+    }
+
+    attribute_map = {
+        'started_at': 'startedAt'
+    }
+
+    __slots__ = ('_started_at',)
+
     def __init__(self):
         """
         V1ContainerStateRunning - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'started_at': 'str'
-        }
-
-        self.attribute_map = {
-            'started_at': 'startedAt'
-        }
-
         self._started_at = None
 
     @property
@@ -100,11 +102,14 @@ class V1ContainerStateRunning(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,36 +26,38 @@ class V1ContainerStateTerminated(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'exit_code': 'int',
+        'signal': 'int',
+        'reason': 'str',
+        'message': 'str',
+        'started_at': 'str',
+        'finished_at': 'str',
+        'container_id': 'str'
+    }
+
+    attribute_map = {
+        'exit_code': 'exitCode',
+        'signal': 'signal',
+        'reason': 'reason',
+        'message': 'message',
+        'started_at': 'startedAt',
+        'finished_at': 'finishedAt',
+        'container_id': 'containerID'
+    }
+
+    __slots__ = ('_exit_code', '_signal', '_reason', '_message', '_started_at', '_finished_at', '_container_id')
+
     def __init__(self):
         """
         V1ContainerStateTerminated - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'exit_code': 'int',
-            'signal': 'int',
-            'reason': 'str',
-            'message': 'str',
-            'started_at': 'str',
-            'finished_at': 'str',
-            'container_id': 'str'
-        }
-
-        self.attribute_map = {
-            'exit_code': 'exitCode',
-            'signal': 'signal',
-            'reason': 'reason',
-            'message': 'message',
-            'started_at': 'startedAt',
-            'finished_at': 'finishedAt',
-            'container_id': 'containerID'
-        }
-
+        """
         self._exit_code = None
         self._signal = None
         self._reason = None
@@ -250,11 +252,14 @@ class V1ContainerStateTerminated(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,38 +26,40 @@ class V1ContainerStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'state': 'V1ContainerState',
+        'last_state': 'V1ContainerState',
+        'ready': 'bool',
+        'restart_count': 'int',
+        'image': 'str',
+        'image_id': 'str',
+        'container_id': 'str'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'state': 'state',
+        'last_state': 'lastState',
+        'ready': 'ready',
+        'restart_count': 'restartCount',
+        'image': 'image',
+        'image_id': 'imageID',
+        'container_id': 'containerID'
+    }
+
+    __slots__ = ('_name', '_state', '_last_state', '_ready', '_restart_count', '_image', '_image_id', '_container_id')
+
     def __init__(self):
         """
         V1ContainerStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'state': 'V1ContainerState',
-            'last_state': 'V1ContainerState',
-            'ready': 'bool',
-            'restart_count': 'int',
-            'image': 'str',
-            'image_id': 'str',
-            'container_id': 'str'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'state': 'state',
-            'last_state': 'lastState',
-            'ready': 'ready',
-            'restart_count': 'restartCount',
-            'image': 'image',
-            'image_id': 'imageID',
-            'container_id': 'containerID'
-        }
-
+        """
         self._name = None
         self._state = None
         self._last_state = None
@@ -275,11 +277,14 @@ class V1ContainerStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,26 +26,28 @@ class V1DownwardAPIVolumeFile(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'path': 'str',
+        'field_ref': 'V1ObjectFieldSelector'
+    }
+
+    attribute_map = {
+        'path': 'path',
+        'field_ref': 'fieldRef'
+    }
+
+    __slots__ = ('_path', '_field_ref')
+
     def __init__(self):
         """
         V1DownwardAPIVolumeFile - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'path': 'str',
-            'field_ref': 'V1ObjectFieldSelector'
-        }
-
-        self.attribute_map = {
-            'path': 'path',
-            'field_ref': 'fieldRef'
-        }
-
         self._path = None
         self._field_ref = None
 
@@ -125,11 +127,14 @@ class V1DownwardAPIVolumeFile(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
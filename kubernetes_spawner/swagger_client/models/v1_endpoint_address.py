@@ -26,26 +26,28 @@ class V1EndpointAddress(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'ip': 'str',
+        'target_ref': 'V1ObjectReference'
+    }
+
+    attribute_map = {
+        'ip': 'ip',
+        'target_ref': 'targetRef'
+    }
+
+    __slots__ = ('_ip', '_target_ref')
+
     def __init__(self):
         """
         V1EndpointAddress - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'ip': 'str',
-            'target_ref': 'V1ObjectReference'
-        }
-
-        self.attribute_map = {
-            'ip': 'ip',
-            'target_ref': 'targetRef'
-        }
-
         self._ip = None
         self._target_ref = None
 
@@ -125,11 +127,14 @@ class V1EndpointAddress(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
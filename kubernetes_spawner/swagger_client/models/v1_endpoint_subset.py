@@ -26,28 +26,30 @@ class V1EndpointSubset(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'addresses': 'list[V1EndpointAddress]',
+        'not_ready_addresses': 'list[V1EndpointAddress]',
+        'ports': 'list[V1EndpointPort]'
+    }
+
+    attribute_map = {
+        'addresses': 'addresses',
+        'not_ready_addresses': 'notReadyAddresses',
+        'ports': 'ports'
+    }
+
+    __slots__ = ('_addresses', '_not_ready_addresses', '_ports')
+
     def __init__(self):
         """
         V1EndpointSubset - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'addresses': 'list[V1EndpointAddress]',
-            'not_ready_addresses': 'list[V1EndpointAddress]',
-            'ports': 'list[V1EndpointPort]'
-        }
-
-        self.attribute_map = {
-            'addresses': 'addresses',
-            'not_ready_addresses': 'notReadyAddresses',
-            'ports': 'ports'
-        }
-
         self._addresses = None
         self._not_ready_addresses = None
         self._ports = None
@@ -150,11 +152,14 @@ class V1EndpointSubset(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
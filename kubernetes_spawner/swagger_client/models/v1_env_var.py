@@ -26,28 +26,30 @@ class V1EnvVar(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'value': 'str',
+        'value_from': 'V1EnvVarSource'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'value': 'value',
+        'value_from': 'valueFrom'
+    }
+
+    __slots__ = ('_name', '_value', '_value_from')
+
     def __init__(self):
         """
         V1EnvVar - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'name': 'str',
-            'value': 'str',
-            'value_from': 'V1EnvVarSource'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'value': 'value',
-            'value_from': 'valueFrom'
-        }
-
         self._name = None
         self._value = None
         self._value_from = None
@@ -150,11 +152,14 @@ class V1EnvVar(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,28 +26,30 @@ class V1EnvVarSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'field_ref': 'V1ObjectFieldSelector',
+        'config_map_key_ref': 'V1ConfigMapKeySelector',
+        'secret_key_ref': 'V1SecretKeySelector'
+    }
+
+    attribute_map = {
+        'field_ref': 'fieldRef',
+        'config_map_key_ref': 'configMapKeyRef',
+        'secret_key_ref': 'secretKeyRef'
+    }
+
+    __slots__ = ('_field_ref', '_config_map_key_ref', '_secret_key_ref')
+
     def __init__(self):
         """
         V1EnvVarSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'field_ref': 'V1ObjectFieldSelector',
-            'config_map_key_ref': 'V1ConfigMapKeySelector',
-            'secret_key_ref': 'V1SecretKeySelector'
-        }
-
-        self.attribute_map = {
-            'field_ref': 'fieldRef',
-            'config_map_key_ref': 'configMapKeyRef',
-            'secret_key_ref': 'secretKeyRef'
-        }
-
         self._field_ref = None
         self._config_map_key_ref = None
         self._secret_key_ref = None
@@ -150,11 +152,14 @@ class V1EnvVarSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,44 +26,46 @@ class V1Event(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'kind': 'str',
+        'api_version': 'str',
+        'metadata': 'V1ObjectMeta',
+        'involved_object': 'V1ObjectReference',
+        'reason': 'str',
+        'message': 'str',
+        'source': 'V1EventSource',
+        'first_timestamp': 'str',
+        'last_timestamp': 'str',
+        'count': 'int',
+        'type': 'str'
+    }
+
+    attribute_map = {
+        'kind': 'kind',
+        'api_version': 'apiVersion',
+        'metadata': 'metadata',
+        'involved_object': 'involvedObject',
+        'reason': 'reason',
+        'message': 'message',
+        'source': 'source',
+        'first_timestamp': 'firstTimestamp',
+        'last_timestamp': 'lastTimestamp',
+        'count': 'count',
+        'type': 'type'
+    }
+
+    __slots__ = ('_kind', '_api_version', '_metadata', '_involved_object', '_reason', '_message', '_source', '_first_timestamp', '_last_timestamp', '_count', '_type')
+
     def __init__(self):
         """
         V1Event - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'kind': 'str',
-            'api_version': 'str',
-            'metadata': 'V1ObjectMeta',
-            'involved_object': 'V1ObjectReference',
-            'reason': 'str',
-            'message': 'str',
-            'source': 'V1EventSource',
-            'first_timestamp': 'str',
-            'last_timestamp': 'str',
-            'count': 'int',
-            'type': 'str'
-        }
-
-        self.attribute_map = {
-            'kind': 'kind',
-            'api_version': 'apiVersion',
-            'metadata': 'metadata',
-            'involved_object': 'involvedObject',
-            'reason': 'reason',
-            'message': 'message',
-            'source': 'source',
-            'first_timestamp': 'firstTimestamp',
-            'last_timestamp': 'lastTimestamp',
-            'count': 'count',
-            'type': 'type'
-        }
-
+        """
         self._kind = None
         self._api_version = None
         self._metadata = None
@@ -350,11 +352,14 @@ class V1Event(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
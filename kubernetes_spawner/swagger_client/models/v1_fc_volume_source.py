@@ -26,30 +26,32 @@ class V1FCVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'target_ww_ns': 'list[str]',
+        'lun': 'int',
+        'fs_type': 'str',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'target_ww_ns': 'targetWWNs',
+        'lun': 'lun',
+        'fs_type': 'fsType',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_target_ww_ns', '_lun', '_fs_type', '_read_only')
+
     def __init__(self):
         """
         V1FCVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'target_ww_ns': 'list[str]',
-            'lun': 'int',
-            'fs_type': 'str',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'target_ww_ns': 'targetWWNs',
-            'lun': 'lun',
-            'fs_type': 'fsType',
-            'read_only': 'readOnly'
-        }
-
+        """
         self._target_ww_ns = None
         self._lun = None
         self._fs_type = None
@@ -175,11 +177,14 @@ class V1FCVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,32 +26,34 @@ class V1FlexVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'driver': 'str',
+        'fs_type': 'str',
+        'secret_ref': 'V1LocalObjectReference',
+        'read_only': 'bool',
+        'options': 'str'
+    }
+
+    attribute_map = {
+        'driver': 'driver',
+        'fs_type': 'fsType',
+        'secret_ref': 'secretRef',
+        'read_only': 'readOnly',
+        'options': 'options'
+    }
+
+    __slots__ = ('_driver', '_fs_type', '_secret_ref', '_read_only', '_options')
+
     def __init__(self):
         """
         V1FlexVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'driver': 'str',
-            'fs_type': 'str',
-            'secret_ref': 'V1LocalObjectReference',
-            'read_only': 'bool',
-            'options': 'str'
-        }
-
-        self.attribute_map = {
-            'driver': 'driver',
-            'fs_type': 'fsType',
-            'secret_ref': 'secretRef',
-            'read_only': 'readOnly',
-            'options': 'options'
-        }
-
+        """
         self._driver = None
         self._fs_type = None
         self._secret_ref = None
@@ -200,11 +202,14 @@ class V1FlexVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
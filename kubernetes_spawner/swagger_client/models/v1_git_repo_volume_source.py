@@ -26,28 +26,30 @@ class V1GitRepoVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'repository': 'str',
+        'revision': 'str',
+        'directory': 'str'
+    }
+
+    attribute_map = {
+        'repository': 'repository',
+        'revision': 'revision',
+        'directory': 'directory'
+    }
+
+    __slots__ = ('_repository', '_revision', '_directory')
+
     def __init__(self):
         """
         V1GitRepoVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'repository': 'str',
-            'revision': 'str',
-            'directory': 'str'
-        }
-
-        self.attribute_map = {
-            'repository': 'repository',
-            'revision': 'revision',
-            'directory': 'directory'
-        }
-
         self._repository = None
         self._revision = None
         self._directory = None
@@ -150,11 +152,14 @@ class V1GitRepoVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
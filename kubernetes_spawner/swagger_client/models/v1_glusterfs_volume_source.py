@@ -26,28 +26,30 @@ class V1GlusterfsVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'endpoints': 'str',
+        'path': 'str',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'endpoints': 'endpoints',
+        'path': 'path',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_endpoints', '_path', '_read_only')
+
     def __init__(self):
         """
         V1GlusterfsVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'endpoints': 'str',
-            'path': 'str',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'endpoints': 'endpoints',
-            'path': 'path',
-            'read_only': 'readOnly'
-        }
-
         self._endpoints = None
         self._path = None
         self._read_only = None
@@ -150,11 +152,14 @@ class V1GlusterfsVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
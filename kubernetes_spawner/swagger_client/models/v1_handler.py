@@ -26,28 +26,30 @@ class V1Handler(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        '_exec': 'V1ExecAction',
+        'http_get': 'V1HTTPGetAction',
+        'tcp_socket': 'V1TCPSocketAction'
+    }
+
+    attribute_map = {
+        '_exec': 'exec',
+        'http_get': 'httpGet',
+        'tcp_socket': 'tcpSocket'
+    }
+
+    __slots__ = ('__exec', '_http_get', '_tcp_socket')
+
     def __init__(self):
         """
         V1Handler - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            '_exec': 'V1ExecAction',
-            'http_get': 'V1HTTPGetAction',
-            'tcp_socket': 'V1TCPSocketAction'
-        }
-
-        self.attribute_map = {
-            '_exec': 'exec',
-            'http_get': 'httpGet',
-            'tcp_socket': 'tcpSocket'
-        }
-
         self.__exec = None
         self._http_get = None
         self._tcp_socket = None
@@ -150,11 +152,14 @@ class V1Handler(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,24 +26,26 @@ class V1HostPathVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'path': 'str'
+    }
+
+    attribute_map = {
+        'path': 'path'
+    }
+
+    __slots__ = ('_path',)
+
     def __init__(self):
         """
         V1HostPathVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'path': 'str'
-        }
-
-        self.attribute_map = {
-            'path': 'path'
-        }
-
         self._path = None
 
     @property
@@ -100,11 +102,14 @@ class V1HostPathVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,34 +26,36 @@ class V1ISCSIVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'target_portal': 'str',
+        'iqn': 'str',
+        'lun': 'int',
+        'iscsi_interface': 'str',
+        'fs_type': 'str',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'target_portal': 'targetPortal',
+        'iqn': 'iqn',
+        'lun': 'lun',
+        'iscsi_interface': 'iscsiInterface',
+        'fs_type': 'fsType',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_target_portal', '_iqn', '_lun', '_iscsi_interface', '_fs_type', '_read_only')
+
     def __init__(self):
         """
         V1ISCSIVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'target_portal': 'str',
-            'iqn': 'str',
-            'lun': 'int',
-            'iscsi_interface': 'str',
-            'fs_type': 'str',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'target_portal': 'targetPortal',
-            'iqn': 'iqn',
-            'lun': 'lun',
-            'iscsi_interface': 'iscsiInterface',
-            'fs_type': 'fsType',
-            'read_only': 'readOnly'
-        }
-
+        """
         self._target_portal = None
         self._iqn = None
         self._lun = None
@@ -225,11 +227,14 @@ class V1ISCSIVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
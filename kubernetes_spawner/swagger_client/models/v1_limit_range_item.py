@@ -26,34 +26,36 @@ class V1LimitRangeItem(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'type': 'str',
+        'max': 'str',
+        'min': 'str',
+        'default': 'str',
+        'default_request': 'str',
+        'max_limit_request_ratio': 'str'
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'max': 'max',
+        'min': 'min',
+        'default': 'default',
+        'default_request': 'defaultRequest',
+        'max_limit_request_ratio': 'maxLimitRequestRatio'
+    }
+
+    __slots__ = ('_type', '_max', '_min', '_default', '_default_request', '_max_limit_request_ratio')
+
     def __init__(self):
         """
         V1LimitRangeItem - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'type': 'str',
-            'max': 'str',
-            'min': 'str',
-            'default': 'str',
-            'default_request': 'str',
-            'max_limit_request_ratio': 'str'
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'max': 'max',
-            'min': 'min',
-            'default': 'default',
-            'default_request': 'defaultRequest',
-            'max_limit_request_ratio': 'maxLimitRequestRatio'
-        }
-
+        """
         self._type = None
         self._max = None
         self._min = None
@@ -225,11 +227,14 @@ class V1LimitRangeItem(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
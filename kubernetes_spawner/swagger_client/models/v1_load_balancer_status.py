@@ -26,24 +26,26 @@ class V1LoadBalancerStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'ingress': 'list[V1LoadBalancerIngress]'
+    }
+
+    attribute_map = {
+        'ingress': 'ingress'
+    }
+
+    __slots__ = ('_ingress',)
+
     def __init__(self):
         """
         V1LoadBalancerStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'ingress': 'list[V1LoadBalancerIngress]'
-        }
-
-        self.attribute_map = {
-            'ingress': 'ingress'
-        }
-
         self._ingress = None
 
     @property
@@ -100,11 +102,14 @@ class V1LoadBalancerStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
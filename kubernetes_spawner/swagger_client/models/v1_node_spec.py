@@ -26,30 +26,32 @@ class V1NodeSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'pod_cidr': 'str',
+        'external_id': 'str',
+        'provider_id': 'str',
+        'unschedulable': 'bool'
+    }
+
+    attribute_map = {
+        'pod_cidr': 'podCIDR',
+        'external_id': 'externalID',
+        'provider_id': 'providerID',
+        'unschedulable': 'unschedulable'
+    }
+
+    __slots__ = ('_pod_cidr', '_external_id', '_provider_id', '_unschedulable')
+
     def __init__(self):
         """
         V1NodeSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'pod_cidr': 'str',
-            'external_id': 'str',
-            'provider_id': 'str',
-            'unschedulable': 'bool'
-        }
-
-        self.attribute_map = {
-            'pod_cidr': 'podCIDR',
-            'external_id': 'externalID',
-            'provider_id': 'providerID',
-            'unschedulable': 'unschedulable'
-        }
-
+        """
         self._pod_cidr = None
         self._external_id = None
         self._provider_id = None
@@ -175,11 +177,14 @@ class V1NodeSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,38 +26,40 @@ class V1NodeStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'capacity': 'dict(str, str)',
+        'allocatable': 'dict(str, str)',
+        'phase': 'str',
+        'conditions': 'list[V1NodeCondition]',
+        'addresses': 'list[V1NodeAddress]',
+        'daemon_endpoints': 'V1NodeDaemonEndpoints',
+        'node_info': 'V1NodeSystemInfo',
+        'images': 'list[V1ContainerImage]'
+    }
+
+    attribute_map = {
+        'capacity': 'capacity',
+        'allocatable': 'allocatable',
+        'phase': 'phase',
+        'conditions': 'conditions',
+        'addresses': 'addresses',
+        'daemon_endpoints': 'daemonEndpoints',
+        'node_info': 'nodeInfo',
+        'images': 'images'
+    }
+
+    __slots__ = ('_capacity', '_allocatable', '_phase', '_conditions', '_addresses', '_daemon_endpoints', '_node_info', '_images')
+
     def __init__(self):
         """
         V1NodeStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'capacity': 'str',
-            'allocatable': 'str',
-            'phase': 'str',
-            'conditions': 'list[V1NodeCondition]',
-            'addresses': 'list[V1NodeAddress]',
-            'daemon_endpoints': 'V1NodeDaemonEndpoints',
-            'node_info': 'V1NodeSystemInfo',
-            'images': 'list[V1ContainerImage]'
-        }
-
-        self.attribute_map = {
-            'capacity': 'capacity',
-            'allocatable': 'allocatable',
-            'phase': 'phase',
-            'conditions': 'conditions',
-            'addresses': 'addresses',
-            'daemon_endpoints': 'daemonEndpoints',
-            'node_info': 'nodeInfo',
-            'images': 'images'
-        }
-
+        """
         self._capacity = None
         self._allocatable = None
         self._phase = None
@@ -74,7 +76,7 @@ class V1NodeStatus(object):
         Capacity represents the total resources of a node. More info: http://releases.k8s.io/HEAD/docs/user-guide/persistent-volumes.md#capacity for more details.
 
         :return: The capacity of this V1NodeStatus.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._capacity
 
@@ -85,7 +87,7 @@ class V1NodeStatus(object):
         Capacity represents the total resources of a node. More info: http://releases.k8s.io/HEAD/docs/user-guide/persistent-volumes.md#capacity for more details.
 
         :param capacity: The capacity of this V1NodeStatus.
-        :type: str
+        :type: dict(str, str)
         """
         self._capacity = capacity
 
@@ -96,7 +98,7 @@ class V1NodeStatus(object):
         Allocatable represents the resources of a node that are available for scheduling. Defaults to Capacity.
 
         :return: The allocatable of this V1NodeStatus.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._allocatable
 
@@ -107,7 +109,7 @@ class V1NodeStatus(object):
         Allocatable represents the resources of a node that are available for scheduling. Defaults to Capacity.
 
         :param allocatable: The allocatable of this V1NodeStatus.
-        :type: str
+        :type: dict(str, str)
         """
         self._allocatable = allocatable
 
@@ -275,11 +277,14 @@ class V1NodeStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
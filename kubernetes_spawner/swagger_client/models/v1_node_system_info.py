@@ -26,38 +26,40 @@ class V1NodeSystemInfo(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'machine_id': 'str',
+        'system_uuid': 'str',
+        'boot_id': 'str',
+        'kernel_version': 'str',
+        'os_image': 'str',
+        'container_runtime_version': 'str',
+        'kubelet_version': 'str',
+        'kube_proxy_version': 'str'
+    }
+
+    attribute_map = {
+        'machine_id': 'machineID',
+        'system_uuid': 'systemUUID',
+        'boot_id': 'bootID',
+        'kernel_version': 'kernelVersion',
+        'os_image': 'osImage',
+        'container_runtime_version': 'containerRuntimeVersion',
+        'kubelet_version': 'kubeletVersion',
+        'kube_proxy_version': 'kubeProxyVersion'
+    }
+
+    __slots__ = ('_machine_id', '_system_uuid', '_boot_id', '_kernel_version', '_os_image', '_container_runtime_version', '_kubelet_version', '_kube_proxy_version')
+
     def __init__(self):
         """
         V1NodeSystemInfo - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'machine_id': 'str',
-            'system_uuid': 'str',
-            'boot_id': 'str',
-            'kernel_version': 'str',
-            'os_image': 'str',
-            'container_runtime_version': 'str',
-            'kubelet_version': 'str',
-            'kube_proxy_version': 'str'
-        }
-
-        self.attribute_map = {
-            'machine_id': 'machineID',
-            'system_uuid': 'systemUUID',
-            'boot_id': 'bootID',
-            'kernel_version': 'kernelVersion',
-            'os_image': 'osImage',
-            'container_runtime_version': 'containerRuntimeVersion',
-            'kubelet_version': 'kubeletVersion',
-            'kube_proxy_version': 'kubeProxyVersion'
-        }
-
+        """
         self._machine_id = None
         self._system_uuid = None
         self._boot_id = None
@@ -275,11 +277,14 @@ class V1NodeSystemInfo(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
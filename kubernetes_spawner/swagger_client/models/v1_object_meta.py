@@ -26,46 +26,48 @@ class V1ObjectMeta(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'generate_name': 'str',
+        'namespace': 'str',
+        'self_link': 'str',
+        'uid': 'str',
+        'resource_version': 'str',
+        'generation': 'int',
+        'creation_timestamp': 'str',
+        'deletion_timestamp': 'str',
+        'deletion_grace_period_seconds': 'int',
+        'labels': 'dict(str, str)',
+        'annotations': 'dict(str, str)'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'generate_name': 'generateName',
+        'namespace': 'namespace',
+        'self_link': 'selfLink',
+        'uid': 'uid',
+        'resource_version': 'resourceVersion',
+        'generation': 'generation',
+        'creation_timestamp': 'creationTimestamp',
+        'deletion_timestamp': 'deletionTimestamp',
+        'deletion_grace_period_seconds': 'deletionGracePeriodSeconds',
+        'labels': 'labels',
+        'annotations': 'annotations'
+    }
+
+    __slots__ = ('_name', '_generate_name', '_namespace', '_self_link', '_uid', '_resource_version', '_generation', '_creation_timestamp', '_deletion_timestamp', '_deletion_grace_period_seconds', '_labels', '_annotations')
+
     def __init__(self):
         """
         V1ObjectMeta - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'generate_name': 'str',
-            'namespace': 'str',
-            'self_link': 'str',
-            'uid': 'str',
-            'resource_version': 'str',
-            'generation': 'int',
-            'creation_timestamp': 'str',
-            'deletion_timestamp': 'str',
-            'deletion_grace_period_seconds': 'int',
-            'labels': 'str',
-            'annotations': 'str'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'generate_name': 'generateName',
-            'namespace': 'namespace',
-            'self_link': 'selfLink',
-            'uid': 'uid',
-            'resource_version': 'resourceVersion',
-            'generation': 'generation',
-            'creation_timestamp': 'creationTimestamp',
-            'deletion_timestamp': 'deletionTimestamp',
-            'deletion_grace_period_seconds': 'deletionGracePeriodSeconds',
-            'labels': 'labels',
-            'annotations': 'annotations'
-        }
-
+        """
         self._name = None
         self._generate_name = None
         self._namespace = None
@@ -306,7 +308,7 @@ class V1ObjectMeta(object):
         Map of string keys and values that can be used to organize and categorize (scope and select) objects. May match selectors of replication controllers and services. More info: http://releases.k8s.io/HEAD/docs/user-guide/labels.md
 
         :return: The labels of this V1ObjectMeta.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._labels
 
@@ -317,7 +319,7 @@ class V1ObjectMeta(object):
         Map of string keys and values that can be used to organize and categorize (scope and select) objects. May match selectors of replication controllers and services. More info: http://releases.k8s.io/HEAD/docs/user-guide/labels.md
 
         :param labels: The labels of this V1ObjectMeta.
-        :type: str
+        :type: dict(str, str)
         """
         self._labels = labels
 
@@ -328,7 +330,7 @@ class V1ObjectMeta(object):
         Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata. They are not queryable and should be preserved when modifying objects. More info: http://releases.k8s.io/HEAD/docs/user-guide/annotations.md
 
         :return: The annotations of this V1ObjectMeta.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._annotations
 
@@ -339,7 +341,7 @@ class V1ObjectMeta(object):
         Annotations is an unstructured key value map stored with a resource that may be set by external tools to store and retrieve arbitrary metadata. They are not queryable and should be preserved when modifying objects. More info: http://releases.k8s.io/HEAD/docs/user-guide/annotations.md
 
         :param annotations: The annotations of this V1ObjectMeta.
-        :type: str
+        :type: dict(str, str)
         """
         self._annotations = annotations
 
@@ -375,11 +377,14 @@ class V1ObjectMeta(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,36 +26,38 @@ class V1ObjectReference(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'kind': 'str',
+        'namespace': 'str',
+        'name': 'str',
+        'uid': 'str',
+        'api_version': 'str',
+        'resource_version': 'str',
+        'field_path': 'str'
+    }
+
+    attribute_map = {
+        'kind': 'kind',
+        'namespace': 'namespace',
+        'name': 'name',
+        'uid': 'uid',
+        'api_version': 'apiVersion',
+        'resource_version': 'resourceVersion',
+        'field_path': 'fieldPath'
+    }
+
+    __slots__ = ('_kind', '_namespace', '_name', '_uid', '_api_version', '_resource_version', '_field_path')
+
     def __init__(self):
         """
         V1ObjectReference - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'kind': 'str',
-            'namespace': 'str',
-            'name': 'str',
-            'uid': 'str',
-            'api_version': 'str',
-            'resource_version': 'str',
-            'field_path': 'str'
-        }
-
-        self.attribute_map = {
-            'kind': 'kind',
-            'namespace': 'namespace',
-            'name': 'name',
-            'uid': 'uid',
-            'api_version': 'apiVersion',
-            'resource_version': 'resourceVersion',
-            'field_path': 'fieldPath'
-        }
-
+        """
         self._kind = None
         self._namespace = None
         self._name = None
@@ -250,11 +252,14 @@ class V1ObjectReference(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
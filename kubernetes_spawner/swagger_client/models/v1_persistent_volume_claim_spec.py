@@ -26,28 +26,30 @@ class V1PersistentVolumeClaimSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'access_modes': 'list[V1PersistentVolumeAccessMode]',
+        'resources': 'V1ResourceRequirements',
+        'volume_name': 'str'
+    }
+
+    attribute_map = {
+        'access_modes': 'accessModes',
+        'resources': 'resources',
+        'volume_name': 'volumeName'
+    }
+
+    __slots__ = ('_access_modes', '_resources', '_volume_name')
+
     def __init__(self):
         """
         V1PersistentVolumeClaimSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'access_modes': 'list[V1PersistentVolumeAccessMode]',
-            'resources': 'V1ResourceRequirements',
-            'volume_name': 'str'
-        }
-
-        self.attribute_map = {
-            'access_modes': 'accessModes',
-            'resources': 'resources',
-            'volume_name': 'volumeName'
-        }
-
         self._access_modes = None
         self._resources = None
         self._volume_name = None
@@ -150,11 +152,14 @@ class V1PersistentVolumeClaimSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,28 +26,30 @@ class V1PersistentVolumeClaimStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'phase': 'str',
+        'access_modes': 'list[V1PersistentVolumeAccessMode]',
+        'capacity': 'dict(str, str)'
+    }
+
+    attribute_map = {
+        'phase': 'phase',
+        'access_modes': 'accessModes',
+        'capacity': 'capacity'
+    }
+
+    __slots__ = ('_phase', '_access_modes', '_capacity')
+
     def __init__(self):
         """
         V1PersistentVolumeClaimStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'phase': 'str',
-            'access_modes': 'list[V1PersistentVolumeAccessMode]',
-            'capacity': 'str'
-        }
-
-        self.attribute_map = {
-            'phase': 'phase',
-            'access_modes': 'accessModes',
-            'capacity': 'capacity'
-        }
-
         self._phase = None
         self._access_modes = None
         self._capacity = None
@@ -103,7 +105,7 @@ class V1PersistentVolumeClaimStatus(object):
         Represents the actual resources of the underlying volume.
 
         :return: The capacity of this V1PersistentVolumeClaimStatus.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._capacity
 
@@ -114,7 +116,7 @@ class V1PersistentVolumeClaimStatus(object):
         Represents the actual resources of the underlying volume.
 
         :param capacity: The capacity of this V1PersistentVolumeClaimStatus.
-        :type: str
+        :type: dict(str, str)
         """
         self._capacity = capacity
 
@@ -150,11 +152,14 @@ class V1PersistentVolumeClaimStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
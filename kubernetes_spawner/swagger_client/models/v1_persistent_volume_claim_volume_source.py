@@ -26,26 +26,28 @@ class V1PersistentVolumeClaimVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'claim_name': 'str',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'claim_name': 'claimName',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_claim_name', '_read_only')
+
     def __init__(self):
         """
         V1PersistentVolumeClaimVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'claim_name': 'str',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'claim_name': 'claimName',
-            'read_only': 'readOnly'
-        }
-
         self._claim_name = None
         self._read_only = None
 
@@ -125,11 +127,14 @@ class V1PersistentVolumeClaimVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,54 +26,56 @@ class V1PersistentVolumeSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'capacity': 'dict(str, str)',
+        'gce_persistent_disk': 'V1GCEPersistentDiskVolumeSource',
+        'aws_elastic_block_store': 'V1AWSElasticBlockStoreVolumeSource',
+        'host_path': 'V1HostPathVolumeSource',
+        'glusterfs': 'V1GlusterfsVolumeSource',
+        'nfs': 'V1NFSVolumeSource',
+        'rbd': 'V1RBDVolumeSource',
+        'iscsi': 'V1ISCSIVolumeSource',
+        'cinder': 'V1CinderVolumeSource',
+        'cephfs': 'V1CephFSVolumeSource',
+        'fc': 'V1FCVolumeSource',
+        'flocker': 'V1FlockerVolumeSource',
+        'flex_volume': 'V1FlexVolumeSource',
+        'access_modes': 'list[V1PersistentVolumeAccessMode]',
+        'claim_ref': 'V1ObjectReference',
+        'persistent_volume_reclaim_policy': 'str'
+    }
+
+    attribute_map = {
+        'capacity': 'capacity',
+        'gce_persistent_disk': 'gcePersistentDisk',
+        'aws_elastic_block_store': 'awsElasticBlockStore',
+        'host_path': 'hostPath',
+        'glusterfs': 'glusterfs',
+        'nfs': 'nfs',
+        'rbd': 'rbd',
+        'iscsi': 'iscsi',
+        'cinder': 'cinder',
+        'cephfs': 'cephfs',
+        'fc': 'fc',
+        'flocker': 'flocker',
+        'flex_volume': 'flexVolume',
+        'access_modes': 'accessModes',
+        'claim_ref': 'claimRef',
+        'persistent_volume_reclaim_policy': 'persistentVolumeReclaimPolicy'
+    }
+
+    __slots__ = ('_capacity', '_gce_persistent_disk', '_aws_elastic_block_store', '_host_path', '_glusterfs', '_nfs', '_rbd', '_iscsi', '_cinder', '_cephfs', '_fc', '_flocker', '_flex_volume', '_access_modes', '_claim_ref', '_persistent_volume_reclaim_policy')
+
     def __init__(self):
         """
         V1PersistentVolumeSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'capacity': 'str',
-            'gce_persistent_disk': 'V1GCEPersistentDiskVolumeSource',
-            'aws_elastic_block_store': 'V1AWSElasticBlockStoreVolumeSource',
-            'host_path': 'V1HostPathVolumeSource',
-            'glusterfs': 'V1GlusterfsVolumeSource',
-            'nfs': 'V1NFSVolumeSource',
-            'rbd': 'V1RBDVolumeSource',
-            'iscsi': 'V1ISCSIVolumeSource',
-            'cinder': 'V1CinderVolumeSource',
-            'cephfs': 'V1CephFSVolumeSource',
-            'fc': 'V1FCVolumeSource',
-            'flocker': 'V1FlockerVolumeSource',
-            'flex_volume': 'V1FlexVolumeSource',
-            'access_modes': 'list[V1PersistentVolumeAccessMode]',
-            'claim_ref': 'V1ObjectReference',
-            'persistent_volume_reclaim_policy': 'str'
-        }
-
-        self.attribute_map = {
-            'capacity': 'capacity',
-            'gce_persistent_disk': 'gcePersistentDisk',
-            'aws_elastic_block_store': 'awsElasticBlockStore',
-            'host_path': 'hostPath',
-            'glusterfs': 'glusterfs',
-            'nfs': 'nfs',
-            'rbd': 'rbd',
-            'iscsi': 'iscsi',
-            'cinder': 'cinder',
-            'cephfs': 'cephfs',
-            'fc': 'fc',
-            'flocker': 'flocker',
-            'flex_volume': 'flexVolume',
-            'access_modes': 'accessModes',
-            'claim_ref': 'claimRef',
-            'persistent_volume_reclaim_policy': 'persistentVolumeReclaimPolicy'
-        }
-
+        """
         self._capacity = None
         self._gce_persistent_disk = None
         self._aws_elastic_block_store = None
@@ -98,7 +100,7 @@ class V1PersistentVolumeSpec(object):
         A description of the persistent volume's resources and capacity. More info: http://releases.k8s.io/HEAD/docs/user-guide/persistent-volumes.md#capacity
 
         :return: The capacity of this V1PersistentVolumeSpec.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._capacity
 
@@ -109,7 +111,7 @@ class V1PersistentVolumeSpec(object):
         A description of the persistent volume's resources and capacity. More info: http://releases.k8s.io/HEAD/docs/user-guide/persistent-volumes.md#capacity
 
         :param capacity: The capacity of this V1PersistentVolumeSpec.
-        :type: str
+        :type: dict(str, str)
         """
         self._capacity = capacity
 
@@ -475,11 +477,14 @@ class V1PersistentVolumeSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
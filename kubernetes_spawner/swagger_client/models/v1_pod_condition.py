@@ -26,34 +26,36 @@ class V1PodCondition(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'type': 'str',
+        'status': 'str',
+        'last_probe_time': 'str',
+        'last_transition_time': 'str',
+        'reason': 'str',
+        'message': 'str'
+    }
+
+    attribute_map = {
+        'type': 'type',
+        'status': 'status',
+        'last_probe_time': 'lastProbeTime',
+        'last_transition_time': 'lastTransitionTime',
+        'reason': 'reason',
+        'message': 'message'
+    }
+
+    __slots__ = ('_type', '_status', '_last_probe_time', '_last_transition_time', '_reason', '_message')
+
     def __init__(self):
         """
         V1PodCondition - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'type': 'str',
-            'status': 'str',
-            'last_probe_time': 'str',
-            'last_transition_time': 'str',
-            'reason': 'str',
-            'message': 'str'
-        }
-
-        self.attribute_map = {
-            'type': 'type',
-            'status': 'status',
-            'last_probe_time': 'lastProbeTime',
-            'last_transition_time': 'lastTransitionTime',
-            'reason': 'reason',
-            'message': 'message'
-        }
-
+        """
         self._type = None
         self._status = None
         self._last_probe_time = None
@@ -225,11 +227,14 @@ class V1PodCondition(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,32 +26,34 @@ class V1PodSecurityContext(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'se_linux_options': 'V1SELinuxOptions',
+        'run_as_user': 'int',
+        'run_as_non_root': 'bool',
+        'supplemental_groups': 'list[int]',
+        'fs_group': 'int'
+    }
+
+    attribute_map = {
+        'se_linux_options': 'seLinuxOptions',
+        'run_as_user': 'runAsUser',
+        'run_as_non_root': 'runAsNonRoot',
+        'supplemental_groups': 'supplementalGroups',
+        'fs_group': 'fsGroup'
+    }
+
+    __slots__ = ('_se_linux_options', '_run_as_user', '_run_as_non_root', '_supplemental_groups', '_fs_group')
+
     def __init__(self):
         """
         V1PodSecurityContext - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'se_linux_options': 'V1SELinuxOptions',
-            'run_as_user': 'int',
-            'run_as_non_root': 'bool',
-            'supplemental_groups': 'list[int]',
-            'fs_group': 'int'
-        }
-
-        self.attribute_map = {
-            'se_linux_options': 'seLinuxOptions',
-            'run_as_user': 'runAsUser',
-            'run_as_non_root': 'runAsNonRoot',
-            'supplemental_groups': 'supplementalGroups',
-            'fs_group': 'fsGroup'
-        }
-
+        """
         self._se_linux_options = None
         self._run_as_user = None
         self._run_as_non_root = None
@@ -200,11 +202,14 @@ class V1PodSecurityContext(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
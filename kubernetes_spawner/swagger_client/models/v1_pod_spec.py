@@ -26,52 +26,58 @@ class V1PodSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'volumes': 'list[V1Volume]',
+        'containers': 'list[V1Container]',
+        'restart_policy': 'str',
+        'termination_grace_period_seconds': 'int',
+        'active_deadline_seconds': 'int',
+        'dns_policy': 'str',
+        'node_selector': 'dict(str, str)',
+        'service_account_name': 'str',
+        'service_account': 'str',
+        'node_name': 'str',
+        'host_network': 'bool',
+        'host_pid': 'bool',
+        'host_ipc': 'bool',
+        'security_context': 'V1PodSecurityContext',
+        'image_pull_secrets': 'list[V1LocalObjectReference]',
+        'affinity': 'object',
+        'tolerations': 'list[object]'
+    }
+
+    attribute_map = {
+        'volumes': 'volumes',
+        'containers': 'containers',
+        'restart_policy': 'restartPolicy',
+        'termination_grace_period_seconds': 'terminationGracePeriodSeconds',
+        'active_deadline_seconds': 'activeDeadlineSeconds',
+        'dns_policy': 'dnsPolicy',
+        'node_selector': 'nodeSelector',
+        'service_account_name': 'serviceAccountName',
+        'service_account': 'serviceAccount',
+        'node_name': 'nodeName',
+        'host_network': 'hostNetwork',
+        'host_pid': 'hostPID',
+        'host_ipc': 'hostIPC',
+        'security_context': 'securityContext',
+        'image_pull_secrets': 'imagePullSecrets',
+        'affinity': 'affinity',
+        'tolerations': 'tolerations'
+    }
+
+    __slots__ = ('_volumes', '_containers', '_restart_policy', '_termination_grace_period_seconds', '_active_deadline_seconds', '_dns_policy', '_node_selector', '_service_account_name', '_service_account', '_node_name', '_host_network', '_host_pid', '_host_ipc', '_security_context', '_image_pull_secrets', '_affinity', '_tolerations')
+
     def __init__(self):
         """
         V1PodSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'volumes': 'list[V1Volume]',
-            'containers': 'list[V1Container]',
-            'restart_policy': 'str',
-            'termination_grace_period_seconds': 'int',
-            'active_deadline_seconds': 'int',
-            'dns_policy': 'str',
-            'node_selector': 'str',
-            'service_account_name': 'str',
-            'service_account': 'str',
-            'node_name': 'str',
-            'host_network': 'bool',
-            'host_pid': 'bool',
-            'host_ipc': 'bool',
-            'security_context': 'V1PodSecurityContext',
-            'image_pull_secrets': 'list[V1LocalObjectReference]'
-        }
-
-        self.attribute_map = {
-            'volumes': 'volumes',
-            'containers': 'containers',
-            'restart_policy': 'restartPolicy',
-            'termination_grace_period_seconds': 'terminationGracePeriodSeconds',
-            'active_deadline_seconds': 'activeDeadlineSeconds',
-            'dns_policy': 'dnsPolicy',
-            'node_selector': 'nodeSelector',
-            'service_account_name': 'serviceAccountName',
-            'service_account': 'serviceAccount',
-            'node_name': 'nodeName',
-            'host_network': 'hostNetwork',
-            'host_pid': 'hostPID',
-            'host_ipc': 'hostIPC',
-            'security_context': 'securityContext',
-            'image_pull_secrets': 'imagePullSecrets'
-        }
-
+        """
         self._volumes = None
         self._containers = None
         self._restart_policy = None
@@ -87,6 +93,8 @@ class V1PodSpec(object):
         self._host_ipc = None
         self._security_context = None
         self._image_pull_secrets = None
+        self._affinity = None
+        self._tolerations = None
 
     @property
     def volumes(self):
@@ -227,7 +235,7 @@ class V1PodSpec(object):
         NodeSelector is a selector which must be true for the pod to fit on a node. Selector which must match a node's labels for the pod to be scheduled on that node. More info: http://releases.k8s.io/HEAD/docs/user-guide/node-selection/README.md
 
         :return: The node_selector of this V1PodSpec.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._node_selector
 
@@ -238,7 +246,7 @@ class V1PodSpec(object):
         NodeSelector is a selector which must be true for the pod to fit on a node. Selector which must match a node's labels for the pod to be scheduled on that node. More info: http://releases.k8s.io/HEAD/docs/user-guide/node-selection/README.md
 
         :param node_selector: The node_selector of this V1PodSpec.
-        :type: str
+        :type: dict(str, str)
         """
         self._node_selector = node_selector
 
@@ -418,6 +426,50 @@ class V1PodSpec(object):
         """
         self._image_pull_secrets = image_pull_secrets
 
+    @property
+    def affinity(self):
+        """
+        Gets the affinity of this V1PodSpec.
+        If specified, the pod's scheduling constraints (nodeAffinity, podAffinity, podAntiAffinity), as the raw JSON of a v1.Affinity. More info: http://releases.k8s.io/HEAD/docs/user-guide/node-selection/README.md
+
+        :return: The affinity of this V1PodSpec.
+        :rtype: object
+        """
+        return self._affinity
+
+    @affinity.setter
+    def affinity(self, affinity):
+        """
+        Sets the affinity of this V1PodSpec.
+        If specified, the pod's scheduling constraints (nodeAffinity, podAffinity, podAntiAffinity), as the raw JSON of a v1.Affinity. More info: http://releases.k8s.io/HEAD/docs/user-guide/node-selection/README.md
+
+        :param affinity: The affinity of this V1PodSpec.
+        :type: object
+        """
+        self._affinity = affinity
+
+    @property
+    def tolerations(self):
+        """
+        Gets the tolerations of this V1PodSpec.
+        If specified, the pod's tolerations of node taints, as the raw JSON of v1.Toleration objects.
+
+        :return: The tolerations of this V1PodSpec.
+        :rtype: list[object]
+        """
+        return self._tolerations
+
+    @tolerations.setter
+    def tolerations(self, tolerations):
+        """
+        Sets the tolerations of this V1PodSpec.
+        If specified, the pod's tolerations of node taints, as the raw JSON of v1.Toleration objects.
+
+        :param tolerations: The tolerations of this V1PodSpec.
+        :type: list[object]
+        """
+        self._tolerations = tolerations
+
     def to_dict(self):
         """
         Returns the model properties as a dict
@@ -450,11 +502,14 @@ class V1PodSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
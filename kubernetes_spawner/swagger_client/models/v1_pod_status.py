@@ -26,38 +26,40 @@ class V1PodStatus(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'phase': 'str',
+        'conditions': 'list[V1PodCondition]',
+        'message': 'str',
+        'reason': 'str',
+        'host_ip': 'str',
+        'pod_ip': 'str',
+        'start_time': 'str',
+        'container_statuses': 'list[V1ContainerStatus]'
+    }
+
+    attribute_map = {
+        'phase': 'phase',
+        'conditions': 'conditions',
+        'message': 'message',
+        'reason': 'reason',
+        'host_ip': 'hostIP',
+        'pod_ip': 'podIP',
+        'start_time': 'startTime',
+        'container_statuses': 'containerStatuses'
+    }
+
+    __slots__ = ('_phase', '_conditions', '_message', '_reason', '_host_ip', '_pod_ip', '_start_time', '_container_statuses')
+
     def __init__(self):
         """
         V1PodStatus - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'phase': 'str',
-            'conditions': 'list[V1PodCondition]',
-            'message': 'str',
-            'reason': 'str',
-            'host_ip': 'str',
-            'pod_ip': 'str',
-            'start_time': 'str',
-            'container_statuses': 'list[V1ContainerStatus]'
-        }
-
-        self.attribute_map = {
-            'phase': 'phase',
-            'conditions': 'conditions',
-            'message': 'message',
-            'reason': 'reason',
-            'host_ip': 'hostIP',
-            'pod_ip': 'podIP',
-            'start_time': 'startTime',
-            'container_statuses': 'containerStatuses'
-        }
-
+        """
         self._phase = None
         self._conditions = None
         self._message = None
@@ -275,11 +277,14 @@ class V1PodStatus(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,38 +26,40 @@ class V1Probe(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        '_exec': 'V1ExecAction',
+        'http_get': 'V1HTTPGetAction',
+        'tcp_socket': 'V1TCPSocketAction',
+        'initial_delay_seconds': 'int',
+        'timeout_seconds': 'int',
+        'period_seconds': 'int',
+        'success_threshold': 'int',
+        'failure_threshold': 'int'
+    }
+
+    attribute_map = {
+        '_exec': 'exec',
+        'http_get': 'httpGet',
+        'tcp_socket': 'tcpSocket',
+        'initial_delay_seconds': 'initialDelaySeconds',
+        'timeout_seconds': 'timeoutSeconds',
+        'period_seconds': 'periodSeconds',
+        'success_threshold': 'successThreshold',
+        'failure_threshold': 'failureThreshold'
+    }
+
+    __slots__ = ('__exec', '_http_get', '_tcp_socket', '_initial_delay_seconds', '_timeout_seconds', '_period_seconds', '_success_threshold', '_failure_threshold')
+
     def __init__(self):
         """
         V1Probe - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            '_exec': 'V1ExecAction',
-            'http_get': 'V1HTTPGetAction',
-            'tcp_socket': 'V1TCPSocketAction',
-            'initial_delay_seconds': 'int',
-            'timeout_seconds': 'int',
-            'period_seconds': 'int',
-            'success_threshold': 'int',
-            'failure_threshold': 'int'
-        }
-
-        self.attribute_map = {
-            '_exec': 'exec',
-            'http_get': 'httpGet',
-            'tcp_socket': 'tcpSocket',
-            'initial_delay_seconds': 'initialDelaySeconds',
-            'timeout_seconds': 'timeoutSeconds',
-            'period_seconds': 'periodSeconds',
-            'success_threshold': 'successThreshold',
-            'failure_threshold': 'failureThreshold'
-        }
-
+        """
         self.__exec = None
         self._http_get = None
         self._tcp_socket = None
@@ -275,11 +277,14 @@ class V1Probe(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
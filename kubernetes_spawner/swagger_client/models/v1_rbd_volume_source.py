@@ -26,38 +26,40 @@ class V1RBDVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'monitors': 'list[str]',
+        'image': 'str',
+        'fs_type': 'str',
+        'pool': 'str',
+        'user': 'str',
+        'keyring': 'str',
+        'secret_ref': 'V1LocalObjectReference',
+        'read_only': 'bool'
+    }
+
+    attribute_map = {
+        'monitors': 'monitors',
+        'image': 'image',
+        'fs_type': 'fsType',
+        'pool': 'pool',
+        'user': 'user',
+        'keyring': 'keyring',
+        'secret_ref': 'secretRef',
+        'read_only': 'readOnly'
+    }
+
+    __slots__ = ('_monitors', '_image', '_fs_type', '_pool', '_user', '_keyring', '_secret_ref', '_read_only')
+
     def __init__(self):
         """
         V1RBDVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'monitors': 'list[str]',
-            'image': 'str',
-            'fs_type': 'str',
-            'pool': 'str',
-            'user': 'str',
-            'keyring': 'str',
-            'secret_ref': 'V1LocalObjectReference',
-            'read_only': 'bool'
-        }
-
-        self.attribute_map = {
-            'monitors': 'monitors',
-            'image': 'image',
-            'fs_type': 'fsType',
-            'pool': 'pool',
-            'user': 'user',
-            'keyring': 'keyring',
-            'secret_ref': 'secretRef',
-            'read_only': 'readOnly'
-        }
-
+        """
         self._monitors = None
         self._image = None
         self._fs_type = None
@@ -275,11 +277,14 @@ class V1RBDVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,28 +26,30 @@ class V1ReplicationControllerSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'replicas': 'int',
+        'selector': 'dict(str, str)',
+        'template': 'V1PodTemplateSpec'
+    }
+
+    attribute_map = {
+        'replicas': 'replicas',
+        'selector': 'selector',
+        'template': 'template'
+    }
+
+    __slots__ = ('_replicas', '_selector', '_template')
+
     def __init__(self):
         """
         V1ReplicationControllerSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'replicas': 'int',
-            'selector': 'str',
-            'template': 'V1PodTemplateSpec'
-        }
-
-        self.attribute_map = {
-            'replicas': 'replicas',
-            'selector': 'selector',
-            'template': 'template'
-        }
-
         self._replicas = None
         self._selector = None
         self._template = None
@@ -81,7 +83,7 @@ class V1ReplicationControllerSpec(object):
         Selector is a label query over pods that should match the Replicas count. If Selector is empty, it is defaulted to the labels present on the Pod template. Label keys and values that must match in order to be controlled by this replication controller, if empty defaulted to labels on Pod template. More info: http://releases.k8s.io/HEAD/docs/user-guide/labels.md#label-selectors
 
         :return: The selector of this V1ReplicationControllerSpec.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._selector
 
@@ -92,7 +94,7 @@ class V1ReplicationControllerSpec(object):
         Selector is a label query over pods that should match the Replicas count. If Selector is empty, it is defaulted to the labels present on the Pod template. Label keys and values that must match in order to be controlled by this replication controller, if empty defaulted to labels on Pod template. More info: http://releases.k8s.io/HEAD/docs/user-guide/labels.md#label-selectors
 
         :param selector: The selector of this V1ReplicationControllerSpec.
-        :type: str
+        :type: dict(str, str)
         """
         self._selector = selector
 
@@ -150,11 +152,14 @@ class V1ReplicationControllerSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,24 +26,26 @@ class V1ResourceQuotaSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'hard': 'str'
+    }
+
+    attribute_map = {
+        'hard': 'hard'
+    }
+
+    __slots__ = ('_hard',)
+
     def __init__(self):
         """
         V1ResourceQuotaSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'hard': 'str'
-        }
-
-        self.attribute_map = {
-            'hard': 'hard'
-        }
-
         self._hard = None
 
     @property
@@ -100,11 +102,14 @@ class V1ResourceQuotaSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
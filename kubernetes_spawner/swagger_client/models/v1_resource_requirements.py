@@ -26,26 +26,28 @@ class V1ResourceRequirements(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'limits': 'dict(str, str)',
+        'requests': 'dict(str, str)'
+    }
+
+    attribute_map = {
+        'limits': 'limits',
+        'requests': 'requests'
+    }
+
+    __slots__ = ('_limits', '_requests')
+
     def __init__(self):
         """
         V1ResourceRequirements - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'limits': 'str',
-            'requests': 'str'
-        }
-
-        self.attribute_map = {
-            'limits': 'limits',
-            'requests': 'requests'
-        }
-
         self._limits = None
         self._requests = None
 
@@ -56,7 +58,7 @@ class V1ResourceRequirements(object):
         Limits describes the maximum amount of compute resources allowed. More info: http://releases.k8s.io/HEAD/docs/design/resources.md#resource-specifications
 
         :return: The limits of this V1ResourceRequirements.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._limits
 
@@ -67,7 +69,7 @@ class V1ResourceRequirements(object):
         Limits describes the maximum amount of compute resources allowed. More info: http://releases.k8s.io/HEAD/docs/design/resources.md#resource-specifications
 
         :param limits: The limits of this V1ResourceRequirements.
-        :type: str
+        :type: dict(str, str)
         """
         self._limits = limits
 
@@ -78,7 +80,7 @@ class V1ResourceRequirements(object):
         Requests describes the minimum amount of compute resources required. If Requests is omitted for a container, it defaults to Limits if that is explicitly specified, otherwise to an implementation-defined value. More info: http://releases.k8s.io/HEAD/docs/design/resources.md#resource-specifications
 
         :return: The requests of this V1ResourceRequirements.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._requests
 
@@ -89,7 +91,7 @@ class V1ResourceRequirements(object):
         Requests describes the minimum amount of compute resources required. If Requests is omitted for a container, it defaults to Limits if that is explicitly specified, otherwise to an implementation-defined value. More info: http://releases.k8s.io/HEAD/docs/design/resources.md#resource-specifications
 
         :param requests: The requests of this V1ResourceRequirements.
-        :type: str
+        :type: dict(str, str)
         """
         self._requests = requests
 
@@ -125,11 +127,14 @@ class V1ResourceRequirements(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,30 +26,32 @@ class V1SELinuxOptions(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'user': 'str',
+        'role': 'str',
+        'type': 'str',
+        'level': 'str'
+    }
+
+    attribute_map = {
+        'user': 'user',
+        'role': 'role',
+        'type': 'type',
+        'level': 'level'
+    }
+
+    __slots__ = ('_user', '_role', '_type', '_level')
+
     def __init__(self):
         """
         V1SELinuxOptions - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'user': 'str',
-            'role': 'str',
-            'type': 'str',
-            'level': 'str'
-        }
-
-        self.attribute_map = {
-            'user': 'user',
-            'role': 'role',
-            'type': 'type',
-            'level': 'level'
-        }
-
+        """
         self._user = None
         self._role = None
         self._type = None
@@ -175,11 +177,14 @@ class V1SELinuxOptions(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
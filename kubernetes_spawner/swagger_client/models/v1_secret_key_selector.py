@@ -26,26 +26,28 @@ class V1SecretKeySelector(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'key': 'str'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'key': 'key'
+    }
+
+    __slots__ = ('_name', '_key')
+
     def __init__(self):
         """
         V1SecretKeySelector - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'name': 'str',
-            'key': 'str'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'key': 'key'
-        }
-
         self._name = None
         self._key = None
 
@@ -125,11 +127,14 @@ class V1SecretKeySelector(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
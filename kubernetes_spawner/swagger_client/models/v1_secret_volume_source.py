@@ -26,24 +26,26 @@ class V1SecretVolumeSource(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'secret_name': 'str'
+    }
+
+    attribute_map = {
+        'secret_name': 'secretName'
+    }
+
+    __slots__ = ('_secret_name',)
+
     def __init__(self):
         """
         V1SecretVolumeSource - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'secret_name': 'str'
-        }
-
-        self.attribute_map = {
-            'secret_name': 'secretName'
-        }
-
         self._secret_name = None
 
     @property
@@ -100,11 +102,14 @@ class V1SecretVolumeSource(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
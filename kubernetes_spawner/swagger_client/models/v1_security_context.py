@@ -26,32 +26,34 @@ class V1SecurityContext(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'capabilities': 'V1Capabilities',
+        'privileged': 'bool',
+        'se_linux_options': 'V1SELinuxOptions',
+        'run_as_user': 'int',
+        'run_as_non_root': 'bool'
+    }
+
+    attribute_map = {
+        'capabilities': 'capabilities',
+        'privileged': 'privileged',
+        'se_linux_options': 'seLinuxOptions',
+        'run_as_user': 'runAsUser',
+        'run_as_non_root': 'runAsNonRoot'
+    }
+
+    __slots__ = ('_capabilities', '_privileged', '_se_linux_options', '_run_as_user', '_run_as_non_root')
+
     def __init__(self):
         """
         V1SecurityContext - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'capabilities': 'V1Capabilities',
-            'privileged': 'bool',
-            'se_linux_options': 'V1SELinuxOptions',
-            'run_as_user': 'int',
-            'run_as_non_root': 'bool'
-        }
-
-        self.attribute_map = {
-            'capabilities': 'capabilities',
-            'privileged': 'privileged',
-            'se_linux_options': 'seLinuxOptions',
-            'run_as_user': 'runAsUser',
-            'run_as_non_root': 'runAsNonRoot'
-        }
-
+        """
         self._capabilities = None
         self._privileged = None
         self._se_linux_options = None
@@ -200,11 +202,14 @@ class V1SecurityContext(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
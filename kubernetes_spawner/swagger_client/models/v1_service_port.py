@@ -26,32 +26,34 @@ class V1ServicePort(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'protocol': 'str',
+        'port': 'int',
+        'target_port': 'str',
+        'node_port': 'int'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'protocol': 'protocol',
+        'port': 'port',
+        'target_port': 'targetPort',
+        'node_port': 'nodePort'
+    }
+
+    __slots__ = ('_name', '_protocol', '_port', '_target_port', '_node_port')
+
     def __init__(self):
         """
         V1ServicePort - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'protocol': 'str',
-            'port': 'int',
-            'target_port': 'str',
-            'node_port': 'int'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'protocol': 'protocol',
-            'port': 'port',
-            'target_port': 'targetPort',
-            'node_port': 'nodePort'
-        }
-
+        """
         self._name = None
         self._protocol = None
         self._port = None
@@ -200,11 +202,14 @@ class V1ServicePort(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,38 +26,40 @@ class V1ServiceSpec(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'ports': 'list[V1ServicePort]',
+        'selector': 'dict(str, str)',
+        'cluster_ip': 'str',
+        'type': 'str',
+        'external_i_ps': 'list[str]',
+        'deprecated_public_i_ps': 'list[str]',
+        'session_affinity': 'str',
+        'load_balancer_ip': 'str'
+    }
+
+    attribute_map = {
+        'ports': 'ports',
+        'selector': 'selector',
+        'cluster_ip': 'clusterIP',
+        'type': 'type',
+        'external_i_ps': 'externalIPs',
+        'deprecated_public_i_ps': 'deprecatedPublicIPs',
+        'session_affinity': 'sessionAffinity',
+        'load_balancer_ip': 'loadBalancerIP'
+    }
+
+    __slots__ = ('_ports', '_selector', '_cluster_ip', '_type', '_external_i_ps', '_deprecated_public_i_ps', '_session_affinity', '_load_balancer_ip')
+
     def __init__(self):
         """
         V1ServiceSpec - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'ports': 'list[V1ServicePort]',
-            'selector': 'str',
-            'cluster_ip': 'str',
-            'type': 'str',
-            'external_i_ps': 'list[str]',
-            'deprecated_public_i_ps': 'list[str]',
-            'session_affinity': 'str',
-            'load_balancer_ip': 'str'
-        }
-
-        self.attribute_map = {
-            'ports': 'ports',
-            'selector': 'selector',
-            'cluster_ip': 'clusterIP',
-            'type': 'type',
-            'external_i_ps': 'externalIPs',
-            'deprecated_public_i_ps': 'deprecatedPublicIPs',
-            'session_affinity': 'sessionAffinity',
-            'load_balancer_ip': 'loadBalancerIP'
-        }
-
+        """
         self._ports = None
         self._selector = None
         self._cluster_ip = None
@@ -96,7 +98,7 @@ class V1ServiceSpec(object):
         This service will route traffic to pods having labels matching this selector. Label keys and values that must match in order to receive traffic for this service. If empty, all pods are selected, if not specified, endpoints must be manually specified. More info: http://releases.k8s.io/HEAD/docs/user-guide/services.md#overview
 
         :return: The selector of this V1ServiceSpec.
-        :rtype: str
+        :rtype: dict(str, str)
         """
         return self._selector
 
@@ -107,7 +109,7 @@ class V1ServiceSpec(object):
         This service will route traffic to pods having labels matching this selector. Label keys and values that must match in order to receive traffic for this service. If empty, all pods are selected, if not specified, endpoints must be manually specified. More info: http://releases.k8s.io/HEAD/docs/user-guide/services.md#overview
 
         :param selector: The selector of this V1ServiceSpec.
-        :type: str
+        :type: dict(str, str)
         """
         self._selector = selector
 
@@ -275,11 +277,14 @@ class V1ServiceSpec(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
@@ -26,58 +26,60 @@ class V1Volume(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'host_path': 'V1HostPathVolumeSource',
+        'empty_dir': 'V1EmptyDirVolumeSource',
+        'gce_persistent_disk': 'V1GCEPersistentDiskVolumeSource',
+        'aws_elastic_block_store': 'V1AWSElasticBlockStoreVolumeSource',
+        'git_repo': 'V1GitRepoVolumeSource',
+        'secret': 'V1SecretVolumeSource',
+        'nfs': 'V1NFSVolumeSource',
+        'iscsi': 'V1ISCSIVolumeSource',
+        'glusterfs': 'V1GlusterfsVolumeSource',
+        'persistent_volume_claim': 'V1PersistentVolumeClaimVolumeSource',
+        'rbd': 'V1RBDVolumeSource',
+        'flex_volume': 'V1FlexVolumeSource',
+        'cinder': 'V1CinderVolumeSource',
+        'cephfs': 'V1CephFSVolumeSource',
+        'flocker': 'V1FlockerVolumeSource',
+        'downward_api': 'V1DownwardAPIVolumeSource',
+        'fc': 'V1FCVolumeSource'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'host_path': 'hostPath',
+        'empty_dir': 'emptyDir',
+        'gce_persistent_disk': 'gcePersistentDisk',
+        'aws_elastic_block_store': 'awsElasticBlockStore',
+        'git_repo': 'gitRepo',
+        'secret': 'secret',
+        'nfs': 'nfs',
+        'iscsi': 'iscsi',
+        'glusterfs': 'glusterfs',
+        'persistent_volume_claim': 'persistentVolumeClaim',
+        'rbd': 'rbd',
+        'flex_volume': 'flexVolume',
+        'cinder': 'cinder',
+        'cephfs': 'cephfs',
+        'flocker': 'flocker',
+        'downward_api': 'downwardAPI',
+        'fc': 'fc'
+    }
+
+    __slots__ = ('_name', '_host_path', '_empty_dir', '_gce_persistent_disk', '_aws_elastic_block_store', '_git_repo', '_secret', '_nfs', '_iscsi', '_glusterfs', '_persistent_volume_claim', '_rbd', '_flex_volume', '_cinder', '_cephfs', '_flocker', '_downward_api', '_fc')
+
     def __init__(self):
         """
         V1Volume - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
-        """
-        self.swagger_types = {
-            'name': 'str',
-            'host_path': 'V1HostPathVolumeSource',
-            'empty_dir': 'V1EmptyDirVolumeSource',
-            'gce_persistent_disk': 'V1GCEPersistentDiskVolumeSource',
-            'aws_elastic_block_store': 'V1AWSElasticBlockStoreVolumeSource',
-            'git_repo': 'V1GitRepoVolumeSource',
-            'secret': 'V1SecretVolumeSource',
-            'nfs': 'V1NFSVolumeSource',
-            'iscsi': 'V1ISCSIVolumeSource',
-            'glusterfs': 'V1GlusterfsVolumeSource',
-            'persistent_volume_claim': 'V1PersistentVolumeClaimVolumeSource',
-            'rbd': 'V1RBDVolumeSource',
-            'flex_volume': 'V1FlexVolumeSource',
-            'cinder': 'V1CinderVolumeSource',
-            'cephfs': 'V1CephFSVolumeSource',
-            'flocker': 'V1FlockerVolumeSource',
-            'downward_api': 'V1DownwardAPIVolumeSource',
-            'fc': 'V1FCVolumeSource'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'host_path': 'hostPath',
-            'empty_dir': 'emptyDir',
-            'gce_persistent_disk': 'gcePersistentDisk',
-            'aws_elastic_block_store': 'awsElasticBlockStore',
-            'git_repo': 'gitRepo',
-            'secret': 'secret',
-            'nfs': 'nfs',
-            'iscsi': 'iscsi',
-            'glusterfs': 'glusterfs',
-            'persistent_volume_claim': 'persistentVolumeClaim',
-            'rbd': 'rbd',
-            'flex_volume': 'flexVolume',
-            'cinder': 'cinder',
-            'cephfs': 'cephfs',
-            'flocker': 'flocker',
-            'downward_api': 'downwardAPI',
-            'fc': 'fc'
-        }
-
+        """
         self._name = None
         self._host_path = None
         self._empty_dir = None
@@ -525,11 +527,14 @@ class V1Volume(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
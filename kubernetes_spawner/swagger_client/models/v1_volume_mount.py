@@ -26,28 +26,30 @@ class V1VolumeMount(object):
     """
     NOTE: This class is auto generated by the swagger code generator program.
     Do not edit the class manually.
+
+    :param dict swagger_types: The key is attribute name
+                               and the value is attribute type.
+    :param dict attribute_map: The key is attribute name
+                               and the value is json key in definition.
     """
+    swagger_types = {
+        'name': 'str',
+        'read_only': 'bool',
+        'mount_path': 'str'
+    }
+
+    attribute_map = {
+        'name': 'name',
+        'read_only': 'readOnly',
+        'mount_path': 'mountPath'
+    }
+
+    __slots__ = ('_name', '_read_only', '_mount_path')
+
     def __init__(self):
         """
         V1VolumeMount - a model defined in Swagger
-
-        :param dict swaggerTypes: The key is attribute name
-                                  and the value is attribute type.
-        :param dict attributeMap: The key is attribute name
-                                  and the value is json key in definition.
         """
-        self.swagger_types = {
-            'name': 'str',
-            'read_only': 'bool',
-            'mount_path': 'str'
-        }
-
-        self.attribute_map = {
-            'name': 'name',
-            'read_only': 'readOnly',
-            'mount_path': 'mountPath'
-        }
-
         self._name = None
         self._read_only = None
         self._mount_path = None
@@ -150,11 +152,14 @@ class V1VolumeMount(object):
         """
         return self.to_str()
 
-    def __eq__(self, other): 
+    def __eq__(self, other):
         """
         Returns true if both objects are equal
         """
-        return self.__dict__ == other.__dict__
+        if type(self) != type(other):
+            return False
+        return all(getattr(self, slot) == getattr(other, slot)
+                   for slot in self.__slots__)
 
     def __ne__(self, other):
         """ 
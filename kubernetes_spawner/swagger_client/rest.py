@@ -22,6 +22,8 @@ from __future__ import absolute_import
 
 import sys
 import io
+import time
+import re
 import json
 import ssl
 import certifi
@@ -47,6 +49,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# seconds a watch can stay silent after its `timeoutSeconds` before its connection is considered dropped
+STREAM_READ_MARGIN = 30
+
 
 class RESTResponse(io.IOBase):
 
@@ -71,7 +76,29 @@ class RESTResponse(io.IOBase):
 
 class RESTClientObject(object):
 
-    def __init__(self, pools_size=4):
+    def __init__(self, pools_size=4, maxsize=1, block=False,
+                 connect_timeout=None, read_timeout=None, observer=None,
+                 retry=None, breaker=None):
+        """
+        :param pools_size: number of connection pools (one per host) kept.
+        :param maxsize: number of connections kept alive and reused per host.
+        :param block: when all `maxsize` connections of a host are in use,
+                      wait for one to be released instead of opening
+                      a new connection that is discarded after the request.
+        :param connect_timeout: seconds to wait for a connection, None to wait forever.
+        :param read_timeout: seconds to wait for data, None to wait forever.
+                             Not applied to streamed (`preload_content=False`)
+                             responses, watches can be silent for minutes.
+        :param observer: called with `(method, status, seconds)` after each
+                         request, status is 0 when there was no response.
+        :param retry: policy deciding if a failed request is sent again,
+                      `retry.delay(method, attempt, error)` gives the seconds
+                      to wait before the `attempt`th retry or None to give up.
+                      urllib3 doesn't retry by itself when it is set.
+        :param breaker: circuit breaker, `breaker.allow()` is called before
+                        each request (and raises to fail it fast) and
+                        `breaker.record(error)` after it, error is None on success.
+        """
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/connectionpool.py#L680
@@ -97,17 +124,96 @@ class RESTClientObject(object):
         # key file
         key_file = Configuration().key_file
 
+        self.observer = observer
+        self.retry = retry
+        self.breaker = breaker
+        self.timeout = urllib3.Timeout(connect=connect_timeout, read=read_timeout)
+        # watches without `timeoutSeconds`, see `stream_timeout_for`
+        self.stream_timeout = urllib3.Timeout(connect=connect_timeout, read=None)
+
         # https pool manager
         self.pool_manager = urllib3.PoolManager(
             num_pools=pools_size,
+            maxsize=maxsize,
+            block=block,
+            timeout=self.timeout,
             cert_reqs=cert_reqs,
             ca_certs=ca_certs,
             cert_file=cert_file,
-            key_file=key_file
+            key_file=key_file,
+            retries=False if retry is not None else urllib3.Retry.DEFAULT
         )
 
+    def stream_timeout_for(self, query_params):
+        """
+        Timeout of a streamed (watch) request.
+
+        The apiserver ends a watch after its `timeoutSeconds`, a connection
+        silent for `STREAM_READ_MARGIN` seconds more was dropped on the way
+        (e.g. by a NAT or load balancer idle timeout) and the read fails
+        instead of blocking the watching thread forever.
+        """
+        seconds = dict(query_params or {}).get('timeoutSeconds')
+        if seconds is None:
+            return self.stream_timeout
+        return urllib3.Timeout(connect=self.stream_timeout.connect_timeout,
+                               read=float(seconds) + STREAM_READ_MARGIN)
+
+    def pool_stats(self):
+        """
+        Connection reuse counters of the pools currently kept.
+
+        `hits` are requests sent on a kept alive connection, `misses` are
+        the connections opened (a new TLS handshake each). Counters of the
+        pools dropped by the pool manager (more than `pools_size` hosts)
+        are lost.
+        """
+        requests = connections = 0
+        pools = self.pool_manager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests += pool.num_requests
+            connections += pool.num_connections
+        return {
+            'pools': len(pools),
+            'requests': requests,
+            'hits': requests - connections,
+            'misses': connections,
+        }
+
     def request(self, method, url, query_params=None, headers=None,
-                body=None, post_params=None):
+                body=None, post_params=None, preload_content=True):
+        """
+        Send a request, and again while `retry` allows it.
+
+        Errors without a response (connection refused, timeouts, ...) are
+        raised as `ApiException` with status 0.
+        """
+        attempt = 0
+        while True:
+            if self.breaker is not None:
+                self.breaker.allow()
+            try:
+                r = self._request(method, url, query_params, dict(headers or {}),
+                                  body, post_params, preload_content)
+            except ApiException as e:
+                if self.breaker is not None:
+                    self.breaker.record(e)
+                attempt += 1
+                delay = self.retry.delay(method.upper(), attempt, e) if self.retry is not None else None
+                if delay is None:
+                    raise
+                logger.debug("Retrying %s %s in %.2fs after %s %s", method, url, delay, e.status, e.reason)
+                time.sleep(delay)
+                continue
+            if self.breaker is not None:
+                self.breaker.record(None)
+            return r
+
+    def _request(self, method, url, query_params=None, headers=None,
+                 body=None, post_params=None, preload_content=True):
         """
         :param method: http request method
         :param url: http request url
@@ -117,6 +223,9 @@ class RESTClientObject(object):
         :param post_params: request post parameters,
                             `application/x-www-form-urlencode`
                             and `multipart/form-data`
+        :param preload_content: if False, the urllib3.HTTPResponse object
+                                is returned without reading/decoding
+                                the response data, to be streamed by the caller.
         """
         method = method.upper()
         assert method in ['GET', 'HEAD', 'DELETE', 'POST', 'PUT', 'PATCH', 'OPTIONS']
@@ -129,17 +238,22 @@ class RESTClientObject(object):
         post_params = post_params or {}
         headers = headers or {}
 
-        if 'Content-Type' not in headers:
+        if headers.get('Content-Type', '*/*') == '*/*':
             headers['Content-Type'] = 'application/json'
 
+        start = time.time()
         try:
-            # For `POST`, `PUT`, `PATCH`, `OPTIONS`
-            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS']:
+            # For `POST`, `PUT`, `PATCH`, `OPTIONS` and `DELETE` with a body (DeleteOptions)
+            if method in ['POST', 'PUT', 'PATCH', 'OPTIONS'] or \
+                    (method == 'DELETE' and body is not None):
                 if query_params:
                     url += '?' + urlencode(query_params)
-                if headers['Content-Type'] == 'application/json':
+                # application/json and the json patch types
+                if re.search('json', headers['Content-Type'], re.IGNORECASE):
+                    if not isinstance(body, bytes):
+                        body = json.dumps(body)
                     r = self.pool_manager.request(method, url,
-                                                  body=json.dumps(body),
+                                                  body=body,
                                                   headers=headers)
                 if headers['Content-Type'] == 'application/x-www-form-urlencoded':
                     r = self.pool_manager.request(method, url,
@@ -158,10 +272,28 @@ class RESTClientObject(object):
             else:
                 r = self.pool_manager.request(method, url,
                                               fields=query_params,
-                                              headers=headers)
+                                              headers=headers,
+                                              preload_content=preload_content,
+                                              timeout=self.timeout if preload_content
+                                              else self.stream_timeout_for(query_params))
         except urllib3.exceptions.SSLError as e:
+            self._observe(method, 0, start)
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
+        except urllib3.exceptions.HTTPError as e:
+            self._observe(method, 0, start)
+            msg = "{0}\n{1}".format(type(e).__name__, str(e))
+            raise ApiException(status=0, reason=msg)
+        self._observe(method, r.status, start)
+
+        if not preload_content:
+            if r.status not in range(200, 206):
+                # read the error body so it can be reported
+                r = RESTResponse(r)
+                if sys.version_info > (3,):
+                    r.data = r.data.decode('utf8')
+                raise ApiException(http_resp=r)
+            return r
 
         r = RESTResponse(r)
 
@@ -178,15 +310,21 @@ class RESTClientObject(object):
 
         return r
 
-    def GET(self, url, headers=None, query_params=None):
+    def _observe(self, method, status, start):
+        if self.observer is not None:
+            self.observer(method, status, time.time() - start)
+
+    def GET(self, url, headers=None, query_params=None, preload_content=True):
         return self.request("GET", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            preload_content=preload_content)
 
-    def HEAD(self, url, headers=None, query_params=None):
+    def HEAD(self, url, headers=None, query_params=None, preload_content=True):
         return self.request("HEAD", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            preload_content=preload_content)
 
     def OPTIONS(self, url, headers=None, query_params=None, post_params=None, body=None):
         return self.request("OPTIONS", url,
@@ -195,10 +333,12 @@ class RESTClientObject(object):
                             post_params=post_params,
                             body=body)
 
-    def DELETE(self, url, headers=None, query_params=None):
+    def DELETE(self, url, headers=None, query_params=None, body=None, preload_content=True):
         return self.request("DELETE", url,
                             headers=headers,
-                            query_params=query_params)
+                            query_params=query_params,
+                            body=body,
+                            preload_content=preload_content)
 
     def POST(self, url, headers=None, query_params=None, post_params=None, body=None):
         return self.request("POST", url,
@@ -222,6 +362,10 @@ class RESTClientObject(object):
                             body=body)
 
 
+# no response, throttled or apiserver side errors, worth trying again later
+TRANSIENT_STATUSES = (0, 429, 500, 502, 503, 504)
+
+
 class ApiException(Exception):
 
     def __init__(self, status=None, reason=None, http_resp=None):
@@ -236,6 +380,26 @@ class ApiException(Exception):
             self.body = None
             self.headers = None
 
+    @property
+    def not_found(self):
+        return self.status == 404
+
+    @property
+    def transient(self):
+        return self.status in TRANSIENT_STATUSES
+
+    def retry_after(self):
+        """
+        Seconds of the `Retry-After` header of the response, None without it.
+        """
+        if not self.headers:
+            return None
+        try:
+            return max(0.0, float(self.headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            # missing, or an HTTP date
+            return None
+
     def __str__(self):
         """
         Custom error messages for exception
@@ -0,0 +1,24 @@
+from types import SimpleNamespace
+
+import pytest
+
+from kubernetes_spawner import KubernetesSpawner
+
+
+class OfflineSpawner(KubernetesSpawner):
+    """`KubernetesSpawner` with the shared watchers off, no apiserver is contacted"""
+
+
+@pytest.fixture
+def make_spawner():
+    def make_spawner(name="alice", **config):
+        config.setdefault("host", "http://127.0.0.1:1")
+        config.setdefault("username", "admin")
+        config.setdefault("password", "secret")
+        for trait in ("pod_informer", "spawn_events", "image_locality"):
+            config.setdefault(trait, False)
+        server = SimpleNamespace(ip="", port=0, base_url="/user/{}/".format(name))
+        user = SimpleNamespace(name=name, server=server, url=server.base_url)
+        hub = SimpleNamespace(server=SimpleNamespace(base_url="/hub/"), api_url="http://127.0.0.1:8081/hub/api")
+        return OfflineSpawner(user=user, hub=hub, **config)
+    return make_spawner
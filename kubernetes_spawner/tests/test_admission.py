@@ -0,0 +1,109 @@
+import pytest
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from kubernetes_spawner.admission import SpawnAdmission, AdmissionCancelled
+
+
+def run(coroutine):
+    return IOLoop.current().run_sync(coroutine)
+
+
+def observe(admission, count, code=200, seconds=0.01):
+    for _ in range(count):
+        admission.observe("GET", code, seconds)
+
+
+def test_limit_halves_on_throttling():
+    admission = SpawnAdmission(max_limit=20, min_limit=2)
+    observe(admission, 98)
+    observe(admission, 2, code=429)
+    admission.adjust()
+    assert admission.limit == 10
+    observe(admission, 100, code=503)
+    admission.adjust()
+    observe(admission, 100, code=0)
+    admission.adjust()
+    observe(admission, 100, code=429)
+    admission.adjust()
+    assert admission.limit == 2
+
+
+def test_limit_halves_on_slow_api():
+    admission = SpawnAdmission(max_limit=20, target_latency=1.0)
+    observe(admission, 100, seconds=2.0)
+    admission.adjust()
+    assert admission.limit == 10
+
+
+def test_limit_grows_by_one_while_full_and_healthy():
+    admission = SpawnAdmission(max_limit=20)
+    admission.limit = 4
+    admission.inflight = 4
+    observe(admission, 100)
+    admission.adjust()
+    assert admission.limit == 5
+    admission.inflight = 1
+    observe(admission, 100)
+    admission.adjust()
+    assert admission.limit == 5
+
+
+def test_limit_stays_within_bounds():
+    admission = SpawnAdmission(max_limit=3, min_limit=1)
+    admission.inflight = 3
+    observe(admission, 100)
+    admission.adjust()
+    assert admission.limit == 3
+    for _ in range(5):
+        observe(admission, 100, code=500)
+        admission.adjust()
+    assert admission.limit == 1
+
+
+def test_no_samples_keeps_the_limit():
+    admission = SpawnAdmission(max_limit=8)
+    admission.adjust()
+    assert admission.limit == 8
+
+
+def test_queue_is_first_come_first_served():
+    admission = SpawnAdmission(max_limit=2, adaptive=False)
+    order = []
+
+    @gen.coroutine
+    def spawn(key):
+        with (yield admission.acquire(key)):
+            order.append(key)
+            yield gen.sleep(0.01)
+
+    @gen.coroutine
+    def main():
+        spawns = [spawn(key) for key in range(5)]
+        assert admission.inflight == 2
+        assert [admission.position(key) for key in range(5)] == [0, 0, 1, 2, 3]
+        yield spawns
+
+    run(main)
+    assert order == [0, 1, 2, 3, 4]
+    assert admission.inflight == 0
+    assert admission.queued == 0
+
+
+def test_cancel_waiting_acquire():
+    admission = SpawnAdmission(max_limit=1, adaptive=False)
+
+    @gen.coroutine
+    def main():
+        slot = yield admission.acquire("a")
+        waiting = admission.acquire("b")
+        admission.cancel("b")
+        with pytest.raises(AdmissionCancelled):
+            yield waiting
+        assert admission.queued == 0
+        slot.release()
+        slot.release()
+        yield gen.moment
+        assert admission.inflight == 0
+
+    run(main)
@@ -0,0 +1,89 @@
+import pytest
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from kubernetes_spawner.deleter import PodDeleter, selector
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+class FakeClient(object):
+    default_namespace = "default"
+
+    def __init__(self, collection_status=None, pod_statuses=None):
+        self.collection_status = collection_status
+        self.pod_statuses = pod_statuses or {}
+        self.calls = []
+
+    @gen.coroutine
+    def delete_pods(self, label_selector, namespace=None):
+        self.calls.append(("deletecollection", namespace, label_selector))
+        if self.collection_status:
+            raise ApiException(status=self.collection_status)
+
+    @gen.coroutine
+    def delete_pod(self, name, namespace=None, grace_period_seconds=None):
+        self.calls.append(("delete", namespace, name, grace_period_seconds))
+        if name in self.pod_statuses:
+            raise ApiException(status=self.pod_statuses[name])
+
+    @gen.coroutine
+    def wait_for_pods_deleted(self, label_selector, namespace=None, timeout=300):
+        self.calls.append(("wait", namespace, label_selector))
+
+
+def delete_all(deleter, names, **kwargs):
+    @gen.coroutine
+    def main():
+        futures = [deleter.delete(name, **kwargs) for name in names]
+        results = []
+        for future in futures:
+            try:
+                yield future
+                results.append(None)
+            except ApiException as e:
+                results.append(e.status)
+        return results
+    return IOLoop.current().run_sync(main)
+
+
+def test_batches_by_namespace_and_size():
+    client = FakeClient()
+    deleter = PodDeleter(client, window=0, max_batch=2)
+    assert delete_all(deleter, ["a", "b", "c"]) == [None] * 3
+    assert delete_all(deleter, ["d"], namespace="other") == [None]
+    assert client.calls == [
+        ("deletecollection", "default", selector(["a", "b"])),
+        ("delete", "default", "c", None),
+        ("delete", "other", "d", None),
+    ]
+
+
+def test_graceful_deletes_are_sent_one_by_one():
+    client = FakeClient()
+    deleter = PodDeleter(client, window=0)
+    assert delete_all(deleter, ["a", "b"], grace_period=5, wait=True) == [None, None]
+    assert sorted(client.calls) == [("delete", "default", "a", 5), ("delete", "default", "b", 5),
+                                    ("wait", "default", selector(["a", "b"]))]
+
+
+@pytest.mark.parametrize("status", [403, 405])
+def test_refused_collection_falls_back_to_single_deletes(status):
+    client = FakeClient(collection_status=status)
+    deleter = PodDeleter(client, window=0)
+    assert delete_all(deleter, ["a", "b"]) == [None, None]
+    assert delete_all(deleter, ["c", "d"]) == [None, None]
+    assert [call[0] for call in client.calls] == ["deletecollection", "delete", "delete", "delete", "delete"]
+
+
+def test_transient_collection_error_fails_the_batch():
+    client = FakeClient(collection_status=503)
+    deleter = PodDeleter(client, window=0)
+    assert delete_all(deleter, ["a", "b"]) == [503, 503]
+    assert [call[0] for call in client.calls] == ["deletecollection"]
+
+
+def test_single_delete_errors_except_not_found():
+    client = FakeClient(pod_statuses={"a": 404, "b": 403})
+    deleter = PodDeleter(client, window=0)
+    assert delete_all(deleter, ["a", "b"], grace_period=0, wait=True) == [None, 403]
+    assert ("wait", "default", selector(["a"])) in client.calls
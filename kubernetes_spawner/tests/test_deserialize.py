@@ -0,0 +1,113 @@
+import re
+
+import pytest
+
+from kubernetes_spawner.swagger_client import ApiClient, models
+
+POD = {
+    "kind": "Pod",
+    "apiVersion": "v1",
+    "metadata": {
+        "name": "jupyter-alice",
+        "namespace": "default",
+        "uid": "5f2b5d7e-0001-11e6-8a9e-42010af00002",
+        "resourceVersion": "1001",
+        "creationTimestamp": "2016-06-01T09:00:00Z",
+        "labels": {"name": "jupyter-alice", "user": "alice"},
+        "annotations": {},
+        "ownerReferences": None,
+    },
+    "spec": {
+        "volumes": [{"name": "notebooks", "nfs": {"server": "10.0.0.10", "path": "/exports"}}],
+        "containers": [{
+            "name": "jupyter",
+            "image": "jupyterhub/singleuser:0.8",
+            "ports": [{"containerPort": 8888, "protocol": "TCP"}],
+            "env": [
+                {"name": "POD_IP", "valueFrom": {"fieldRef": {"fieldPath": "status.podIP"}}},
+                {"name": "JPY_USER", "value": "alice"},
+            ],
+            "resources": {"limits": {"cpu": "250m", "memory": "1Gi"}},
+            "volumeMounts": [{"name": "notebooks", "readOnly": False, "mountPath": "/mnt"}],
+            "unknownField": "ignored",
+        }],
+        "terminationGracePeriodSeconds": 30,
+        "securityContext": {},
+    },
+    "status": {
+        "phase": "Running",
+        "conditions": [{"type": "Ready", "status": "True", "lastProbeTime": None}],
+        "containerStatuses": [{
+            "name": "jupyter",
+            "state": {"running": {"startedAt": "2016-06-01T09:00:08Z"}},
+            "lastState": {},
+            "ready": True,
+            "restartCount": 0,
+            "image": "jupyterhub/singleuser:0.8",
+            "imageID": "docker://sha256:0123456789abcdef",
+        }],
+    },
+}
+
+
+def reflective_deserialize(data, klass):
+    """`ApiClient.__deserialize` before the decoders were compiled"""
+    if data is None:
+        return None
+    if isinstance(klass, str):
+        if klass.startswith("list["):
+            sub_klass = re.match(r"list\[(.*)\]", klass).group(1)
+            return [reflective_deserialize(sub_data, sub_klass) for sub_data in data]
+        if klass.startswith("dict("):
+            sub_klass = re.match(r"dict\(([^,]*), (.*)\)", klass).group(2)
+            return {key: reflective_deserialize(value, sub_klass) for key, value in data.items()}
+        if klass in ("int", "float", "str", "bool"):
+            return {"int": int, "float": float, "str": str, "bool": bool}[klass](data)
+        if klass in ("date", "datetime", "object"):
+            return data
+        klass = getattr(models, klass)
+    instance = klass()
+    for attr, attr_type in instance.swagger_types.items():
+        key = instance.attribute_map[attr]
+        if isinstance(data, dict) and key in data:
+            setattr(instance, attr, reflective_deserialize(data[key], attr_type))
+    return instance
+
+
+def assert_identical(compiled, reference):
+    assert type(compiled) is type(reference)
+    if isinstance(reference, list):
+        assert len(compiled) == len(reference)
+        for compiled_item, reference_item in zip(compiled, reference):
+            assert_identical(compiled_item, reference_item)
+    elif isinstance(reference, dict):
+        assert compiled.keys() == reference.keys()
+        for key in reference:
+            assert_identical(compiled[key], reference[key])
+    elif hasattr(reference, "swagger_types"):
+        for attr in reference.swagger_types:
+            assert_identical(getattr(compiled, attr), getattr(reference, attr))
+    else:
+        assert compiled == reference
+
+
+@pytest.mark.parametrize("data, klass", [
+    (POD, "V1Pod"),
+    ({"metadata": {"resourceVersion": "7"}, "items": [POD, POD]}, "V1PodList"),
+    ({"metadata": {}, "items": []}, "V1PodList"),
+    ([POD["metadata"], None], "list[V1ObjectMeta]"),
+    ({"a": "1", "b": "2"}, "dict(str, str)"),
+    ("8888", "int"),
+    (None, "V1Pod"),
+])
+def test_compiled_decoders_match_the_reflective_reference(data, klass):
+    assert_identical(ApiClient().deserialize_data(data, klass), reflective_deserialize(data, klass))
+
+
+def test_decoders_are_compiled_once_per_type():
+    client = ApiClient()
+    first = client.deserialize_data(POD, "V1Pod")
+    second = client.deserialize_data(POD, "V1Pod")
+    assert first is not second
+    assert first.to_dict() == second.to_dict()
+    assert "V1Pod" in client._decoders
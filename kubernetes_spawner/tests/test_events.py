@@ -0,0 +1,104 @@
+import time
+
+from tornado.ioloop import IOLoop
+
+from kubernetes_spawner.events import EventWatcher, event_time
+from kubernetes_spawner.swagger_client import ApiClient
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+def event(reason, uid="uid-1", name="jupyter-alice", seconds_ago=0, type="Normal"):
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() - seconds_ago))
+    return ApiClient().deserialize_data({
+        "metadata": {"name": "{}.{}".format(name, reason), "namespace": "default"},
+        "involvedObject": {"kind": "Pod", "namespace": "default", "name": name, "uid": uid},
+        "reason": reason, "message": reason, "type": type,
+        "firstTimestamp": timestamp, "lastTimestamp": timestamp,
+    }, "V1Event")
+
+
+def watcher():
+    watcher = EventWatcher(None, namespace="default")
+    watcher._loop = IOLoop.current()
+    return watcher
+
+
+def test_event_time():
+    pulled = event("Pulled")
+    pulled.first_timestamp = "2016-06-01T09:00:00Z"
+    pulled.last_timestamp = None
+    assert event_time(pulled) == 1464771600
+    pulled.first_timestamp = None
+    assert event_time(pulled) is None
+
+
+def test_untracked_pods_are_ignored():
+    events = watcher()
+    spawn = events.track("default", "jupyter-alice")
+    events._handle(event("Scheduled", name="jupyter-bob"))
+    assert spawn.pending == []
+
+
+def test_events_before_attach_are_kept_for_the_pod_uid():
+    events = watcher()
+    spawn = events.track("default", "jupyter-alice")
+    events._handle(event("Killing", uid="old"))
+    events._handle(event("Scheduled", uid="new"))
+    assert len(spawn.pending) == 2
+    events.attach(spawn, "new")
+    assert spawn.pending == []
+    assert list(spawn.times) == ["Scheduled"]
+    events._handle(event("Pulling", uid="new"))
+    events._handle(event("Started", uid="old"))
+    assert sorted(spawn.times) == ["Pulling", "Scheduled"]
+
+
+def test_new_pod_keeps_events_of_a_skewed_clock():
+    events = watcher()
+    spawn = events.track("default", "jupyter-alice")
+    events.attach(spawn, "uid-1")
+    events._handle(event("Scheduled", seconds_ago=120))
+    assert list(spawn.times) == ["Scheduled"]
+
+
+def test_reused_pod_drops_the_events_of_previous_runs():
+    events = watcher()
+    spawn = events.track("default", "jupyter-alice")
+    events.attach(spawn, "uid-1", reused=True)
+    events._handle(event("Started", seconds_ago=120))
+    events._handle(event("Pulling", seconds_ago=2))
+    events._handle(event("Pulled"))
+    assert sorted(spawn.times) == ["Pulled", "Pulling"]
+
+
+def test_failure_reason_resolves_the_failure():
+    events = watcher()
+    spawn = events.track("default", "jupyter-alice")
+    events.attach(spawn, "uid-1")
+    events._handle(event("Failed", type="Warning"))
+    IOLoop.current().run_sync(lambda: spawn.failure)
+    assert spawn.failure.result() == ("Failed", "Failed")
+    assert spawn.warnings == ["Failed: Failed"]
+    events.untrack(spawn)
+    assert events._tracked == {}
+
+
+def test_failing_watch_warns_once_and_backs_off(caplog):
+    events = watcher()
+    delays = []
+
+    def list_events():
+        raise ApiException(status=403, reason="Forbidden")
+
+    def wait(delay):
+        delays.append(delay)
+        if len(delays) == 5:
+            events._stopping.set()
+
+    events._list = list_events
+    events._stopping.wait = wait
+    with caplog.at_level("DEBUG", logger="kubernetes_spawner.events"):
+        events._run()
+    assert delays == [5, 10, 20, 40, 80]
+    assert [record.levelname for record in caplog.records] == ["WARNING"] + ["DEBUG"] * 4
+    assert caplog.records[0].exc_info is None
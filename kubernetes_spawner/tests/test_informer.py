@@ -0,0 +1,22 @@
+from kubernetes_spawner.informer import PodInformer
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+def test_failing_list_warns_once_and_backs_off(caplog):
+    informer = PodInformer(None, namespace="default")
+    delays = []
+
+    def list_pods():
+        raise ApiException(status=403, reason="Forbidden")
+
+    def wait(delay):
+        delays.append(delay)
+        if len(delays) == 4:
+            informer._stopping.set()
+
+    informer._list = list_pods
+    informer._stopping.wait = wait
+    with caplog.at_level("DEBUG", logger="kubernetes_spawner.informer"):
+        informer._run()
+    assert delays == [5, 10, 20, 40]
+    assert [record.levelname for record in caplog.records] == ["WARNING"] + ["DEBUG"] * 3
@@ -0,0 +1,48 @@
+from kubernetes_spawner.kube import pod_waiting, pod_unschedulable, FATAL_WAITING_REASONS
+from kubernetes_spawner.swagger_client import ApiClient
+
+
+def pod(image="jupyterhub/singleuser:0.8", status_image=None, waiting=None, conditions=None):
+    state = {"waiting": {"reason": waiting, "message": "failed to pull"}} if waiting else {"running": {}}
+    return ApiClient().deserialize_data({
+        "metadata": {"name": "jupyter-alice"},
+        "spec": {"containers": [{"name": "jupyter", "image": image}]},
+        "status": {"phase": "Pending", "conditions": conditions or [], "containerStatuses": [{
+            "name": "jupyter", "image": status_image or image, "imageID": "", "ready": False,
+            "restartCount": 0, "state": state}]},
+    }, "V1Pod")
+
+
+def test_pod_waiting_for_a_failure_reason():
+    assert pod_waiting(pod(waiting="ImagePullBackOff"), FATAL_WAITING_REASONS) == \
+        ("jupyter", "ImagePullBackOff", "failed to pull")
+    assert pod_waiting(pod(waiting="ContainerCreating"), FATAL_WAITING_REASONS) is None
+    assert pod_waiting(pod(), FATAL_WAITING_REASONS) is None
+
+
+def test_pod_waiting_compares_normalized_images():
+    waiting = pod(image="jupyterhub/singleuser:0.8", status_image="docker.io/jupyterhub/singleuser:0.8",
+                  waiting="ImagePullBackOff")
+    assert pod_waiting(waiting, FATAL_WAITING_REASONS) is not None
+
+
+def test_pod_waiting_ignores_the_statuses_of_a_replaced_image():
+    replaced = pod(image="jupyterhub/singleuser:0.9", status_image="jupyterhub/singleuser:0.8",
+                   waiting="ImagePullBackOff")
+    assert pod_waiting(replaced, FATAL_WAITING_REASONS) is None
+
+
+def test_pod_waiting_without_statuses():
+    pending = ApiClient().deserialize_data({"metadata": {"name": "jupyter-alice"}, "status": {"phase": "Pending"}},
+                                           "V1Pod")
+    assert pod_waiting(pending, FATAL_WAITING_REASONS) is None
+    assert pod_unschedulable(pending) is None
+
+
+def test_pod_unschedulable():
+    message = "0/3 nodes are available: 3 Insufficient memory."
+    unschedulable = pod(conditions=[{"type": "PodScheduled", "status": "False", "reason": "Unschedulable",
+                                     "message": message}])
+    assert pod_unschedulable(unschedulable) == message
+    scheduled = pod(conditions=[{"type": "PodScheduled", "status": "True"}])
+    assert pod_unschedulable(scheduled) is None
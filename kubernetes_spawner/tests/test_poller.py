@@ -0,0 +1,56 @@
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from kubernetes_spawner.poller import BatchPoller
+from kubernetes_spawner.swagger_client import ApiClient
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+class FakeClient(object):
+    default_namespace = "default"
+
+    def __init__(self, pods=(), failing=()):
+        self.pods = set(pods)
+        self.failing = set(failing)
+        self.calls = []
+
+    @gen.coroutine
+    def list_pods(self, namespace=None, label_selector=None):
+        self.calls.append((namespace, label_selector))
+        if namespace in self.failing:
+            raise ApiException(status=503)
+        names = label_selector[len("name in ("):-1].split(",")
+        return ApiClient().deserialize_data({"metadata": {}, "items": [
+            {"metadata": {"name": name, "namespace": namespace}}
+            for name in names if (namespace, name) in self.pods]}, "V1PodList")
+
+
+def poll_all(poller, keys):
+    @gen.coroutine
+    def main():
+        futures = [poller.get_pod(name, namespace=namespace) for namespace, name in keys]
+        results = []
+        for future in futures:
+            try:
+                pod = yield future
+                results.append(pod.metadata.name if pod is not None else None)
+            except ApiException as e:
+                results.append(e.status)
+        return results
+    return IOLoop.current().run_sync(main)
+
+
+def test_one_request_per_namespace_and_batch():
+    client = FakeClient(pods=[("default", "a"), ("default", "c"), ("other", "d")])
+    poller = BatchPoller(client, window=0, max_batch=2)
+    keys = [("default", "a"), ("default", "b"), ("default", "c"), ("default", "a"), ("other", "d")]
+    assert poll_all(poller, keys) == ["a", None, "c", "a", "d"]
+    assert sorted(client.calls) == [("default", "name in (a,b)"), ("default", "name in (c)"),
+                                    ("other", "name in (d)")]
+
+
+def test_failed_request_fails_only_its_callers():
+    client = FakeClient(pods=[("default", "a"), ("other", "b")], failing=["other"])
+    poller = BatchPoller(client, window=0)
+    assert poll_all(poller, [("default", "a"), ("other", "b"), ("other", "c"), ("other", "b")]) == \
+        ["a", 503, 503, 503]
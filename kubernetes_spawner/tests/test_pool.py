@@ -0,0 +1,85 @@
+import json
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from kubernetes_spawner.kube import json_pointer
+from kubernetes_spawner.pool import WarmPodPool, POOL_STATE_LABEL, ENV_ANNOTATION
+from kubernetes_spawner.swagger_client import ApiClient
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+IMAGE = "jupyterhub/singleuser"
+
+
+def pool_pod(name, state="available", ready=True):
+    return {
+        "metadata": {"name": name, "labels": {"pool": "warm", POOL_STATE_LABEL: state}, "annotations": {}},
+        "spec": {"containers": [{"name": "jupyter", "image": IMAGE}]},
+        "status": {"phase": "Running", "containerStatuses": [
+            {"name": "jupyter", "image": IMAGE, "imageID": "", "ready": ready, "restartCount": 0}]},
+    }
+
+
+class FakeClient(object):
+    default_namespace = "default"
+
+    def __init__(self, pods):
+        self.pods = {pod["metadata"]["name"]: pod for pod in pods}
+        self.deleted = []
+
+    @gen.coroutine
+    def patch_pod(self, name, patch, namespace=None):
+        pod = self.pods[name]
+        for op in patch:
+            parent, key = op["path"].rsplit("/", 1)
+            target = pod["metadata"][parent.rsplit("/", 1)[1]]
+            if op["op"] == "test" and target.get(key) != op["value"]:
+                raise ApiException(status=422, reason="Unprocessable Entity")
+            if op["op"] in ("add", "replace"):
+                target[key] = op["value"]
+        return ApiClient().deserialize_data(pod, "V1Pod")
+
+    @gen.coroutine
+    def delete_pod(self, name, namespace=None):
+        self.deleted.append(name)
+
+
+def warm_pool(client):
+    pool = WarmPodPool(client, None, "warm", size=3)
+    pool.images.add(IMAGE)
+    pool._callback = object()
+    pool.refill = lambda: None
+    pool._available[IMAGE] = [ApiClient().deserialize_data(pod, "V1Pod") for pod in client.pods.values()]
+    return pool
+
+
+def claim(pool):
+    return IOLoop.current().run_sync(lambda: pool.claim(IMAGE, {"user": "alice"}, {"JPY_USER": "alice"}))
+
+
+def test_claim_patch_is_guarded_by_the_pool_state():
+    patch = warm_pool(FakeClient([]))._claim_patch({"user": "alice"}, {"JPY_USER": "alice"})
+    state = json_pointer("metadata", "labels", POOL_STATE_LABEL)
+    assert patch[:2] == [{"op": "test", "path": state, "value": "available"},
+                         {"op": "replace", "path": state, "value": "claimed"}]
+    assert {"op": "add", "path": json_pointer("metadata", "annotations", ENV_ANNOTATION),
+            "value": json.dumps({"JPY_USER": "alice"})} in patch
+    assert {"op": "add", "path": "/metadata/labels/user", "value": "alice"} in patch
+
+
+def test_claim_skips_pods_claimed_by_someone_else():
+    client = FakeClient([pool_pod("warm-1", state="claimed"), pool_pod("warm-2")])
+    pool = warm_pool(client)
+    pod = claim(pool)
+    assert pod.metadata.name == "warm-2"
+    assert pod.metadata.labels == {"pool": "warm", POOL_STATE_LABEL: "claimed", "user": "alice"}
+    assert json.loads(pod.metadata.annotations[ENV_ANNOTATION]) == {"JPY_USER": "alice"}
+    assert client.pods["warm-1"]["metadata"]["labels"] == {"pool": "warm", POOL_STATE_LABEL: "claimed"}
+    assert claim(pool) is None
+
+
+def test_claim_deletes_pods_no_longer_ready():
+    client = FakeClient([pool_pod("warm-1", ready=False), pool_pod("warm-2")])
+    pool = warm_pool(client)
+    assert claim(pool).metadata.name == "warm-2"
+    assert client.deleted == ["warm-1"]
@@ -0,0 +1,101 @@
+import copy
+
+from kubernetes_spawner.reconcile import (plan, annotate, manifest_hashes, PodReconciler,
+                                          CREATE, REUSE, PATCH, REPLACE, RECREATE)
+from kubernetes_spawner.kube import pod_is_ready
+from kubernetes_spawner.swagger_client import ApiClient
+
+
+def manifest(image="jupyterhub/singleuser:0.8", labels=None, cpu_limit="1", token="abc"):
+    return annotate({
+        "metadata": {"name": "jupyter-alice", "labels": dict(labels or {"user": "alice"})},
+        "spec": {"containers": [{
+            "name": "jupyter",
+            "image": image,
+            "env": [{"name": "JPY_USER", "value": "alice"}, {"name": "JPY_API_TOKEN", "value": token}],
+            "resources": {"limits": {"cpu": cpu_limit}},
+        }]},
+    })
+
+
+def live_pod(desired, phase="Running", deletion_timestamp=None, annotations=None):
+    pod = copy.deepcopy(desired)
+    pod["metadata"]["resourceVersion"] = "7"
+    if annotations is not None:
+        pod["metadata"]["annotations"] = annotations
+    if deletion_timestamp:
+        pod["metadata"]["deletionTimestamp"] = deletion_timestamp
+    pod["status"] = {"phase": phase}
+    return ApiClient().deserialize_data(pod, "V1Pod")
+
+
+def test_hashes_ignore_the_api_token():
+    assert manifest_hashes(manifest(token="a")) == manifest_hashes(manifest(token="b"))
+
+
+def test_spec_hash_ignores_the_image():
+    pod_hash, spec_hash = manifest_hashes(manifest(image="a:1"))
+    other_hash, other_spec_hash = manifest_hashes(manifest(image="a:2"))
+    assert pod_hash != other_hash
+    assert spec_hash == other_spec_hash
+
+
+def test_plan_create_without_pod():
+    assert plan(None, manifest()) == CREATE
+
+
+def test_plan_reuse_same_manifest():
+    desired = manifest()
+    assert plan(live_pod(desired), manifest(token="new")) == REUSE
+
+
+def test_plan_patch_labels():
+    live = live_pod(manifest())
+    assert plan(live, manifest(labels={"user": "alice", "team": "a"})) == PATCH
+
+
+def test_plan_replace_image():
+    live = live_pod(manifest(image="a:1"))
+    assert plan(live, manifest(image="a:2")) == REPLACE
+
+
+def test_plan_recreate_spec_change():
+    live = live_pod(manifest(cpu_limit="1"))
+    assert plan(live, manifest(cpu_limit="2")) == RECREATE
+
+
+def test_plan_recreate_terminal_pod():
+    desired = manifest()
+    assert plan(live_pod(desired, phase="Failed"), desired) == RECREATE
+    assert plan(live_pod(desired, phase="Succeeded"), desired) == RECREATE
+
+
+def test_plan_recreate_pod_being_deleted():
+    desired = manifest()
+    assert plan(live_pod(desired, deletion_timestamp="2016-06-01T09:00:00Z"), desired) == RECREATE
+
+
+def test_plan_adopts_pod_without_hashes():
+    desired = manifest()
+    assert plan(live_pod(desired, annotations={}), desired) == PATCH
+    assert plan(live_pod(manifest(image="a:1"), annotations={}), manifest(image="a:2")) == REPLACE
+
+
+def test_patch_sets_labels_and_annotations():
+    live = live_pod(manifest())
+    desired = manifest(labels={"user": "alice", "team": "a"})
+    operations = PodReconciler.patch(live, desired)
+    assert {"op": "add", "path": "/metadata/labels/team", "value": "a"} in operations
+    assert {"op": "add", "path": "/metadata/annotations/pod-hash",
+            "value": desired["metadata"]["annotations"]["pod-hash"]} in operations
+    assert not any(op["path"] == "/metadata/labels/user" for op in operations)
+
+
+def test_replaced_pod_is_not_ready_until_it_runs_the_new_image():
+    desired = manifest(image="a:2")
+    pod = copy.deepcopy(desired)
+    pod["status"] = {"phase": "Running", "containerStatuses": [
+        {"name": "jupyter", "image": "docker.io/library/a:1", "imageID": "", "ready": True, "restartCount": 0}]}
+    assert not pod_is_ready(ApiClient().deserialize_data(pod, "V1Pod"))
+    pod["status"]["containerStatuses"][0]["image"] = "docker.io/library/a:2"
+    assert pod_is_ready(ApiClient().deserialize_data(pod, "V1Pod"))
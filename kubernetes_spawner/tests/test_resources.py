@@ -0,0 +1,42 @@
+import pytest
+
+from kubernetes_spawner.resources import parse_quantity, validate_profile, requirements
+
+
+@pytest.mark.parametrize("quantity, value", [
+    ("1", 1),
+    ("0.5", 0.5),
+    (".5", 0.5),
+    ("250m", 0.25),
+    ("1k", 1e3),
+    ("2M", 2e6),
+    ("1G", 1e9),
+    ("1Ki", 1024),
+    ("512Mi", 512 * 2 ** 20),
+    ("1.5Gi", 1.5 * 2 ** 30),
+    (2, 2),
+])
+def test_parse_quantity(quantity, value):
+    assert parse_quantity(quantity) == pytest.approx(value)
+
+
+@pytest.mark.parametrize("quantity", ["", "abc", "1GB", "-1", "1 Gi", "Gi", "1e3"])
+def test_parse_invalid_quantity(quantity):
+    with pytest.raises(ValueError):
+        parse_quantity(quantity)
+
+
+def test_validate_profile_request_above_limit():
+    with pytest.raises(ValueError):
+        validate_profile("large", {"memory_request": "2Gi", "memory_limit": "1Gi"})
+    validate_profile("large", {"memory_request": "1Gi", "memory_limit": "1024Mi"})
+
+
+def test_validate_profile_unknown_key():
+    with pytest.raises(ValueError):
+        validate_profile("large", {"gpu_limit": "1"})
+
+
+def test_requirements_leaves_empty_values_unset():
+    assert requirements({"cpu_request": "500m", "cpu_limit": "", "memory_limit": "1Gi"}) == {
+        "requests": {"cpu": "500m"}, "limits": {"memory": "1Gi"}}
@@ -0,0 +1,81 @@
+import pytest
+
+from kubernetes_spawner.retry import RetryPolicy, CircuitBreaker, CircuitOpenError
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("kubernetes_spawner.retry.time.time", lambda: now[0])
+    return now
+
+
+def fail(breaker, times, status=503):
+    for _ in range(times):
+        breaker.allow()
+        breaker.record(ApiException(status=status))
+
+
+def test_breaker_opens_after_threshold(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    fail(breaker, 2)
+    assert breaker.state == CircuitBreaker.CLOSED
+    fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_breaker_ignores_non_transient_errors(clock):
+    breaker = CircuitBreaker(failure_threshold=2)
+    fail(breaker, 1)
+    fail(breaker, 1, status=404)
+    fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_breaker_half_open_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    fail(breaker, 1)
+    clock[0] += 31
+    breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_breaker_closes_after_successful_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    fail(breaker, 1)
+    clock[0] += 31
+    breaker.allow()
+    breaker.record(None)
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+    breaker.allow()
+
+
+def test_breaker_opens_again_after_failed_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=30)
+    fail(breaker, 3)
+    clock[0] += 31
+    fail(breaker, 1)
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+
+def test_retry_only_idempotent_methods():
+    policy = RetryPolicy(max_retries=2, backoff=0.1)
+    assert policy.delay("GET", 1, ApiException(status=503)) is not None
+    assert policy.delay("POST", 1, ApiException(status=503)) is None
+    assert policy.delay("POST", 1, ApiException(status=429)) is not None
+    assert policy.delay("GET", 1, ApiException(status=404)) is None
+    assert policy.delay("GET", 3, ApiException(status=503)) is None
+
+
+def test_retry_backoff_is_capped():
+    policy = RetryPolicy(max_retries=10, backoff=1, max_backoff=5)
+    for attempt in range(1, 11):
+        assert 0 <= policy.delay("GET", attempt, ApiException(status=0)) <= min(5, 2 ** (attempt - 1))
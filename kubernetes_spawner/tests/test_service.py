@@ -0,0 +1,22 @@
+from kubernetes_spawner.service import ServiceIngressCache
+from kubernetes_spawner.swagger_client.rest import ApiException
+
+
+def test_failing_watch_warns_once_and_backs_off(caplog):
+    cache = ServiceIngressCache(None, "jupyterhub", namespace="default", max_retry_delay=30)
+    delays = []
+
+    def watch():
+        raise ApiException(status=403, reason="Forbidden")
+
+    def wait(delay):
+        delays.append(delay)
+        if len(delays) == 5:
+            cache._stopping.set()
+
+    cache._watch = watch
+    cache._stopping.wait = wait
+    with caplog.at_level("DEBUG", logger="kubernetes_spawner.service"):
+        cache._run()
+    assert delays == [5, 10, 20, 30, 30]
+    assert [record.levelname for record in caplog.records] == ["WARNING"] + ["DEBUG"] * 4
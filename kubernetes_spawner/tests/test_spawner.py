@@ -0,0 +1,18 @@
+def test_pod_template_per_trait_values(make_spawner):
+    gpu = make_spawner("alice", node_selector={"pool": "gpu"}, volume_mode="nfs",
+                       nfs_server_ip="10.0.0.2", nfs_server_share="/share")
+    cpu = make_spawner("bob", node_selector={"pool": "cpu"})
+    gpu_pod = gpu.render_pod("jupyter-alice", "jupyterhub/singleuser", {}, "/home/alice")
+    cpu_pod = cpu.render_pod("jupyter-bob", "jupyterhub/singleuser", {}, "/home/bob")
+    assert gpu_pod["spec"]["nodeSelector"] == {"pool": "gpu"}
+    assert cpu_pod["spec"]["nodeSelector"] == {"pool": "cpu"}
+    assert gpu_pod["spec"]["volumes"][0]["nfs"] == {"server": "10.0.0.2", "path": "/share"}
+    assert not any("nfs" in volume for volume in cpu_pod["spec"].get("volumes") or [])
+
+
+def test_pod_template_matches_build_pod(make_spawner):
+    spawner = make_spawner("alice", container_port=8000, tolerations=[{"key": "gpu", "operator": "Exists"}])
+    rendered = spawner.render_pod("jupyter-alice", "jupyterhub/singleuser", {"A": "1"}, "/home/alice")
+    built = spawner.client.client.sanitize_for_serialization(
+        spawner.build_pod("jupyter-alice", "jupyterhub/singleuser", {"A": "1"}, "/home/alice"))
+    assert rendered == built
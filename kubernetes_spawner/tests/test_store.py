@@ -0,0 +1,56 @@
+from kubernetes_spawner.store import PodStore
+from kubernetes_spawner.swagger_client import ApiClient
+
+
+def pod(name, namespace="default", user="alice", node=None, hub="jupyterhub"):
+    return ApiClient().deserialize_data({
+        "metadata": {"name": name, "namespace": namespace,
+                     "labels": {"name": name, "user": user, "hub": hub}},
+        "spec": {"containers": [], "nodeName": node},
+    }, "V1Pod")
+
+
+def names(pods):
+    return sorted(pod.metadata.name for pod in pods)
+
+
+def test_indexes_follow_updates():
+    store = PodStore()
+    store.replace([pod("jupyter-alice"), pod("jupyter-bob", user="bob")])
+    assert names(store.by_index("hub", "jupyterhub")) == ["jupyter-alice", "jupyter-bob"]
+    assert store.by_index("node", "node-1") == []
+
+    store.update(pod("jupyter-alice", node="node-1"))
+    assert names(store.by_index("node", "node-1")) == ["jupyter-alice"]
+    store.update(pod("jupyter-alice", node="node-2"))
+    assert store.by_index("node", "node-1") == []
+    assert names(store.by_index("node", "node-2")) == ["jupyter-alice"]
+    assert sorted(store.index_values("node")) == ["node-2"]
+    assert len(store) == 2
+
+
+def test_delete_removes_the_pod_from_every_index():
+    store = PodStore()
+    store.replace([pod("jupyter-alice", node="node-1"), pod("jupyter-alice", namespace="other")])
+    store.delete("default", "jupyter-alice")
+    assert store.get("default", "jupyter-alice") is None
+    assert store.index_values("node") == []
+    assert store.index_values("namespace") == ["other"]
+    assert names(store.by_index("user", "alice")) == ["jupyter-alice"]
+    store.delete("default", "jupyter-alice")
+    assert len(store) == 1
+
+
+def test_replace_drops_the_previous_pods():
+    store = PodStore()
+    store.replace([pod("jupyter-alice")])
+    store.replace([pod("jupyter-bob", user="bob")])
+    assert store.index_values("user") == ["bob"]
+    assert names(store.list()) == ["jupyter-bob"]
+
+
+def test_custom_index():
+    store = PodStore(indexes={"phase": lambda pod: pod.status.phase if pod.status else None})
+    store.replace([pod("jupyter-alice")])
+    assert store.index_values("phase") == []
+    assert names(store.by_index("user", "alice")) == ["jupyter-alice"]
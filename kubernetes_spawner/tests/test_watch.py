@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from urllib3.exceptions import ReadTimeoutError
+
+from kubernetes_spawner.watch import Watch, iter_lines, watch_model
+from kubernetes_spawner.swagger_client import ApiClient
+
+
+class FakeResponse(object):
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.released = False
+
+    def stream(self, chunk_size, decode_content=True):
+        for chunk in self.chunks:
+            yield chunk
+        if self.error is not None:
+            raise self.error
+
+    def release_conn(self):
+        self.released = True
+
+
+def pod_event(event_type, name, resource_version):
+    return json.dumps({"type": event_type, "object": {
+        "kind": "Pod", "metadata": {"name": name, "resourceVersion": resource_version}}}).encode() + b"\n"
+
+
+def split(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def fake_method(responses, calls):
+    def watch_namespaced_pod_list(**kwargs):
+        calls.append(kwargs)
+        return responses.pop(0)
+    return watch_namespaced_pod_list
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+def test_iter_lines_joins_the_chunks(size):
+    data = b'{"a": 1}\n\n{"b": 2}\n{"c": 3}'
+    assert list(iter_lines(FakeResponse(split(data, size)))) == [b'{"a": 1}', b'{"b": 2}', b'{"c": 3}']
+
+
+def test_iter_lines_limits_the_line_size():
+    with pytest.raises(ValueError):
+        list(iter_lines(FakeResponse([b"x" * 10, b"x" * 10]), max_line_size=15))
+
+
+def test_watch_model():
+    assert watch_model("watch_namespaced_pod_list") == "V1Pod"
+    assert watch_model("watch_event_list") == "V1Event"
+    assert watch_model("watch_namespaced_persistent_volume_claim_list") == "V1PersistentVolumeClaim"
+
+
+def test_watch_decodes_split_events_and_resumes():
+    data = pod_event("ADDED", "a", "10") + pod_event("MODIFIED", "a", "11")
+    response = FakeResponse(split(data, 5))
+    calls = []
+    watch = Watch(ApiClient(), fake_method([response, FakeResponse([])], calls), namespace="default")
+    events = [(event_type, pod.metadata.name) for event_type, pod in watch]
+    assert events == [("ADDED", "a"), ("MODIFIED", "a")]
+    assert watch.resource_version == "11"
+    assert response.released
+    list(watch)
+    assert calls == [{"_preload_content": False, "namespace": "default"},
+                     {"_preload_content": False, "namespace": "default", "resource_version": "11"}]
+
+
+def test_watch_gone_resets_the_resource_version():
+    gone = json.dumps({"type": "ERROR", "object": {"kind": "Status", "code": 410,
+                                                   "message": "too old resource version"}}).encode()
+    watch = Watch(ApiClient(), fake_method([FakeResponse([gone])], []), resource_version="5")
+    events = list(watch)
+    assert [(event_type, obj["code"]) for event_type, obj in events] == [("ERROR", 410)]
+    assert watch.resource_version is None
+
+
+def test_watch_hides_bookmarks():
+    bookmark = pod_event("BOOKMARK", "", "20")
+    watch = Watch(ApiClient(), fake_method([FakeResponse([bookmark])], []))
+    assert list(watch) == []
+    assert watch.resource_version == "20"
+
+
+def test_watch_ends_on_read_timeout():
+    response = FakeResponse([pod_event("ADDED", "a", "10")], error=ReadTimeoutError(None, None, "timed out"))
+    watch = Watch(ApiClient(), fake_method([response], []))
+    assert [pod.metadata.name for _, pod in watch] == ["a"]
+    assert response.released
@@ -0,0 +1,111 @@
+import json
+from collections import namedtuple
+
+from urllib3.exceptions import ReadTimeoutError
+
+WatchEvent = namedtuple("WatchEvent", ["type", "object"])
+
+
+def watch_model(method_name):
+    """Model of the objects streamed by an `ApivApi.watch_*` method,
+    e.g. `V1Pod` for `watch_namespaced_pod_list`"""
+    kind = method_name[len("watch_"):]
+    if kind.endswith("_list"):
+        kind = kind[:-len("_list")]
+    if kind.startswith("namespaced_"):
+        kind = kind[len("namespaced_"):]
+    return "V1" + "".join(part.capitalize() for part in kind.split("_"))
+
+
+class Watch(object):
+    """Incremental decoder of a Kubernetes watch stream.
+
+    Iterating opens the watch (`method` is one of the `ApivApi.watch_*`
+    methods, called with `kwargs` and `_preload_content=False`) and yields
+    a `WatchEvent(type, object)` for every newline delimited event as soon
+    as it is received. `object` is a `klass` model, or the raw `Status` dict
+    of `ERROR` events.
+
+    The `resourceVersion` of the last event is kept in `resource_version`,
+    iterating again resumes the watch from there. `BOOKMARK` events only
+    move `resource_version` unless `bookmarks` is True. A `410 Gone` error
+    resets it to None so the next watch starts from the current state.
+    A read timeout (a dropped connection, see
+    `RESTClientObject.stream_timeout_for`) ends the iteration like the
+    end of the watch, so it is reopened from there.
+
+    Only one event is buffered at a time, an event bigger than
+    `max_event_size` bytes raises a `ValueError`.
+    """
+
+    def __init__(self, api_client, method, klass=None, resource_version=None, bookmarks=False,
+                 chunk_size=8192, max_event_size=16 * 1024 * 1024, **kwargs):
+        self.api_client = api_client
+        self.method = method
+        self.klass = klass or watch_model(method.__name__)
+        self.resource_version = resource_version
+        self.bookmarks = bookmarks
+        self.chunk_size = chunk_size
+        self.max_event_size = max_event_size
+        self.kwargs = kwargs
+        self._stopped = False
+
+    def stop(self):
+        """End the iteration at the next event"""
+        self._stopped = True
+
+    def __iter__(self):
+        self._stopped = False
+        kwargs = dict(self.kwargs)
+        if self.resource_version:
+            kwargs["resource_version"] = self.resource_version
+        response = self.method(_preload_content=False, **kwargs)
+        try:
+            for line in iter_lines(response, self.chunk_size, self.max_event_size):
+                if self._stopped:
+                    return
+                event = self.decode(line)
+                if event is not None:
+                    yield event
+        except ReadTimeoutError:
+            return
+        finally:
+            response.release_conn()
+
+    def decode(self, line):
+        """`WatchEvent` of a line of the stream, None for hidden bookmarks"""
+        event = json.loads(line)
+        event_type = event["type"]
+        obj = event["object"]
+        if event_type == "ERROR":
+            if obj.get("code") == 410:
+                self.resource_version = None
+            return WatchEvent(event_type, obj)
+        resource_version = (obj.get("metadata") or {}).get("resourceVersion")
+        if resource_version:
+            self.resource_version = resource_version
+        if event_type == "BOOKMARK" and not self.bookmarks:
+            return None
+        return WatchEvent(event_type, self.api_client.deserialize_data(obj, self.klass))
+
+
+def iter_lines(response, chunk_size=8192, max_line_size=None):
+    """Yield the non empty lines (bytes) of a streamed urllib3 response"""
+    buf = bytearray()
+    for chunk in response.stream(chunk_size, decode_content=True):
+        # the buffered part has no newline, only search the new chunk
+        search = len(buf)
+        buf += chunk
+        start = 0
+        end = buf.find(b"\n", search)
+        while end >= 0:
+            line = bytes(buf[start:end])
+            if line.strip():
+                yield line
+            start = end + 1
+            end = buf.find(b"\n", start)
+        del buf[:start]
+        if max_line_size and len(buf) > max_line_size:
+            raise ValueError("Watch event bigger than {} bytes".format(max_line_size))
+    if buf.strip():
+        yield bytes(buf)
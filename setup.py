@@ -64,6 +64,10 @@ if 'setuptools' in sys.modules:
             if not req or req.startswith(('-e', '#')):
                 continue
             install_requires.append(req)
+    setup_args['extras_require'] = {
+        # Prometheus metrics, see kubernetes_spawner/metrics.py
+        'metrics': ['prometheus_client'],
+    }
 
 
 def main():